@@ -0,0 +1,291 @@
+"""Benchmark runner for the validation and state hot paths.
+
+Usage:
+    python benchmarks/run.py                         # run and print JSON results
+    python benchmarks/run.py --compare               # fail on regressions vs baseline.json
+    python benchmarks/run.py --update-baseline       # rewrite baseline.json (see below)
+    python benchmarks/run.py --sizes 10000,100000,1000000 --filter state
+
+Timings are per-call wall-clock figures over several repeats; regressions are
+judged on the best repeat (`min_s`), which is the least noisy.
+
+`baseline.json` holds the figures of the revision recorded in its `revision`
+field, so `--compare` fails when a change makes a path slower than it was at
+that revision. Baselines are machine specific: to refresh one, check out the
+revision to compare against on the release machine and run
+`python benchmarks/run.py --update-baseline`, which records every benchmark
+together with the current `git` revision. `--compare` exits 2 when the
+baseline file is missing and warns about benchmarks it has no figures for.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO / "src"))
+
+from specula_agent.cache import configure_validation_cache  # noqa: E402
+from specula_agent.constants import PHASE_DEFAULT_MODE, PHASE_SEQUENCE  # noqa: E402
+from specula_agent.orchestrator import (  # noqa: E402
+    ProjectState,
+    SpeculaOrchestrator,
+    build_payload_template,
+)
+from specula_agent.policy import PhraseMatcher, validate_assistant_text  # noqa: E402
+from specula_agent.schemas import validate_artifact, warm_validator_cache  # noqa: E402
+from specula_agent.state_codec import CODECS, JSON  # noqa: E402
+
+EXAMPLES = REPO / "examples" / "basic-case"
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_SIZES = (10_000, 100_000)
+# Differences below this many seconds per call are treated as timer noise.
+NOISE_FLOOR_S = 5e-6
+
+Case = Tuple[str, Callable[[], Any], int]
+
+ASSISTANT_TEXT = "\n".join(
+    [
+        "MODE: exploration | PHASE: 1",
+        "I generated a first divergence seed to open alternatives.",
+        "The scenario contrasts two regulatory futures and one cultural shift.",
+        "Each option carries a distinct identity cost for the organization.",
+        "Which scenario should we validate first as the exploration anchor?",
+    ]
+)
+
+# 300 prescriptive phrases for the phrase matcher, ten per leading verb.
+MANY_PHRASES = tuple(
+    f"{verb} {kind} {label}"
+    for verb in (
+        "you must", "go with", "pick", "adopt", "commit to", "settle on", "opt for", "lock in", "prioritize", "drop"
+    )
+    for kind in ("scenario", "option", "prototype")
+    for label in "abcdefghij"
+)
+LONG_ASSISTANT_TEXT = "\n".join([ASSISTANT_TEXT] * 40)
+
+
+def _load_example(name: str) -> Dict[str, Any]:
+    with (EXAMPLES / name).open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def generated_artifact(phase: str) -> Dict[str, Any]:
+    """An artifact shaped like `SpeculaOrchestrator.generate_step` output."""
+    return {
+        "meta": {
+            "artifact_id": f"artifact-{uuid4()}",
+            "phase": phase,
+            "mode": PHASE_DEFAULT_MODE[phase],
+            "generated_at": "2026-01-01T00:00:00Z",
+            "validated_by_human": False,
+            "related_artifacts": ["artifact-00000000"],
+            "decision_rationale": f"Draft generated for phase {phase} pending human review.",
+            "evidence_refs": ["session_input:user"],
+            "tradeoffs": ["Speed of synthesis vs depth of validation remains open."],
+            "rejected_alternatives": ["No alternative path selected before human validation."],
+        },
+        "payload": build_payload_template(phase, PHASE_DEFAULT_MODE[phase]),
+    }
+
+
+def synthetic_state(artifact_count: int) -> Dict[str, Any]:
+    """Build a serialized project state with `artifact_count` artifacts."""
+    payload = build_payload_template("3", "prototyping")
+    artifact_index: Dict[str, Any] = {}
+    validation_records: Dict[str, Any] = {}
+    for index in range(artifact_count):
+        artifact_id = f"artifact-{index:08d}"
+        phase = PHASE_SEQUENCE[index % len(PHASE_SEQUENCE)]
+        artifact_index[artifact_id] = {
+            "meta": {
+                "artifact_id": artifact_id,
+                "phase": phase,
+                "mode": PHASE_DEFAULT_MODE[phase],
+                "generated_at": "2026-01-01T00:00:00Z",
+                "validated_by_human": False,
+                "related_artifacts": [],
+            },
+            "payload": payload,
+        }
+        validation_records[artifact_id] = [
+            {
+                "validator_id": f"validator-{index % 7}",
+                "validator_role": "strategy_lead",
+                "decision": "approve",
+                "validated_by_human": True,
+                "validated_at": "2026-01-02T00:00:00Z",
+            }
+        ]
+    validated = {phase: f"artifact-{i:08d}" for i, phase in enumerate(PHASE_SEQUENCE[:min(artifact_count, 8)])}
+    return {
+        "project_id": "project-benchmark",
+        "current_phase": "4",
+        "latest_artifacts": dict(validated),
+        "phase_validated_artifacts": dict(validated),
+        "artifact_index": artifact_index,
+        "validation_records": validation_records,
+        "continuity_context": {"decision_log": ["Phase 0 validated."], "radical_values": ["care"]},
+    }
+
+
+def iter_cases(sizes: Tuple[int, ...]) -> Iterator[Case]:
+    """Yield `(name, callable, inner_iterations)` for every benchmark."""
+    warm_validator_cache()
+    for example in sorted(EXAMPLES.glob("*.json")):
+        artifact = _load_example(example.name)
+        yield f"validate_artifact[{example.stem}]", (lambda a=artifact: validate_artifact(a)), 200
+
+    yield "validate_assistant_text", (lambda: validate_assistant_text(ASSISTANT_TEXT)), 2000
+    matcher = PhraseMatcher(MANY_PHRASES)
+    yield f"PhraseMatcher.find[{len(MANY_PHRASES)}-phrases]", functools.partial(matcher.find, ASSISTANT_TEXT), 2000
+    yield (
+        f"PhraseMatcher.find[{len(MANY_PHRASES)}-phrases-long-text]",
+        functools.partial(matcher.find, LONG_ASSISTANT_TEXT),
+        100,
+    )
+
+    for phase in PHASE_SEQUENCE:
+        mode = PHASE_DEFAULT_MODE[phase]
+        yield f"build_payload_template[{phase}]", (lambda p=phase, m=mode: build_payload_template(p, m)), 2000
+    yield "build_payload_template[3-refusal_register]", (
+        lambda: build_payload_template("3", "refusal_register")
+    ), 2000
+
+    # Checking a generate_step artifact: full validation vs trusted-template mode.
+    for phase in ("0", "1", "3", "4"):
+        artifact = generated_artifact(phase)
+        for trusted in (False, True):
+            orchestrator = SpeculaOrchestrator(ProjectState(project_id="project-benchmark"), trusted_templates=trusted)
+            check = functools.partial(
+                orchestrator._assert_generated_artifact_valid, artifact, phase=phase, mode=PHASE_DEFAULT_MODE[phase]
+            )
+            check()  # the first call verifies the template in trusted mode
+            yield f"generated_artifact[{'trusted' if trusted else 'full'}-{phase}]", check, 200
+
+    for size in sizes:
+        raw = synthetic_state(size)
+        state = ProjectState.from_dict(raw)
+        orchestrator = SpeculaOrchestrator(state)
+        yield f"state.from_dict[{size}]", (lambda r=raw: ProjectState.from_dict(r)), 1
+        yield f"state.to_dict[{size}]", (lambda s=state: s.to_dict()), 1
+        yield f"state.to_json[{size}]", (lambda s=state: json.dumps(s.to_dict(), indent=2)), 1
+        # JSON encoding is `state.to_json` above.
+        for codec in CODECS.values():
+            encoded = codec.encode(state.to_dict())
+            if codec is not JSON:
+                yield f"state.encode_{codec.name}[{size}]", (lambda c=codec, s=state: c.encode(s.to_dict())), 1
+            yield f"state.decode_{codec.name}[{size}]", (lambda c=codec, e=encoded: c.decode(e)), 1
+        yield f"orchestrator._build_context_bundle[{size}]", orchestrator._build_context_bundle, 100
+
+
+def measure(func: Callable[[], Any], inner: int, repeats: int) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(inner):
+            func()
+        samples.append((time.perf_counter() - started) / inner)
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "repeats": repeats,
+        "inner": inner,
+    }
+
+
+def git_revision() -> Optional[str]:
+    """Return the checked-out commit (with `-dirty` for local changes), or None outside git."""
+    try:
+        described = subprocess.run(
+            ["git", "describe", "--always", "--dirty", "--abbrev=12"],
+            cwd=REPO,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return described.stdout.strip() or None
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Return regression messages for benchmarks slower than baseline by more than `tolerance`."""
+    regressions: List[str] = []
+    for name, current in results["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous is None:
+            print(f"WARNING {name}: no baseline figures, not compared", file=sys.stderr)
+            continue
+        ratio = current["min_s"] / previous["min_s"] if previous["min_s"] else 1.0
+        current["baseline_ratio"] = round(ratio, 3)
+        if ratio > 1.0 + tolerance and current["min_s"] - previous["min_s"] > NOISE_FLOOR_S:
+            regressions.append(
+                f"{name}: {current['min_s']:.6f}s vs baseline {previous['min_s']:.6f}s (x{ratio:.2f})"
+            )
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Specula runtime benchmarks")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--compare", action="store_true", help="Exit 1 when a benchmark regresses")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed slowdown ratio (0.5 = 50%%)")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+    baseline_path = Path(args.baseline)
+    if args.compare and not baseline_path.exists():
+        print(f"ERROR baseline {baseline_path} does not exist; record one with --update-baseline", file=sys.stderr)
+        return 2
+
+    # Measure the validators themselves rather than result-cache lookups.
+    configure_validation_cache(enabled=False)
+    sizes = tuple(int(item) for item in args.sizes.split(",") if item.strip())
+    results: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "revision": git_revision(),
+        "benchmarks": {},
+    }
+    for name, func, inner in iter_cases(sizes):
+        if args.filter and args.filter not in name:
+            continue
+        results["benchmarks"][name] = measure(func, inner, args.repeats)
+        print(f"{name}: {results['benchmarks'][name]['median_s']:.6f}s", file=sys.stderr)
+
+    regressions: List[str] = []
+    if args.compare:
+        with baseline_path.open("r", encoding="utf-8") as handle:
+            regressions = compare(results, json.load(handle), args.tolerance)
+    results["regressions"] = regressions
+
+    encoded = json.dumps(results, indent=2) + "\n"
+    if args.update_baseline:
+        baseline_path.write_text(encoded, encoding="utf-8")
+    if args.output:
+        Path(args.output).write_text(encoded, encoding="utf-8")
+    else:
+        sys.stdout.write(encoded)
+
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,19 @@
 -- SPECULA runtime persistence schema (PostgreSQL)
--- Source: src/specula_agent/storage.py::SCHEMA_SQL
+-- Generated from src/specula_agent/migrations.py by `specula-agent export-sql`; do not edit.
 
+CREATE TABLE IF NOT EXISTS schema_version (
+  version INTEGER PRIMARY KEY,
+  name TEXT NOT NULL,
+  applied_at TIMESTAMP NOT NULL
+);
+
+-- Migration 0001: initial_schema
+DO $migration$
+BEGIN
+  IF EXISTS (SELECT 1 FROM schema_version WHERE version = 1) THEN
+    RETURN;
+  END IF;
+  EXECUTE $sql$
 CREATE TABLE IF NOT EXISTS projects (
   project_id TEXT PRIMARY KEY,
   name TEXT NOT NULL,
@@ -73,3 +86,105 @@ CREATE INDEX IF NOT EXISTS idx_audit_project_created
 
 CREATE INDEX IF NOT EXISTS idx_validations_artifact
   ON validations(artifact_id);
+$sql$;
+  INSERT INTO schema_version (version, name, applied_at)
+  VALUES (1, 'initial_schema', now());
+END
+$migration$;
+
+-- Migration 0002: partition_audit_logs_by_month
+DO $migration$
+BEGIN
+  IF EXISTS (SELECT 1 FROM schema_version WHERE version = 2) THEN
+    RETURN;
+  END IF;
+  EXECUTE $sql$
+ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned;
+ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey;
+ALTER INDEX idx_audit_project_created RENAME TO idx_audit_unpartitioned_project_created;
+
+CREATE TABLE audit_logs (
+  event_id TEXT NOT NULL,
+  project_id TEXT NOT NULL REFERENCES projects(project_id),
+  phase TEXT,
+  mode TEXT,
+  event TEXT NOT NULL,
+  content TEXT NOT NULL,
+  created_at TIMESTAMP NOT NULL,
+  PRIMARY KEY (event_id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE INDEX idx_audit_project_created
+  ON audit_logs(project_id, created_at);
+
+CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT;
+
+CREATE OR REPLACE FUNCTION specula_ensure_audit_partition(month_start DATE)
+RETURNS TEXT
+LANGUAGE plpgsql
+AS $fn$
+DECLARE
+  first_day DATE := date_trunc('month', month_start)::date;
+  next_day DATE := (date_trunc('month', month_start) + interval '1 month')::date;
+  partition_name TEXT := 'audit_logs_p' || to_char(month_start, 'YYYYMM');
+BEGIN
+  IF to_regclass(partition_name) IS NOT NULL THEN
+    RETURN partition_name;
+  END IF;
+  PERFORM pg_advisory_xact_lock(hashtext('specula_audit_partitions'));
+  IF to_regclass(partition_name) IS NOT NULL THEN
+    RETURN partition_name;
+  END IF;
+  -- Rows that fell into the default partition move to the new one.
+  EXECUTE format('CREATE TABLE %I (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition_name);
+  EXECUTE format(
+    'WITH moved AS (DELETE FROM audit_logs_default WHERE created_at >= %L AND created_at < %L RETURNING *) '
+    'INSERT INTO %I SELECT * FROM moved',
+    first_day, next_day, partition_name
+  );
+  EXECUTE format(
+    'ALTER TABLE audit_logs ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+    partition_name, first_day, next_day
+  );
+  RETURN partition_name;
+END;
+$fn$;
+
+SELECT specula_ensure_audit_partition(month::date)
+FROM generate_series(
+  date_trunc('month', coalesce((SELECT min(created_at) FROM audit_logs_unpartitioned), now())),
+  date_trunc('month', now()) + interval '1 month',
+  interval '1 month'
+) AS month;
+
+INSERT INTO audit_logs (event_id, project_id, phase, mode, event, content, created_at)
+SELECT event_id, project_id, phase, mode, event, content, created_at
+FROM audit_logs_unpartitioned;
+
+DROP TABLE audit_logs_unpartitioned;
+$sql$;
+  INSERT INTO schema_version (version, name, applied_at)
+  VALUES (2, 'partition_audit_logs_by_month', now());
+END
+$migration$;
+
+-- Migration 0003: index_artifact_payloads
+DO $migration$
+BEGIN
+  IF EXISTS (SELECT 1 FROM schema_version WHERE version = 3) THEN
+    RETURN;
+  END IF;
+  EXECUTE $sql$
+CREATE INDEX IF NOT EXISTS idx_artifacts_payload_path
+  ON artifacts USING GIN (payload jsonb_path_ops);
+
+CREATE INDEX IF NOT EXISTS idx_artifacts_divergence_level
+  ON artifacts ((payload #>> '{guardian_report,divergence_level}'));
+
+CREATE INDEX IF NOT EXISTS idx_artifacts_generated_id
+  ON artifacts(generated_at, artifact_id);
+$sql$;
+  INSERT INTO schema_version (version, name, applied_at)
+  VALUES (3, 'index_artifact_payloads', now());
+END
+$migration$;
@@ -1,10 +1,22 @@
 """Specula agent runtime package."""
 
 __all__ = [
+    "artifact_archive",
+    "async_storage",
+    "audit",
+    "cache",
     "constants",
+    "hydration",
+    "incremental",
+    "ingest",
     "llm",
+    "metrics",
+    "migrations",
     "orchestrator",
     "policy",
+    "schema_compiler",
     "schemas",
+    "state_codec",
+    "state_store",
     "storage",
 ]
@@ -0,0 +1,179 @@
+"""Read-only, memory-mapped archive of a project's artifacts.
+
+An archive is one file:
+
+- a 32-byte header: `MAGIC`, format version, artifact count, and the offsets
+  of the id and index sections;
+- the artifacts, one compact JSON record each, in the order they were written;
+- the artifact ids, UTF-8, concatenated;
+- the index: one fixed-size `(id offset, id length, record offset, record
+  length)` entry per artifact, sorted by id bytes.
+
+`ArtifactArchive` maps the file and binary-searches the index, so a lookup
+reads O(log n) ids and one record without parsing the rest of the file.
+Archives are written with `write_archive` (usually via
+`specula-agent export-archive`) and never modified in place.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+MAGIC = b"SPAA"
+ARCHIVE_VERSION = 1
+ARCHIVE_SUFFIX = ".spa"
+
+_HEADER = struct.Struct("<4sB3xQQQ")
+_ENTRY = struct.Struct("<QIQI")
+
+
+class ArchiveError(ValueError):
+    """Raised when an artifact archive is missing, truncated or of another format."""
+
+
+def write_archive(path: Path, artifacts: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+    """Write `(artifact_id, artifact)` pairs to a new archive at `path`; return the count.
+
+    Artifacts are encoded one at a time, so a lazily loaded `artifact_index`
+    is never held in memory as a whole. When an id repeats, the last one wins.
+    The file is written to a temporary name and renamed into place.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    records: Dict[bytes, Tuple[int, int]] = {}
+    with tmp_path.open("wb") as handle:
+        handle.write(b"\0" * _HEADER.size)
+        offset = _HEADER.size
+        for artifact_id, artifact in artifacts:
+            encoded = json.dumps(artifact, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            handle.write(encoded)
+            records[str(artifact_id).encode("utf-8")] = (offset, len(encoded))
+            offset += len(encoded)
+
+        ids_offset = offset
+        entries: List[bytes] = []
+        for key in sorted(records):
+            handle.write(key)
+            record_offset, record_length = records[key]
+            entries.append(_ENTRY.pack(offset, len(key), record_offset, record_length))
+            offset += len(key)
+        index_offset = offset
+        handle.write(b"".join(entries))
+
+        handle.seek(0)
+        handle.write(_HEADER.pack(MAGIC, ARCHIVE_VERSION, len(entries), index_offset, ids_offset))
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+def is_archive(path: Path) -> bool:
+    """True when `path` is a file starting with the archive magic bytes."""
+    path = Path(path)
+    if not path.is_file():
+        return False
+    with path.open("rb") as handle:
+        return handle.read(len(MAGIC)) == MAGIC
+
+
+class ArtifactArchive(Mapping[str, Dict[str, Any]]):
+    """Read-only `artifact_id -> artifact` mapping over a memory-mapped archive.
+
+    `raw` returns a zero-copy view of an artifact's JSON bytes; views must be
+    released before `close`. Indexing parses just the requested artifact.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        try:
+            with self.path.open("rb") as handle:
+                self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            raise ArchiveError(f"{self.path}: cannot map archive ({exc})") from exc
+        self._view = memoryview(self._mm)
+        try:
+            self._count, self._index_offset = self._read_header()
+        except ArchiveError:
+            self.close()
+            raise
+
+    def _read_header(self) -> Tuple[int, int]:
+        size = len(self._mm)
+        if size < _HEADER.size:
+            raise ArchiveError(f"{self.path}: not an artifact archive")
+        magic, version, count, index_offset, ids_offset = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ArchiveError(f"{self.path}: not an artifact archive")
+        if version != ARCHIVE_VERSION:
+            raise ArchiveError(f"{self.path}: unsupported archive version {version}")
+        if not _HEADER.size <= ids_offset <= index_offset or index_offset + count * _ENTRY.size != size:
+            raise ArchiveError(f"{self.path}: truncated or corrupt archive")
+        return count, index_offset
+
+    def _entry(self, position: int) -> Tuple[int, int, int, int]:
+        return _ENTRY.unpack_from(self._mm, self._index_offset + position * _ENTRY.size)
+
+    def _key(self, position: int) -> bytes:
+        id_offset, id_length, _, _ = self._entry(position)
+        return self._mm[id_offset : id_offset + id_length]
+
+    def _locate(self, artifact_id: str) -> Optional[Tuple[int, int]]:
+        target = artifact_id.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count:
+            id_offset, id_length, record_offset, record_length = self._entry(low)
+            if self._mm[id_offset : id_offset + id_length] == target:
+                return record_offset, record_length
+        return None
+
+    def raw(self, artifact_id: str) -> Optional[memoryview]:
+        """Zero-copy view of the artifact's JSON bytes, or None when absent."""
+        location = self._locate(artifact_id)
+        if location is None:
+            return None
+        offset, length = location
+        return self._view[offset : offset + length]
+
+    def __getitem__(self, artifact_id: str) -> Dict[str, Any]:
+        location = self._locate(artifact_id) if isinstance(artifact_id, str) else None
+        if location is None:
+            raise KeyError(artifact_id)
+        offset, length = location
+        try:
+            return json.loads(self._mm[offset : offset + length])
+        except ValueError as exc:
+            raise ArchiveError(f"{self.path}: corrupt record for artifact `{artifact_id}`") from exc
+
+    def __contains__(self, artifact_id: object) -> bool:
+        return isinstance(artifact_id, str) and self._locate(artifact_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Artifact ids in sorted (UTF-8 byte) order."""
+        for position in range(self._count):
+            yield self._key(position).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._view.release()
+        self._mm.close()
+
+    def __enter__(self) -> "ArtifactArchive":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,367 @@
+"""Asyncio persistence adapters mirroring `storage.StorageAdapter`.
+
+`AsyncPostgresStorage` runs on psycopg's async API with an
+`AsyncConnectionPool`. Each call checks out its own connection, so independent
+writes issued with `asyncio.gather` run concurrently; `unit_of_work` pins the
+calls made by one task to a single connection and transaction.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+from .migrations import (
+    AUDIT_PARTITIONING_VERSION,
+    CURRENT_VERSION_SQL,
+    ENSURE_AUDIT_PARTITIONS_SQL,
+    LATEST_VERSION,
+    MIGRATION_LOCK_ID,
+    RECORD_VERSION_SQL,
+    SCHEMA_STATUS_SQL,
+    SCHEMA_VERSION_SQL,
+    audit_partition_name,
+    month_start,
+    pending_migrations,
+)
+from .metrics import MetricsHook, caller_block, instrumented, measure, note_acquire, note_rows
+from .orchestrator import ProjectState
+from .storage import (
+    AUDIT_INSERT_CHUNK,
+    DEFAULT_QUERY_LIMIT,
+    INSERT_ARTIFACT_SQL,
+    INSERT_AUDIT_SQL,
+    INSERT_VALIDATION_SQL,
+    SELECT_VALIDATIONS_SQL,
+    UPSERT_PROJECT_SQL,
+    ArtifactPage,
+    PoolSettings,
+    StorageError,
+    _artifact_page,
+    _artifact_query,
+    _artifact_row,
+    _audit_rows,
+    _duplicate_validation,
+    _multi_row_audit_sql,
+    _project_row,
+    _validation_from_row,
+    _validation_row,
+)
+
+
+class AsyncStorageAdapter:
+    """No-op async adapter used when DB persistence is disabled."""
+
+    async def close(self) -> None:
+        return
+
+    async def migrate(self) -> List[int]:
+        return []
+
+    async def init_schema(self) -> None:
+        await self.migrate()
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator["AsyncStorageAdapter"]:
+        yield self
+
+    async def upsert_project_state(self, state: ProjectState) -> None:
+        return
+
+    async def insert_artifact(self, project_id: str, artifact: Dict[str, Any]) -> None:
+        return
+
+    async def insert_validation(
+        self,
+        artifact_id: str,
+        *,
+        validated_by_human: bool,
+        validator_id: str,
+        validator_role: str,
+        decision: str,
+    ) -> None:
+        return
+
+    async def get_validations(self, artifact_id: str) -> List[Dict[str, Any]]:
+        return []
+
+    async def query_artifacts(
+        self,
+        *,
+        project_id: Optional[str] = None,
+        phase: Optional[str] = None,
+        mode: Optional[str] = None,
+        payload: Optional[Dict[str, str]] = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+        after: Optional[str] = None,
+    ) -> ArtifactPage:
+        return ArtifactPage([])
+
+    async def append_audit(
+        self,
+        *,
+        project_id: str,
+        phase: Optional[str],
+        mode: Optional[str],
+        event: str,
+        content: str,
+    ) -> None:
+        return
+
+    async def append_audit_many(self, events: Iterable[Dict[str, Any]]) -> None:
+        for event in events:
+            await self.append_audit(
+                project_id=event["project_id"],
+                phase=event.get("phase"),
+                mode=event.get("mode"),
+                event=event["event"],
+                content=event["content"],
+            )
+
+    async def __aenter__(self) -> "AsyncStorageAdapter":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+@dataclass
+class AsyncPostgresStorage(AsyncStorageAdapter):
+    """PostgreSQL adapter on psycopg's async API with a connection pool.
+
+    The pool opens on first use (or on `async with`); call `close()` when the
+    embedding application shuts down.
+    """
+
+    database_url: str
+    pool: PoolSettings = field(default_factory=PoolSettings)
+    metrics: MetricsHook = field(default_factory=MetricsHook)
+    _pool: Any = field(default=None, init=False, repr=False)
+    _connection_var: ContextVar = field(default=None, init=False, repr=False)
+    _schema_current: bool = field(default=False, init=False, repr=False)
+    _opened: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        try:
+            import psycopg  # type: ignore
+            from psycopg_pool import AsyncConnectionPool  # type: ignore
+        except ImportError as exc:  # pragma: no cover
+            raise StorageError(
+                "psycopg and psycopg_pool are required for async storage. "
+                "Install with `pip install psycopg[binary,pool]`."
+            ) from exc
+        self._psycopg = psycopg
+        self._pool = AsyncConnectionPool(
+            self.database_url,
+            min_size=self.pool.min_size,
+            max_size=self.pool.max_size,
+            max_idle=self.pool.max_idle,
+            timeout=self.pool.timeout,
+            check=AsyncConnectionPool.check_connection if self.pool.check else None,
+            open=False,
+        )
+        self._connection_var = ContextVar(f"specula_async_connection_{id(self)}", default=None)
+
+    @staticmethod
+    def _utc_now() -> datetime:
+        return datetime.now(timezone.utc).replace(microsecond=0)
+
+    async def open(self) -> None:
+        if not self._opened:
+            await self._pool.open()
+            self._opened = True
+
+    async def close(self) -> None:
+        if self._opened:
+            await self._pool.close()
+            self._opened = False
+
+    async def __aenter__(self) -> "AsyncPostgresStorage":
+        await self.open()
+        return self
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[Any]:
+        shared = self._connection_var.get()
+        if shared is not None:
+            yield shared
+            return
+        await self.open()
+        started = time.perf_counter()
+        async with self._pool.connection() as conn:
+            note_acquire(time.perf_counter() - started)
+            yield conn
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator["AsyncPostgresStorage"]:
+        """Run the current task's calls on one connection, transaction and pipeline."""
+        if self._connection_var.get() is not None:
+            yield self
+            return
+        with measure(self.metrics, "unit_of_work") as call:
+            async with self._connection() as conn:
+                async with conn.transaction(), conn.pipeline():
+                    token = self._connection_var.set(conn)
+                    try:
+                        with caller_block(call):
+                            yield self
+                    finally:
+                        self._connection_var.reset(token)
+
+    @instrumented
+    async def current_schema_version(self) -> int:
+        async with self._connection() as conn:
+            try:
+                async with conn.transaction(), conn.cursor() as cur:
+                    await cur.execute(CURRENT_VERSION_SQL)
+                    row = await cur.fetchone()
+            except self._psycopg.errors.UndefinedTable:
+                return 0
+        return int(row[0] or 0)
+
+    async def _schema_status(self) -> Tuple[int, bool]:
+        next_partition = audit_partition_name(month_start(self._utc_now().date(), 1))
+        async with self._connection() as conn:
+            try:
+                async with conn.transaction(), conn.cursor() as cur:
+                    await cur.execute(SCHEMA_STATUS_SQL, (next_partition,))
+                    row = await cur.fetchone()
+            except self._psycopg.errors.UndefinedTable:
+                return 0, False
+        return int(row[0] or 0), bool(row[1])
+
+    @instrumented
+    async def migrate(self) -> List[int]:
+        if self._schema_current:
+            return []
+        version, partition_ready = await self._schema_status()
+        applied: List[int] = []
+        if version < LATEST_VERSION:
+            async with self._connection() as conn:
+                async with conn.transaction(), conn.cursor() as cur:
+                    await cur.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+                    await cur.execute(SCHEMA_VERSION_SQL)
+                    await cur.execute(CURRENT_VERSION_SQL)
+                    row = await cur.fetchone()
+                    for migration in pending_migrations(int(row[0] or 0)):
+                        await cur.execute(migration.sql)
+                        await cur.execute(RECORD_VERSION_SQL, (migration.version, migration.name, self._utc_now()))
+                        applied.append(migration.version)
+        if not partition_ready and LATEST_VERSION >= AUDIT_PARTITIONING_VERSION:
+            this_month = month_start(self._utc_now().date())
+            async with self._connection() as conn:
+                await conn.execute(ENSURE_AUDIT_PARTITIONS_SQL, (this_month, month_start(this_month, 1)))
+        self._schema_current = True
+        return applied
+
+    @instrumented
+    async def upsert_project_state(self, state: ProjectState) -> None:
+        async with self._connection() as conn:
+            cur = await conn.execute(UPSERT_PROJECT_SQL, _project_row(state, self._utc_now()))
+            note_rows(cur.rowcount)
+
+    @instrumented
+    async def insert_artifact(self, project_id: str, artifact: Dict[str, Any]) -> None:
+        async with self._connection() as conn:
+            cur = await conn.execute(INSERT_ARTIFACT_SQL, _artifact_row(project_id, artifact))
+            note_rows(cur.rowcount)
+
+    @instrumented
+    async def insert_validation(
+        self,
+        artifact_id: str,
+        *,
+        validated_by_human: bool,
+        validator_id: str,
+        validator_role: str,
+        decision: str,
+    ) -> None:
+        row = _validation_row(
+            artifact_id,
+            validated_by_human=validated_by_human,
+            validator_id=validator_id,
+            validator_role=validator_role,
+            decision=decision,
+            validated_at=self._utc_now(),
+        )
+        async with self._connection() as conn:
+            cur = await conn.execute(INSERT_VALIDATION_SQL, row)
+            if await cur.fetchone() is None:
+                raise _duplicate_validation(artifact_id, validator_id)
+            note_rows(1)
+
+    @instrumented
+    async def get_validations(self, artifact_id: str) -> List[Dict[str, Any]]:
+        async with self._connection() as conn:
+            cur = await conn.execute(SELECT_VALIDATIONS_SQL, (artifact_id,))
+            rows = await cur.fetchall()
+        note_rows(len(rows))
+        return [_validation_from_row(row) for row in rows]
+
+    @instrumented
+    async def query_artifacts(
+        self,
+        *,
+        project_id: Optional[str] = None,
+        phase: Optional[str] = None,
+        mode: Optional[str] = None,
+        payload: Optional[Dict[str, str]] = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+        after: Optional[str] = None,
+    ) -> ArtifactPage:
+        sql, params = _artifact_query(
+            "postgres", project_id=project_id, phase=phase, mode=mode, payload=payload, limit=limit, after=after
+        )
+        async with self._connection() as conn:
+            cur = await conn.execute(sql, params)
+            rows = await cur.fetchall()
+        note_rows(min(len(rows), limit))
+        return _artifact_page(rows, limit)
+
+    @instrumented
+    async def append_audit(
+        self,
+        *,
+        project_id: str,
+        phase: Optional[str],
+        mode: Optional[str],
+        event: str,
+        content: str,
+    ) -> None:
+        async with self._connection() as conn:
+            cur = await conn.execute(
+                INSERT_AUDIT_SQL,
+                (str(uuid4()), project_id, phase, mode, event, content, self._utc_now()),
+            )
+            note_rows(cur.rowcount)
+
+    @instrumented
+    async def append_audit_many(self, events: Iterable[Dict[str, Any]]) -> None:
+        rows = _audit_rows(events, self._utc_now())
+        if not rows:
+            return
+        async with self._connection() as conn:
+            async with conn.cursor() as cur:
+                for start in range(0, len(rows), AUDIT_INSERT_CHUNK):
+                    chunk = rows[start : start + AUDIT_INSERT_CHUNK]
+                    await cur.execute(_multi_row_audit_sql(len(chunk)), [value for row in chunk for value in row])
+                    note_rows(cur.rowcount)
+
+
+def build_async_storage(
+    database_url: str | None,
+    *,
+    pool: Optional[PoolSettings] = None,
+    metrics: Optional[MetricsHook] = None,
+) -> AsyncStorageAdapter:
+    """Factory for async storage adapter; PostgreSQL connections are always pooled."""
+    if not database_url:
+        return AsyncStorageAdapter()
+    return AsyncPostgresStorage(
+        database_url=database_url, pool=pool or PoolSettings(), metrics=metrics or MetricsHook()
+    )
@@ -0,0 +1,244 @@
+"""Write-behind audit logging.
+
+`BufferedAuditSink` accepts `append_audit` calls without a database round trip,
+queues them, and a background thread writes them with
+`StorageAdapter.append_audit_many` once `max_batch` events are waiting or
+`flush_interval` seconds have passed. The queue is bounded: producers block
+(up to `put_timeout`) while `max_queue` events are still unwritten. With
+`spill_path` every accepted event is also appended to a local NDJSON file,
+which is replayed on the next start if the process dies before the events
+were flushed.
+
+The spill file is flushed to the OS on every event but only fsync'd before
+each batch is written to the database. A crash of the process loses nothing;
+a crash of the host (or power loss) can lose the events accepted since the
+last batch, i.e. up to `max_batch` events or `flush_interval` seconds' worth.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from .storage import StorageAdapter, StorageError
+
+DEFAULT_MAX_BATCH = 500
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_QUEUE = 10_000
+
+
+class AuditBackpressureError(StorageError):
+    """Raised when the audit queue stays full for longer than `put_timeout`."""
+
+
+class BufferedAuditSink:
+    """Batching, write-behind front end for a storage adapter's audit log.
+
+    Events get their `event_id` and `created_at` when accepted, so replaying a
+    spill file after a crash is idempotent and keeps the original timestamps.
+    Call `close()` (or rely on the exit/signal hooks) to flush what is left.
+    """
+
+    def __init__(
+        self,
+        storage: StorageAdapter,
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        put_timeout: Optional[float] = None,
+        spill_path: Optional[Path] = None,
+        install_exit_hooks: bool = True,
+    ) -> None:
+        if max_batch < 1 or max_queue < 1:
+            raise ValueError("max_batch and max_queue must be at least 1")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        self.storage = storage
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.flushed = 0
+        self.failures = 0
+        self.last_error: Optional[BaseException] = None
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        # One slot per accepted event until it is written; bounds memory and the spill file.
+        self._slots = threading.BoundedSemaphore(max_queue)
+        # Events taken off the queue whose write has not succeeded yet.
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._spill_handle = None
+        self._unacked = 0
+        self._replayed = 0
+        self._closed = False
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+
+        if self.spill_path is not None:
+            self._pending.extend(self._read_spill(self.spill_path))
+            self._unacked = self._replayed = len(self._pending)
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill_handle = self.spill_path.open("a", encoding="utf-8")
+
+        self._thread = threading.Thread(target=self._run, name="specula-audit-flusher", daemon=True)
+        self._thread.start()
+        if install_exit_hooks:
+            atexit.register(self.close)
+            self._install_signal_handlers()
+
+    @staticmethod
+    def _read_spill(path: Path) -> List[Dict[str, Any]]:
+        if not path.exists():
+            return []
+        events: List[Dict[str, Any]] = []
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    # A torn final line from a crash mid-write; the event was never acknowledged.
+                    continue
+        return events
+
+    def _install_signal_handlers(self) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for signum in (signal.SIGTERM, getattr(signal, "SIGHUP", None)):
+            if signum is None:
+                continue
+            previous = signal.getsignal(signum)
+
+            def _handler(received: int, frame: Any, previous: Any = previous) -> None:
+                # Never flush or take a lock here: the interrupted main thread may
+                # hold one. Exiting with SystemExit unwinds it first, and the
+                # atexit hook then runs `close()` with every lock released.
+                if callable(previous):
+                    previous(received, frame)
+                elif previous == signal.SIG_DFL:
+                    raise SystemExit(128 + received)
+
+            signal.signal(signum, _handler)
+
+    def append_audit(
+        self,
+        *,
+        project_id: str,
+        phase: Optional[str],
+        mode: Optional[str],
+        event: str,
+        content: str,
+    ) -> None:
+        """Queue one audit event; blocks while the queue is full."""
+        if self._closed:
+            raise StorageError("audit sink is closed")
+        record = {
+            "event_id": str(uuid4()),
+            "project_id": project_id,
+            "phase": phase,
+            "mode": mode,
+            "event": event,
+            "content": content,
+            "created_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        }
+        if not self._slots.acquire(timeout=self.put_timeout):
+            raise AuditBackpressureError(
+                f"audit queue full for {self.put_timeout}s; the database is not keeping up"
+            )
+        with self._spill_lock:
+            if self._spill_handle is not None:
+                self._spill_handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+                self._spill_handle.flush()
+            self._unacked += 1
+            self._queue.put_nowait(record)
+        if self._queue.qsize() >= self.max_batch:
+            self._wakeup.set()
+
+    def _drain(self) -> None:
+        while len(self._pending) < self.max_batch:
+            try:
+                self._pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                return
+
+    def flush(self) -> int:
+        """Write every queued event now; returns how many were written."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                self._drain()
+                if not self._pending:
+                    break
+                self._sync_spill()
+                try:
+                    self.storage.append_audit_many(self._pending)
+                except Exception as exc:
+                    # Keep the batch for the next attempt; the spill file still holds it.
+                    self.failures += 1
+                    self.last_error = exc
+                    break
+                self._acknowledge(len(self._pending))
+                written += len(self._pending)
+                self._pending = []
+            self.flushed += written
+        return written
+
+    def _sync_spill(self) -> None:
+        with self._spill_lock:
+            if self._spill_handle is not None:
+                os.fsync(self._spill_handle.fileno())
+
+    def _acknowledge(self, count: int) -> None:
+        replayed = min(count, self._replayed)
+        self._replayed -= replayed
+        for _ in range(count - replayed):
+            self._slots.release()
+        with self._spill_lock:
+            self._unacked -= count
+            if self._spill_handle is not None and self._unacked == 0:
+                # Everything in the spill file is now in the database.
+                self._spill_handle.truncate(0)
+                self._spill_handle.seek(0)
+
+    def _run(self) -> None:
+        deadline = time.monotonic() + self.flush_interval
+        while not self._stop.is_set():
+            self._wakeup.wait(timeout=max(0.0, deadline - time.monotonic()))
+            self._wakeup.clear()
+            if self._queue.qsize() >= self.max_batch or time.monotonic() >= deadline or self._pending:
+                self.flush()
+                deadline = time.monotonic() + self.flush_interval
+
+    def close(self) -> None:
+        """Stop the flusher and write the remaining events."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        self._wakeup.set()
+        self._thread.join(timeout=max(self.flush_interval, 1.0) * 5)
+        self.flush()
+        with self._spill_lock:
+            if self._spill_handle is not None:
+                self._spill_handle.close()
+                self._spill_handle = None
+        if self.spill_path is not None and self.spill_path.exists() and self.spill_path.stat().st_size == 0:
+            self.spill_path.unlink()
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "BufferedAuditSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,162 @@
+"""Content-addressed cache for validation results.
+
+Results are keyed by a canonical SHA-256 of the validated input and grouped in
+namespaces that identify the rules used (schema digest or policy fingerprint),
+so a schema change drops every result computed against the old contract.
+Caching is off unless enabled with `configure_validation_cache` or by setting
+`SPECULA_VALIDATION_CACHE_DIR` (which also turns on the on-disk tier).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+CACHE_DIR_ENV = "SPECULA_VALIDATION_CACHE_DIR"
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def _assert_json_value(value: Any) -> None:
+    # json.dumps would encode tuples as lists and int keys as strings, so inputs
+    # that validate differently could share a hash.
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return
+    if type(value) is list:
+        for item in value:
+            _assert_json_value(item)
+        return
+    if type(value) is dict:
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f"cannot hash non-string key {key!r}")
+            _assert_json_value(item)
+        return
+    raise TypeError(f"cannot hash {type(value).__name__} value")
+
+
+def canonical_hash(value: Any) -> str:
+    """Hash a JSON value independently of key order and whitespace.
+
+    Raises TypeError for anything that is not plain JSON data (dicts with
+    string keys, lists, strings, numbers, booleans, None).
+    """
+    _assert_json_value(value)
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ValidationCache:
+    """Bounded LRU of error lists with an optional on-disk tier."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, disk_dir: Optional[Path] = None) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _disk_path(root: Path, namespace: str, key: str) -> Path:
+        return root / namespace / key[:2] / f"{key}.json"
+
+    def _remember(self, namespace: str, key: str, errors: Tuple[str, ...]) -> None:
+        self._entries[(namespace, key)] = errors
+        self._entries.move_to_end((namespace, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, namespace: str, key: str) -> Optional[List[str]]:
+        with self._lock:
+            errors = self._entries.get((namespace, key))
+            if errors is not None:
+                self._entries.move_to_end((namespace, key))
+                self.hits += 1
+                return list(errors)
+
+        if self.disk_dir is not None:
+            try:
+                with self._disk_path(self.disk_dir, namespace, key).open("r", encoding="utf-8") as handle:
+                    stored = json.load(handle)
+            except (OSError, ValueError):
+                stored = None
+            if isinstance(stored, list) and all(isinstance(item, str) for item in stored):
+                with self._lock:
+                    self.disk_hits += 1
+                    self._remember(namespace, key, tuple(stored))
+                return list(stored)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, namespace: str, key: str, errors: List[str]) -> None:
+        with self._lock:
+            self._remember(namespace, key, tuple(errors))
+        if self.disk_dir is None:
+            return
+        path = self._disk_path(self.disk_dir, namespace, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                json.dump(list(errors), handle)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The disk tier is best effort; the in-memory result is still valid.
+            return
+
+    def drop_namespace(self, namespace: str) -> None:
+        """Forget every result computed under `namespace`, in memory and on disk."""
+        with self._lock:
+            for cache_key in [item for item in self._entries if item[0] == namespace]:
+                del self._entries[cache_key]
+        if self.disk_dir is not None:
+            shutil.rmtree(self.disk_dir / namespace, ignore_errors=True)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+
+_RESULT_CACHE: Optional[ValidationCache] = (
+    ValidationCache(disk_dir=Path(os.environ[CACHE_DIR_ENV])) if os.getenv(CACHE_DIR_ENV) else None
+)
+
+
+def get_validation_cache() -> Optional[ValidationCache]:
+    """Return the process-wide result cache, or None when caching is disabled."""
+    return _RESULT_CACHE
+
+
+def configure_validation_cache(
+    *,
+    enabled: bool = True,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    disk_dir: Optional[Path] = None,
+) -> Optional[ValidationCache]:
+    """Replace the process-wide result cache (or disable it with `enabled=False`)."""
+    global _RESULT_CACHE
+    _RESULT_CACHE = ValidationCache(max_entries=max_entries, disk_dir=disk_dir) if enabled else None
+    return _RESULT_CACHE
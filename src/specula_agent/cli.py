@@ -6,15 +6,38 @@ import argparse
 import json
 import os
 import sys
+import time
+from contextlib import ExitStack
+from datetime import date
 from pathlib import Path
-from typing import Any, Dict
-from uuid import uuid4
+from typing import Any, Dict, Optional
 
+from .artifact_archive import ArtifactArchive, write_archive
+from .ingest import DEFAULT_BATCH_SIZE, ImportStats, run_import
 from .llm import LLMClient
+from .metrics import InMemoryMetrics
+from .migrations import month_start, render_sql
 from .orchestrator import ProjectState, SpeculaOrchestrator
 from .policy import validate_assistant_text
-from .schemas import validate_artifact
-from .storage import StorageError, build_storage
+from .schema_compiler import compile_all
+from .state_codec import CODECS, get_codec
+from .state_store import StateStore, open_state_store
+from .schemas import (
+    _schema_dir,
+    iter_artifact_paths,
+    validate_artifact,
+    validate_many,
+    validate_ndjson,
+)
+from .storage import (
+    CONFLICT_POLICIES,
+    DEFAULT_QUERY_LIMIT,
+    PAYLOAD_FILTERS,
+    PoolSettings,
+    StorageAdapter,
+    StorageError,
+    build_storage,
+)
 
 
 def _load_json(path: Path) -> Dict[str, Any]:
@@ -29,155 +52,426 @@ def _save_json(path: Path, payload: Dict[str, Any]) -> None:
         handle.write("\n")
 
 
-def _load_state(path: Path) -> ProjectState:
-    if path.exists():
-        return ProjectState.from_dict(_load_json(path))
-    return ProjectState(project_id=f"project-{uuid4()}", current_phase="0")
+def _open_storage(args: argparse.Namespace) -> StorageAdapter:
+    pool = None
+    if args.db_pool:
+        pool = PoolSettings(
+            min_size=args.db_pool_min_size,
+            max_size=args.db_pool_max_size,
+            max_idle=args.db_pool_max_idle,
+        )
+    return build_storage(args.database_url, pool=pool, metrics=getattr(args, "metrics", None))
 
 
-def _cmd_step(args: argparse.Namespace) -> int:
-    state_path = Path(args.state_file)
-    state = _load_state(state_path)
-    storage = build_storage(args.database_url)
-    storage.init_schema()
-
-    llm_client = None
-    if args.llm_provider:
-        llm_client = LLMClient.from_env(
-            provider=args.llm_provider,
-            model=args.llm_model,
-            api_key_env=args.llm_api_key_env,
-            base_url=args.llm_base_url,
-            base_prompt_file=args.base_prompt_file,
-        )
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
-    orchestrator = SpeculaOrchestrator(state, llm_client=llm_client)
 
-    result = orchestrator.generate_step(
-        user_input=args.user_input,
-        phase=args.phase,
-        mode=args.mode,
+def _add_database_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--database-url", default=os.getenv("SPECULA_DATABASE_URL"))
+    parser.add_argument(
+        "--db-pool",
+        action="store_true",
+        default=os.getenv("SPECULA_DB_POOL", "").lower() in {"1", "true", "yes"},
+        help="Share pooled PostgreSQL connections across storage calls",
+    )
+    parser.add_argument("--db-pool-min-size", type=int, default=1)
+    parser.add_argument("--db-pool-max-size", type=int, default=4)
+    parser.add_argument("--db-pool-max-idle", type=float, default=300.0, help="Seconds before idle connections close")
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print per-operation storage timings, rows and errors to stderr on exit",
     )
 
-    _save_json(state_path, state.to_dict())
 
-    response = {
-        "assistant_text": result["assistant_text"],
-        "artifact": result["artifact"],
-        "state": state.to_dict(),
-    }
+def _add_state_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--state-file",
+        default=".specula_state.json",
+        help=(
+            "State file (`.json`, binary `.spst`, compressed `.spstz`), "
+            "or a directory (path without suffix) for the segmented layout"
+        ),
+    )
+    parser.add_argument(
+        "--state-format",
+        choices=sorted(CODECS),
+        help="Encoding for the state file, overriding its suffix; an existing file is converted on the next save",
+    )
 
-    if args.output_file:
-        _save_json(Path(args.output_file), response)
 
-    storage.upsert_project_state(state)
-    storage.insert_artifact(state.project_id, result["artifact"])
-    storage.append_audit(
-        project_id=state.project_id,
-        phase=result["artifact"]["meta"]["phase"],
-        mode=result["artifact"]["meta"]["mode"],
-        event="STEP_GENERATED",
-        content=result["assistant_text"],
-    )
+def _open_state_store(path: str, state_format: Optional[str]) -> StateStore:
+    return open_state_store(Path(path), codec=get_codec(state_format) if state_format else None)
 
-    print(result["assistant_text"])
-    print(json.dumps(result["artifact"], indent=2))
-    return 0
+
+def _cmd_step(args: argparse.Namespace) -> int:
+    state_store = _open_state_store(args.state_file, args.state_format)
+    state = state_store.load_or_create()
+    with _open_storage(args) as storage:
+        storage.init_schema()
+
+        llm_client = None
+        if args.llm_provider:
+            llm_client = LLMClient.from_env(
+                provider=args.llm_provider,
+                model=args.llm_model,
+                api_key_env=args.llm_api_key_env,
+                base_url=args.llm_base_url,
+                base_prompt_file=args.base_prompt_file,
+            )
+
+        orchestrator = SpeculaOrchestrator(
+            state,
+            llm_client=llm_client,
+            trusted_templates=args.trusted_templates,
+            full_validation_rate=args.full_validation_rate,
+        )
+
+        result = orchestrator.generate_step(
+            user_input=args.user_input,
+            phase=args.phase,
+            mode=args.mode,
+        )
+
+        state_store.save(state)
+
+        if args.output_file:
+            response = {
+                "assistant_text": result["assistant_text"],
+                "artifact": result["artifact"],
+                "state": state.to_dict(),
+            }
+            _save_json(Path(args.output_file), response)
+
+        with storage.unit_of_work():
+            storage.upsert_project_state(state)
+            storage.insert_artifact(state.project_id, result["artifact"])
+            storage.append_audit(
+                project_id=state.project_id,
+                phase=result["artifact"]["meta"]["phase"],
+                mode=result["artifact"]["meta"]["mode"],
+                event="STEP_GENERATED",
+                content=result["assistant_text"],
+            )
+
+        print(result["assistant_text"])
+        print(json.dumps(result["artifact"], indent=2))
+        return 0
 
 
 def _cmd_validate(args: argparse.Namespace) -> int:
     artifact = _load_json(Path(args.artifact_file))
     with Path(args.text_file).open("r", encoding="utf-8") as handle:
         assistant_text = handle.read()
-    storage = build_storage(args.database_url)
-    storage.init_schema()
-
-    errors = []
-    errors.extend(validate_assistant_text(assistant_text))
-    errors.extend(validate_artifact(artifact, current_phase=args.current_phase))
+    with _open_storage(args) as storage:
+        storage.init_schema()
+
+        errors = []
+        errors.extend(validate_assistant_text(assistant_text))
+        errors.extend(validate_artifact(artifact, current_phase=args.current_phase))
+
+        if errors:
+            storage.append_audit(
+                project_id=args.project_id,
+                phase=artifact.get("meta", {}).get("phase"),
+                mode=artifact.get("meta", {}).get("mode"),
+                event="VALIDATION_FAILED",
+                content="; ".join(errors),
+            )
+            print("validation failed:")
+            for issue in errors:
+                print(f"- {issue}")
+            return 1
 
-    if errors:
         storage.append_audit(
             project_id=args.project_id,
             phase=artifact.get("meta", {}).get("phase"),
             mode=artifact.get("meta", {}).get("mode"),
-            event="VALIDATION_FAILED",
-            content="; ".join(errors),
+            event="VALIDATION_PASSED",
+            content="assistant text + artifact contract valid",
         )
-        print("validation failed:")
-        for issue in errors:
-            print(f"- {issue}")
-        return 1
+        print("validation passed")
+        return 0
 
-    storage.append_audit(
-        project_id=args.project_id,
-        phase=artifact.get("meta", {}).get("phase"),
-        mode=artifact.get("meta", {}).get("mode"),
-        event="VALIDATION_PASSED",
-        content="assistant text + artifact contract valid",
-    )
-    print("validation passed")
-    return 0
+
+def _cmd_validate_batch(args: argparse.Namespace) -> int:
+    with _open_storage(args) as storage:
+        storage.init_schema()
+
+        total = failed = 0
+        pending_audit = []
+        results = validate_many(
+            iter_artifact_paths(args.targets),
+            current_phase=args.current_phase,
+            workers=args.workers,
+        )
+        for result in results:
+            total += 1
+            if result.ok:
+                print(f"PASS {result.path}", flush=True)
+            else:
+                failed += 1
+                print(f"FAIL {result.path}", flush=True)
+                for issue in result.errors:
+                    print(f"- {issue}")
+            pending_audit.append(
+                {
+                    "project_id": args.project_id,
+                    "phase": result.phase,
+                    "mode": result.mode,
+                    "event": "VALIDATION_PASSED" if result.ok else "VALIDATION_FAILED",
+                    "content": f"{result.path}: " + ("; ".join(result.errors) or "artifact contract valid"),
+                }
+            )
+            if len(pending_audit) >= args.audit_batch_size:
+                storage.append_audit_many(pending_audit)
+                pending_audit = []
+
+        storage.append_audit_many(pending_audit)
+        print(f"validated {total} artifacts: {total - failed} passed, {failed} failed")
+        return 1 if failed else 0
+
+
+def _cmd_validate_stream(args: argparse.Namespace) -> int:
+    failed = 0
+    # One stack for both ends, so the input is closed if the output cannot be opened.
+    with ExitStack() as stack:
+        source = sys.stdin if args.input == "-" else stack.enter_context(Path(args.input).open("r", encoding="utf-8"))
+        if args.output == "-":
+            sink = sys.stdout
+            stack.callback(sink.flush)
+        else:
+            sink = stack.enter_context(Path(args.output).open("w", encoding="utf-8"))
+        for result in validate_ndjson(source, current_phase=args.current_phase, require_text=args.require_text):
+            if not result["valid"]:
+                failed += 1
+            sink.write(json.dumps(result, ensure_ascii=False))
+            sink.write("\n")
+    return 1 if failed else 0
 
 
 def _cmd_advance(args: argparse.Namespace) -> int:
-    state_path = Path(args.state_file)
-    state = _load_state(state_path)
-    storage = build_storage(args.database_url)
-    storage.init_schema()
-    if args.decision == "approve" and not args.validated_by_human:
-        raise ValueError("approve decision requires --validated-by-human")
-
-    state.add_validation_record(
-        artifact_id=args.artifact_id,
-        validator_id=args.validator_id,
-        validator_role=args.validator_role,
-        decision=args.decision,
-        validated_by_human=args.validated_by_human,
-    )
-
-    storage.insert_validation(
-        args.artifact_id,
-        validated_by_human=args.validated_by_human,
-        validator_id=args.validator_id,
-        validator_role=args.validator_role,
-        decision=args.decision,
-    )
-
-    _save_json(state_path, state.to_dict())
-    storage.upsert_project_state(state)
-    storage.append_audit(
-        project_id=state.project_id,
-        phase=args.phase,
-        mode=None,
-        event="VALIDATION_RECORDED",
-        content=(
-            f"validator={args.validator_id}; role={args.validator_role}; "
-            f"decision={args.decision}; human={args.validated_by_human}"
-        ),
+    state_store = _open_state_store(args.state_file, args.state_format)
+    state = state_store.load_or_create()
+    with _open_storage(args) as storage:
+        storage.init_schema()
+        if args.decision == "approve" and not args.validated_by_human:
+            raise ValueError("approve decision requires --validated-by-human")
+
+        state.add_validation_record(
+            artifact_id=args.artifact_id,
+            validator_id=args.validator_id,
+            validator_role=args.validator_role,
+            decision=args.decision,
+            validated_by_human=args.validated_by_human,
+        )
+
+        orchestrator = SpeculaOrchestrator(state)
+        validations = state.validation_snapshot(args.artifact_id)
+        next_phase = None
+        advance_error = None
+        try:
+            next_phase = orchestrator.advance_after_validation(
+                phase=args.phase, artifact_id=args.artifact_id, validations=validations
+            )
+        except ValueError as exc:
+            # The validation is still recorded when the phase cannot advance yet.
+            advance_error = exc
+
+        with storage.unit_of_work():
+            storage.insert_validation(
+                args.artifact_id,
+                validated_by_human=args.validated_by_human,
+                validator_id=args.validator_id,
+                validator_role=args.validator_role,
+                decision=args.decision,
+            )
+            storage.upsert_project_state(state)
+            storage.append_audit(
+                project_id=state.project_id,
+                phase=args.phase,
+                mode=None,
+                event="VALIDATION_RECORDED",
+                content=(
+                    f"validator={args.validator_id}; role={args.validator_role}; "
+                    f"decision={args.decision}; human={args.validated_by_human}"
+                ),
+            )
+            if advance_error is None:
+                storage.append_audit(
+                    project_id=state.project_id,
+                    phase=args.phase,
+                    mode=None,
+                    event="PHASE_ADVANCED",
+                    content=f"advanced to phase {next_phase}",
+                )
+
+        state_store.save(state)
+        if advance_error is not None:
+            raise advance_error
+        print(f"advanced to phase {next_phase}")
+        return 0
+
+
+def _cmd_init_db(args: argparse.Namespace) -> int:
+    with _open_storage(args) as storage:
+        applied = storage.migrate()
+        version = storage.current_schema_version()
+    if applied:
+        print(f"applied migrations: {', '.join(str(item) for item in applied)}")
+    print(f"database schema at version {version}")
+    return 0
+
+
+def _print_import_progress(stats: ImportStats) -> None:
+    print(
+        f"imported {stats.records} records from {stats.files} files: "
+        f"{stats.rows_written} rows ({stats.rows_per_second():.0f} rows/s)",
+        file=sys.stderr,
+        flush=True,
     )
 
-    orchestrator = SpeculaOrchestrator(state)
-    validations = state.validation_snapshot(args.artifact_id)
-    next_phase = orchestrator.advance_after_validation(phase=args.phase, artifact_id=args.artifact_id, validations=validations)
 
-    _save_json(state_path, state.to_dict())
-    storage.upsert_project_state(state)
-    storage.append_audit(
-        project_id=state.project_id,
-        phase=args.phase,
-        mode=None,
-        event="PHASE_ADVANCED",
-        content=f"advanced to phase {next_phase}",
+def _cmd_import(args: argparse.Namespace) -> int:
+    with _open_storage(args) as storage:
+        storage.migrate()
+        stats = run_import(
+            storage,
+            args.targets,
+            on_conflict=args.on_conflict,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            project_id=args.project_id,
+            progress=None if args.quiet else _print_import_progress,
+        )
+    for table, count in sorted(stats.rows.items()):
+        print(f"{table}: {count} rows")
+    if stats.skipped:
+        print(f"skipped {stats.skipped} validation records whose artifact is not in the same state")
+    print(
+        f"imported {stats.records} records from {stats.files} files in {stats.elapsed:.2f}s "
+        f"({stats.rows_per_second():.0f} rows/s)"
     )
-    print(f"advanced to phase {next_phase}")
     return 0
 
 
-def _cmd_init_db(args: argparse.Namespace) -> int:
-    storage = build_storage(args.database_url)
-    storage.init_schema()
-    print("database schema initialized")
+def _cmd_search(args: argparse.Namespace) -> int:
+    payload = {
+        payload_filter.name: getattr(args, payload_filter.name)
+        for payload_filter in PAYLOAD_FILTERS
+        if getattr(args, payload_filter.name) is not None
+    }
+    cursor = args.after
+    with _open_storage(args) as storage:
+        storage.migrate()
+        while True:
+            page = storage.query_artifacts(
+                project_id=args.project_id,
+                phase=args.phase,
+                mode=args.mode,
+                payload=payload,
+                limit=args.limit,
+                after=cursor,
+            )
+            for artifact in page.artifacts:
+                sys.stdout.write(json.dumps(artifact, ensure_ascii=False) + "\n")
+            cursor = page.next_cursor
+            if cursor is None or not args.all:
+                break
+    if cursor is not None:
+        print(f"next page: --after {cursor}", file=sys.stderr)
+    return 0
+
+
+def _prune_cutoff(args: argparse.Namespace) -> date:
+    if args.before:
+        try:
+            return date.fromisoformat(f"{args.before}-01")
+        except ValueError as exc:
+            raise ValueError(f"--before must be YYYY-MM, got `{args.before}`") from exc
+    if args.keep_months < 1:
+        raise ValueError("--keep-months must be at least 1")
+    return month_start(date.today(), -(args.keep_months - 1))
+
+
+def _cmd_prune_audit(args: argparse.Namespace) -> int:
+    cutoff = _prune_cutoff(args)
+    with _open_storage(args) as storage:
+        storage.migrate()
+        archives = storage.prune_audit(cutoff, Path(args.archive_dir))
+    for archive in archives:
+        print(f"archived {archive}")
+    print(f"pruned {len(archives)} audit months before {cutoff:%Y-%m}")
+    return 0
+
+
+def _cmd_convert_state(args: argparse.Namespace) -> int:
+    source = open_state_store(Path(args.source))
+    if not source.exists():
+        raise ValueError(f"no project state at `{args.source}`")
+    state = source.load()
+    _open_state_store(args.target, args.state_format).save(state)
+    print(f"converted {len(state.artifact_index)} artifacts from {args.source} to {args.target}")
+    return 0
+
+
+def _cmd_export_archive(args: argparse.Namespace) -> int:
+    source = open_state_store(Path(args.source))
+    if not source.exists():
+        raise ValueError(f"no project state at `{args.source}`")
+    state = source.load()
+    count = write_archive(Path(args.archive), state.artifact_index.items())
+    print(f"archived {count} artifacts from {args.source} to {args.archive}")
+    return 0
+
+
+def _cmd_show_artifact(args: argparse.Namespace) -> int:
+    if not args.archive and not args.state_file:
+        raise ValueError("show-artifact needs --archive and/or --state-file")
+    state = ProjectState(project_id="")
+    if args.state_file:
+        store = open_state_store(Path(args.state_file))
+        if not store.exists():
+            raise ValueError(f"no project state at `{args.state_file}`")
+        state = store.load()
+    archive = ArtifactArchive(Path(args.archive)) if args.archive else None
+    try:
+        orchestrator = SpeculaOrchestrator(state, artifact_source=archive)
+        artifact = orchestrator.resolve_artifact(args.artifact_id)
+        if artifact is None:
+            raise ValueError(f"artifact `{args.artifact_id}` not found")
+        if args.related:
+            output: Dict[str, Any] = {
+                "artifact": artifact,
+                "related_artifacts": orchestrator.resolve_related_artifacts(args.artifact_id),
+            }
+        else:
+            output = artifact
+        print(json.dumps(output, indent=2, ensure_ascii=False))
+    finally:
+        if archive is not None:
+            archive.close()
+    return 0
+
+
+def _cmd_export_sql(args: argparse.Namespace) -> int:
+    rendered = render_sql()
+    if args.output == "-":
+        sys.stdout.write(rendered)
+    else:
+        Path(args.output).write_text(rendered, encoding="utf-8")
+    return 0
+
+
+def _cmd_compile_schemas(args: argparse.Namespace) -> int:
+    schema_dir = Path(args.schema_dir) if args.schema_dir else _schema_dir()
+    output_dir = Path(args.output_dir) if args.output_dir else None
+    for module_path in compile_all(schema_dir, output_dir):
+        print(f"compiled {module_path}")
     return 0
 
 
@@ -186,12 +480,12 @@ def _build_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     step = subparsers.add_parser("step", help="Generate one validated agent step")
-    step.add_argument("--state-file", default=".specula_state.json")
+    _add_state_arguments(step)
     step.add_argument("--user-input", required=True)
     step.add_argument("--phase")
     step.add_argument("--mode")
     step.add_argument("--output-file")
-    step.add_argument("--database-url", default=os.getenv("SPECULA_DATABASE_URL"))
+    _add_database_arguments(step)
     step.add_argument("--llm-provider", choices=["openai", "anthropic"])
     step.add_argument("--llm-model", default="gpt-4o-mini")
     step.add_argument("--llm-api-key-env", default="OPENAI_API_KEY")
@@ -200,18 +494,53 @@ def _build_parser() -> argparse.ArgumentParser:
         "--base-prompt-file",
         default="prompts/specula_method_agent_base.md",
     )
+    step.add_argument(
+        "--trusted-templates",
+        action="store_true",
+        help="Fully validate each template once per process, then only its dynamic fields",
+    )
+    step.add_argument(
+        "--full-validation-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of trusted steps that still run full validation",
+    )
     step.set_defaults(func=_cmd_step)
 
     validate = subparsers.add_parser("validate", help="Validate assistant text + artifact")
     validate.add_argument("--artifact-file", required=True)
     validate.add_argument("--text-file", required=True)
     validate.add_argument("--current-phase")
-    validate.add_argument("--database-url", default=os.getenv("SPECULA_DATABASE_URL"))
+    _add_database_arguments(validate)
     validate.add_argument("--project-id", default="project-validation")
     validate.set_defaults(func=_cmd_validate)
 
+    validate_batch = subparsers.add_parser(
+        "validate-batch", help="Validate every artifact under directories or glob patterns"
+    )
+    validate_batch.add_argument("targets", nargs="+", help="Directories or glob patterns of artifact JSON files")
+    validate_batch.add_argument("--current-phase")
+    validate_batch.add_argument("--workers", type=_positive_int, default=os.cpu_count())
+    validate_batch.add_argument("--audit-batch-size", type=int, default=500)
+    _add_database_arguments(validate_batch)
+    validate_batch.add_argument("--project-id", default="project-validation")
+    validate_batch.set_defaults(func=_cmd_validate_batch)
+
+    validate_stream = subparsers.add_parser(
+        "validate-stream", help="Validate NDJSON artifact records and emit NDJSON results"
+    )
+    validate_stream.add_argument("--input", default="-", help="NDJSON file, or - for stdin")
+    validate_stream.add_argument("--output", default="-", help="Result file, or - for stdout")
+    validate_stream.add_argument("--current-phase")
+    validate_stream.add_argument(
+        "--require-text",
+        action="store_true",
+        help="Fail records that carry no assistant_text",
+    )
+    validate_stream.set_defaults(func=_cmd_validate_stream)
+
     advance = subparsers.add_parser("advance", help="Advance state after human validation")
-    advance.add_argument("--state-file", default=".specula_state.json")
+    _add_state_arguments(advance)
     advance.add_argument("--phase", required=True)
     advance.add_argument("--artifact-id", required=True)
     advance.add_argument(
@@ -222,26 +551,108 @@ def _build_parser() -> argparse.ArgumentParser:
     advance.add_argument("--validator-id", default="human-validator")
     advance.add_argument("--validator-role", required=True)
     advance.add_argument("--decision", choices=["approve", "reject", "hold"], default="approve")
-    advance.add_argument("--database-url", default=os.getenv("SPECULA_DATABASE_URL"))
+    _add_database_arguments(advance)
     advance.set_defaults(func=_cmd_advance)
 
-    init_db = subparsers.add_parser("init-db", help="Initialize PostgreSQL schema")
-    init_db.add_argument("--database-url", default=os.getenv("SPECULA_DATABASE_URL"))
+    init_db = subparsers.add_parser("init-db", help="Apply pending PostgreSQL schema migrations")
+    _add_database_arguments(init_db)
     init_db.set_defaults(func=_cmd_init_db)
 
+    compile_schemas = subparsers.add_parser(
+        "compile-schemas", help="Generate plain-Python validators from schemas/*.schema.json"
+    )
+    compile_schemas.add_argument("--schema-dir")
+    compile_schemas.add_argument("--output-dir")
+    compile_schemas.set_defaults(func=_cmd_compile_schemas)
+
+    import_cmd = subparsers.add_parser(
+        "import", help="Bulk-load saved state files and NDJSON artifact dumps into the database"
+    )
+    import_cmd.add_argument("targets", nargs="+", help="Files, directories, or glob patterns")
+    import_cmd.add_argument("--on-conflict", choices=CONFLICT_POLICIES, default="skip")
+    import_cmd.add_argument("--workers", type=int, default=4, help="Concurrent database writers")
+    import_cmd.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Records per batch")
+    import_cmd.add_argument("--project-id", help="Owner of artifacts that do not name a project")
+    import_cmd.add_argument("--quiet", action="store_true", help="Do not report progress on stderr")
+    _add_database_arguments(import_cmd)
+    import_cmd.set_defaults(func=_cmd_import)
+
+    search = subparsers.add_parser("search", help="Query stored artifacts as NDJSON, one page at a time")
+    search.add_argument("--project-id")
+    search.add_argument("--phase")
+    search.add_argument("--mode")
+    for payload_filter in PAYLOAD_FILTERS:
+        search.add_argument(f"--{payload_filter.name.replace('_', '-')}", dest=payload_filter.name)
+    search.add_argument("--limit", type=int, default=DEFAULT_QUERY_LIMIT, help="Artifacts per page")
+    search.add_argument("--after", help="Cursor printed by the previous page")
+    search.add_argument("--all", action="store_true", help="Follow cursors until the last page")
+    _add_database_arguments(search)
+    search.set_defaults(func=_cmd_search)
+
+    prune_audit = subparsers.add_parser(
+        "prune-audit", help="Archive old audit months to gzip NDJSON and drop them from the database"
+    )
+    window = prune_audit.add_mutually_exclusive_group()
+    window.add_argument("--keep-months", type=int, default=6, help="Months to keep, including the current one")
+    window.add_argument("--before", help="Prune months before YYYY-MM")
+    prune_audit.add_argument("--archive-dir", default="audit-archive")
+    _add_database_arguments(prune_audit)
+    prune_audit.set_defaults(func=_cmd_prune_audit)
+
+    convert_state = subparsers.add_parser(
+        "convert-state", help="Copy project state between state file encodings and the segmented directory layout"
+    )
+    convert_state.add_argument("source", help="State file (`.json`, `.spst`, `.spstz`) or segmented state directory")
+    convert_state.add_argument("target", help="Destination; a path without a suffix is a segmented directory")
+    convert_state.add_argument(
+        "--state-format",
+        choices=sorted(CODECS),
+        help="Encoding for a target state file, overriding its suffix",
+    )
+    convert_state.set_defaults(func=_cmd_convert_state)
+
+    export_archive = subparsers.add_parser(
+        "export-archive", help="Write a project's artifacts to a read-only, memory-mapped archive"
+    )
+    export_archive.add_argument("source", help="State file or segmented state directory")
+    export_archive.add_argument("archive", help="Archive file to create (conventionally `*.spa`)")
+    export_archive.set_defaults(func=_cmd_export_archive)
+
+    show_artifact = subparsers.add_parser(
+        "show-artifact", help="Print one artifact, looked up in a state and/or an artifact archive"
+    )
+    show_artifact.add_argument("artifact_id")
+    show_artifact.add_argument("--archive", help="Artifact archive written by `export-archive`")
+    show_artifact.add_argument(
+        "--state-file", help="State file or segmented state directory, searched before the archive"
+    )
+    show_artifact.add_argument(
+        "--related", action="store_true", help="Also resolve the artifact's `meta.related_artifacts`"
+    )
+    show_artifact.set_defaults(func=_cmd_show_artifact)
+
+    export_sql = subparsers.add_parser("export-sql", help="Render the migrations as one SQL script")
+    export_sql.add_argument("--output", default="-", help="Output file or `-` for stdout")
+    export_sql.set_defaults(func=_cmd_export_sql)
+
     return parser
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(argv)
+    args.metrics = InMemoryMetrics() if getattr(args, "stats", False) else None
+    started = time.perf_counter()
     try:
-        if args.command == "init-db" and not getattr(args, "database_url", None):
-            raise StorageError("database URL is required for init-db")
+        if args.command in {"init-db", "import", "prune-audit", "search"} and not getattr(args, "database_url", None):
+            raise StorageError(f"database URL is required for {args.command}")
         return args.func(args)
     except Exception as exc:  # pragma: no cover
         print(str(exc), file=sys.stderr)
         return 1
+    finally:
+        if args.metrics is not None:
+            print(args.metrics.format_summary(time.perf_counter() - started), file=sys.stderr)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,5 @@
+"""Plain-Python validators generated from `schemas/*.schema.json`.
+
+Regenerate with `specula-agent compile-schemas` after editing a schema. Modules
+whose recorded digest no longer matches the schema file are ignored.
+"""
@@ -0,0 +1,53 @@
+"""Helpers shared by generated validator modules.
+
+Type and equality semantics mirror jsonschema's Draft 2020-12 defaults so the
+compiled validators report the same errors as the interpreting engine.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from jsonschema import FormatChecker
+
+_FORMAT_CHECKER = FormatChecker()
+_TRUE = object()
+_FALSE = object()
+
+
+def _unbool(value: Any) -> Any:
+    if value is True:
+        return _TRUE
+    if value is False:
+        return _FALSE
+    return value
+
+
+def equal(one: Any, two: Any) -> bool:
+    """JSON equality where booleans never compare equal to numbers."""
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return one.keys() == two.keys() and all(equal(one[key], two[key]) for key in one)
+    return _unbool(one) == _unbool(two)
+
+
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, int)
+
+
+def conforms(value: Any, fmt: str) -> bool:
+    return _FORMAT_CHECKER.conforms(value, fmt)
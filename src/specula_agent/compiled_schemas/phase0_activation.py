@@ -0,0 +1,228 @@
+"""Validator compiled from `schemas/phase0_activation.schema.json`.
+
+Generated by `specula-agent compile-schemas`; do not edit by hand.
+"""
+
+from ._runtime import conforms, equal, is_integer, is_number
+
+SCHEMA_FILE = 'phase0_activation.schema.json'
+SCHEMA_SHA256 = '8f2283df21b3ed1a9f875f6a5fc620dff1fb98e470a52941dbc714b6868aafd6'
+
+_C0 = ('meta', 'payload')
+_C1 = ('artifact_id', 'phase', 'mode', 'generated_at', 'validated_by_human', 'related_artifacts', 'decision_rationale', 'evidence_refs', 'tradeoffs', 'rejected_alternatives')
+_C2 = False
+_C3 = frozenset({'artifact_id', 'decision_rationale', 'evidence_refs', 'generated_at', 'mode', 'phase', 'rejected_alternatives', 'related_artifacts', 'tradeoffs', 'validated_by_human'})
+_C4 = ('activation_status', 'current_phase', 'context_set', 'next_required_input')
+_C5 = (0, 1, 1.5, 2, 3, 4, 5, 6)
+_C6 = frozenset({'activation_status', 'context_set', 'current_phase', 'next_required_input'})
+_C7 = frozenset({'meta', 'payload'})
+
+
+def _v0(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C0:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'meta' in instance:
+            _v1(instance['meta'], path + ('meta',), errors)
+        if 'payload' in instance:
+            _v16(instance['payload'], path + ('payload',), errors)
+        extras = [key for key in instance if key not in _C7]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v1(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C1:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'artifact_id' in instance:
+            _v2(instance['artifact_id'], path + ('artifact_id',), errors)
+        if 'phase' in instance:
+            _v3(instance['phase'], path + ('phase',), errors)
+        if 'mode' in instance:
+            _v4(instance['mode'], path + ('mode',), errors)
+        if 'generated_at' in instance:
+            _v5(instance['generated_at'], path + ('generated_at',), errors)
+        if 'validated_by_human' in instance:
+            _v6(instance['validated_by_human'], path + ('validated_by_human',), errors)
+        if 'related_artifacts' in instance:
+            _v7(instance['related_artifacts'], path + ('related_artifacts',), errors)
+        if 'decision_rationale' in instance:
+            _v9(instance['decision_rationale'], path + ('decision_rationale',), errors)
+        if 'evidence_refs' in instance:
+            _v10(instance['evidence_refs'], path + ('evidence_refs',), errors)
+        if 'tradeoffs' in instance:
+            _v12(instance['tradeoffs'], path + ('tradeoffs',), errors)
+        if 'rejected_alternatives' in instance:
+            _v14(instance['rejected_alternatives'], path + ('rejected_alternatives',), errors)
+        extras = [key for key in instance if key not in _C3]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v2(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v3(instance, path, errors):
+    if not (instance == '0'):
+        errors.append((path, "'0' was expected"))
+
+
+def _v4(instance, path, errors):
+    if not (instance == 'sensemaking'):
+        errors.append((path, "'sensemaking' was expected"))
+
+
+def _v5(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not conforms(instance, 'date-time'):
+        errors.append((path, repr(instance) + " is not a 'date-time'"))
+
+
+def _v6(instance, path, errors):
+    if not (equal(instance, _C2)):
+        errors.append((path, 'False was expected'))
+
+
+def _v7(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v8(item, path + (index,), errors)
+
+
+def _v8(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v9(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v10(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v11(item, path + (index,), errors)
+
+
+def _v11(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v12(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v13(item, path + (index,), errors)
+
+
+def _v13(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v14(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v15(item, path + (index,), errors)
+
+
+def _v15(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v16(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C4:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'activation_status' in instance:
+            _v17(instance['activation_status'], path + ('activation_status',), errors)
+        if 'current_phase' in instance:
+            _v18(instance['current_phase'], path + ('current_phase',), errors)
+        if 'context_set' in instance:
+            _v19(instance['context_set'], path + ('context_set',), errors)
+        if 'next_required_input' in instance:
+            _v20(instance['next_required_input'], path + ('next_required_input',), errors)
+        extras = [key for key in instance if key not in _C6]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v17(instance, path, errors):
+    if not (instance == 'active'):
+        errors.append((path, "'active' was expected"))
+
+
+def _v18(instance, path, errors):
+    if not (is_number(instance)):
+        errors.append((path, f"{instance!r} is not of type 'number'"))
+    if not (any(equal(instance, item) for item in _C5)):
+        errors.append((path, repr(instance) + ' is not one of [0, 1, 1.5, 2, 3, 4, 5, 6]'))
+
+
+def _v19(instance, path, errors):
+    if not (isinstance(instance, bool)):
+        errors.append((path, f"{instance!r} is not of type 'boolean'"))
+
+
+def _v20(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def collect_errors(instance):
+    """Return `(path, message)` pairs for every violation in `instance`."""
+    errors = []
+    _v0(instance, (), errors)
+    return errors
@@ -0,0 +1,345 @@
+"""Validator compiled from `schemas/phase1_5_competitive_map.schema.json`.
+
+Generated by `specula-agent compile-schemas`; do not edit by hand.
+"""
+
+from ._runtime import conforms, equal, is_integer, is_number
+
+SCHEMA_FILE = 'phase1_5_competitive_map.schema.json'
+SCHEMA_SHA256 = 'a97d27a0a9da83cdb7da90a24caaa3d79de000471be4bddef894cbac8ce10550'
+
+_C0 = ('meta', 'payload')
+_C1 = ('artifact_id', 'phase', 'mode', 'generated_at', 'validated_by_human', 'related_artifacts', 'decision_rationale', 'evidence_refs', 'tradeoffs', 'rejected_alternatives')
+_C2 = False
+_C3 = frozenset({'artifact_id', 'decision_rationale', 'evidence_refs', 'generated_at', 'mode', 'phase', 'rejected_alternatives', 'related_artifacts', 'tradeoffs', 'validated_by_human'})
+_C4 = ('competitive_map', 'white_spaces')
+_C5 = ('competitor', 'future_trajectory', 'occupied_territory', 'ignored_territories', 'confidence_level')
+_C6 = frozenset({'high', 'low', 'medium'})
+_C7 = frozenset({'competitor', 'confidence_level', 'future_trajectory', 'ignored_territories', 'occupied_territory'})
+_C8 = ('white_space_id', 'description', 'strategic_risk', 'alignment_with_brand')
+_C9 = frozenset({'high', 'low', 'medium'})
+_C10 = frozenset({'high', 'low', 'medium'})
+_C11 = frozenset({'alignment_with_brand', 'description', 'strategic_risk', 'white_space_id'})
+_C12 = frozenset({'competitive_map', 'white_spaces'})
+_C13 = frozenset({'meta', 'payload'})
+
+
+def _v0(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C0:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'meta' in instance:
+            _v1(instance['meta'], path + ('meta',), errors)
+        if 'payload' in instance:
+            _v16(instance['payload'], path + ('payload',), errors)
+        extras = [key for key in instance if key not in _C13]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v1(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C1:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'artifact_id' in instance:
+            _v2(instance['artifact_id'], path + ('artifact_id',), errors)
+        if 'phase' in instance:
+            _v3(instance['phase'], path + ('phase',), errors)
+        if 'mode' in instance:
+            _v4(instance['mode'], path + ('mode',), errors)
+        if 'generated_at' in instance:
+            _v5(instance['generated_at'], path + ('generated_at',), errors)
+        if 'validated_by_human' in instance:
+            _v6(instance['validated_by_human'], path + ('validated_by_human',), errors)
+        if 'related_artifacts' in instance:
+            _v7(instance['related_artifacts'], path + ('related_artifacts',), errors)
+        if 'decision_rationale' in instance:
+            _v9(instance['decision_rationale'], path + ('decision_rationale',), errors)
+        if 'evidence_refs' in instance:
+            _v10(instance['evidence_refs'], path + ('evidence_refs',), errors)
+        if 'tradeoffs' in instance:
+            _v12(instance['tradeoffs'], path + ('tradeoffs',), errors)
+        if 'rejected_alternatives' in instance:
+            _v14(instance['rejected_alternatives'], path + ('rejected_alternatives',), errors)
+        extras = [key for key in instance if key not in _C3]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v2(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v3(instance, path, errors):
+    if not (instance == '1.5'):
+        errors.append((path, "'1.5' was expected"))
+
+
+def _v4(instance, path, errors):
+    if not (instance == 'convergence'):
+        errors.append((path, "'convergence' was expected"))
+
+
+def _v5(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not conforms(instance, 'date-time'):
+        errors.append((path, repr(instance) + " is not a 'date-time'"))
+
+
+def _v6(instance, path, errors):
+    if not (equal(instance, _C2)):
+        errors.append((path, 'False was expected'))
+
+
+def _v7(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v8(item, path + (index,), errors)
+
+
+def _v8(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v9(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v10(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v11(item, path + (index,), errors)
+
+
+def _v11(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v12(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v13(item, path + (index,), errors)
+
+
+def _v13(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v14(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v15(item, path + (index,), errors)
+
+
+def _v15(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v16(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C4:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'competitive_map' in instance:
+            _v17(instance['competitive_map'], path + ('competitive_map',), errors)
+        if 'white_spaces' in instance:
+            _v25(instance['white_spaces'], path + ('white_spaces',), errors)
+        extras = [key for key in instance if key not in _C12]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v17(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v18(item, path + (index,), errors)
+
+
+def _v18(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C5:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'competitor' in instance:
+            _v19(instance['competitor'], path + ('competitor',), errors)
+        if 'future_trajectory' in instance:
+            _v20(instance['future_trajectory'], path + ('future_trajectory',), errors)
+        if 'occupied_territory' in instance:
+            _v21(instance['occupied_territory'], path + ('occupied_territory',), errors)
+        if 'ignored_territories' in instance:
+            _v22(instance['ignored_territories'], path + ('ignored_territories',), errors)
+        if 'confidence_level' in instance:
+            _v24(instance['confidence_level'], path + ('confidence_level',), errors)
+        extras = [key for key in instance if key not in _C7]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v19(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v20(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v21(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v22(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v23(item, path + (index,), errors)
+
+
+def _v23(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v24(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not (isinstance(instance, str) and instance in _C6):
+        errors.append((path, repr(instance) + " is not one of ['low', 'medium', 'high']"))
+
+
+def _v25(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v26(item, path + (index,), errors)
+
+
+def _v26(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C8:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'white_space_id' in instance:
+            _v27(instance['white_space_id'], path + ('white_space_id',), errors)
+        if 'description' in instance:
+            _v28(instance['description'], path + ('description',), errors)
+        if 'strategic_risk' in instance:
+            _v29(instance['strategic_risk'], path + ('strategic_risk',), errors)
+        if 'alignment_with_brand' in instance:
+            _v30(instance['alignment_with_brand'], path + ('alignment_with_brand',), errors)
+        extras = [key for key in instance if key not in _C11]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v27(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v28(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v29(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not (isinstance(instance, str) and instance in _C9):
+        errors.append((path, repr(instance) + " is not one of ['low', 'medium', 'high']"))
+
+
+def _v30(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not (isinstance(instance, str) and instance in _C10):
+        errors.append((path, repr(instance) + " is not one of ['low', 'medium', 'high']"))
+
+
+def collect_errors(instance):
+    """Return `(path, message)` pairs for every violation in `instance`."""
+    errors = []
+    _v0(instance, (), errors)
+    return errors
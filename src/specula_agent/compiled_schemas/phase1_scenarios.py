@@ -0,0 +1,335 @@
+"""Validator compiled from `schemas/phase1_scenarios.schema.json`.
+
+Generated by `specula-agent compile-schemas`; do not edit by hand.
+"""
+
+from ._runtime import conforms, equal, is_integer, is_number
+
+SCHEMA_FILE = 'phase1_scenarios.schema.json'
+SCHEMA_SHA256 = '44e9dca5e95349f3abdc75988363947e1ec8497bf5df9c39752c6c43a9fd2812'
+
+_C0 = ('meta', 'payload')
+_C1 = ('artifact_id', 'phase', 'mode', 'generated_at', 'validated_by_human', 'related_artifacts', 'decision_rationale', 'evidence_refs', 'tradeoffs', 'rejected_alternatives')
+_C2 = False
+_C3 = frozenset({'artifact_id', 'decision_rationale', 'evidence_refs', 'generated_at', 'mode', 'phase', 'rejected_alternatives', 'related_artifacts', 'tradeoffs', 'validated_by_human'})
+_C4 = ('scenarios',)
+_C5 = ('scenario_id', 'name', 'time_horizon', 'drivers', 'scenario_type', 'description', 'maieutic_question', 'user_response')
+_C6 = frozenset({'10', '20', '5'})
+_C7 = ('type', 'description')
+_C8 = frozenset({'cultural', 'economic', 'environmental', 'regulatory', 'tech'})
+_C9 = frozenset({'description', 'type'})
+_C10 = frozenset({'feared', 'negative', 'preferred', 'wild_card'})
+_C11 = frozenset({'description', 'drivers', 'maieutic_question', 'name', 'scenario_id', 'scenario_type', 'time_horizon', 'user_response'})
+_C12 = frozenset({'scenarios'})
+_C13 = frozenset({'meta', 'payload'})
+
+
+def _v0(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C0:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'meta' in instance:
+            _v1(instance['meta'], path + ('meta',), errors)
+        if 'payload' in instance:
+            _v16(instance['payload'], path + ('payload',), errors)
+        extras = [key for key in instance if key not in _C13]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v1(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C1:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'artifact_id' in instance:
+            _v2(instance['artifact_id'], path + ('artifact_id',), errors)
+        if 'phase' in instance:
+            _v3(instance['phase'], path + ('phase',), errors)
+        if 'mode' in instance:
+            _v4(instance['mode'], path + ('mode',), errors)
+        if 'generated_at' in instance:
+            _v5(instance['generated_at'], path + ('generated_at',), errors)
+        if 'validated_by_human' in instance:
+            _v6(instance['validated_by_human'], path + ('validated_by_human',), errors)
+        if 'related_artifacts' in instance:
+            _v7(instance['related_artifacts'], path + ('related_artifacts',), errors)
+        if 'decision_rationale' in instance:
+            _v9(instance['decision_rationale'], path + ('decision_rationale',), errors)
+        if 'evidence_refs' in instance:
+            _v10(instance['evidence_refs'], path + ('evidence_refs',), errors)
+        if 'tradeoffs' in instance:
+            _v12(instance['tradeoffs'], path + ('tradeoffs',), errors)
+        if 'rejected_alternatives' in instance:
+            _v14(instance['rejected_alternatives'], path + ('rejected_alternatives',), errors)
+        extras = [key for key in instance if key not in _C3]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v2(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v3(instance, path, errors):
+    if not (instance == '1'):
+        errors.append((path, "'1' was expected"))
+
+
+def _v4(instance, path, errors):
+    if not (instance == 'exploration'):
+        errors.append((path, "'exploration' was expected"))
+
+
+def _v5(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not conforms(instance, 'date-time'):
+        errors.append((path, repr(instance) + " is not a 'date-time'"))
+
+
+def _v6(instance, path, errors):
+    if not (equal(instance, _C2)):
+        errors.append((path, 'False was expected'))
+
+
+def _v7(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v8(item, path + (index,), errors)
+
+
+def _v8(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v9(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v10(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v11(item, path + (index,), errors)
+
+
+def _v11(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v12(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v13(item, path + (index,), errors)
+
+
+def _v13(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v14(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v15(item, path + (index,), errors)
+
+
+def _v15(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v16(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C4:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'scenarios' in instance:
+            _v17(instance['scenarios'], path + ('scenarios',), errors)
+        extras = [key for key in instance if key not in _C12]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v17(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v18(item, path + (index,), errors)
+
+
+def _v18(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C5:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'scenario_id' in instance:
+            _v19(instance['scenario_id'], path + ('scenario_id',), errors)
+        if 'name' in instance:
+            _v20(instance['name'], path + ('name',), errors)
+        if 'time_horizon' in instance:
+            _v21(instance['time_horizon'], path + ('time_horizon',), errors)
+        if 'drivers' in instance:
+            _v22(instance['drivers'], path + ('drivers',), errors)
+        if 'scenario_type' in instance:
+            _v26(instance['scenario_type'], path + ('scenario_type',), errors)
+        if 'description' in instance:
+            _v27(instance['description'], path + ('description',), errors)
+        if 'maieutic_question' in instance:
+            _v28(instance['maieutic_question'], path + ('maieutic_question',), errors)
+        if 'user_response' in instance:
+            _v29(instance['user_response'], path + ('user_response',), errors)
+        extras = [key for key in instance if key not in _C11]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v19(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v20(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v21(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not (isinstance(instance, str) and instance in _C6):
+        errors.append((path, repr(instance) + " is not one of ['5', '10', '20']"))
+
+
+def _v22(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v23(item, path + (index,), errors)
+
+
+def _v23(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C7:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'type' in instance:
+            _v24(instance['type'], path + ('type',), errors)
+        if 'description' in instance:
+            _v25(instance['description'], path + ('description',), errors)
+        extras = [key for key in instance if key not in _C9]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v24(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not (isinstance(instance, str) and instance in _C8):
+        errors.append((path, repr(instance) + " is not one of ['tech', 'cultural', 'economic', 'environmental', 'regulatory']"))
+
+
+def _v25(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v26(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not (isinstance(instance, str) and instance in _C10):
+        errors.append((path, repr(instance) + " is not one of ['preferred', 'feared', 'wild_card', 'negative']"))
+
+
+def _v27(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v28(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v29(instance, path, errors):
+    if not (isinstance(instance, str) or instance is None):
+        errors.append((path, f"{instance!r} is not of type 'string', 'null'"))
+
+
+def collect_errors(instance):
+    """Return `(path, message)` pairs for every violation in `instance`."""
+    errors = []
+    _v0(instance, (), errors)
+    return errors
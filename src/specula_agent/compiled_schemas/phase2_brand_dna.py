@@ -0,0 +1,366 @@
+"""Validator compiled from `schemas/phase2_brand_dna.schema.json`.
+
+Generated by `specula-agent compile-schemas`; do not edit by hand.
+"""
+
+from ._runtime import conforms, equal, is_integer, is_number
+
+SCHEMA_FILE = 'phase2_brand_dna.schema.json'
+SCHEMA_SHA256 = 'f7d4ada887bf93a32c52b9fba34fea435193ebdbead0694136b2f79a75446985'
+
+_C0 = ('meta', 'payload')
+_C1 = ('artifact_id', 'phase', 'mode', 'generated_at', 'validated_by_human', 'related_artifacts', 'decision_rationale', 'evidence_refs', 'tradeoffs', 'rejected_alternatives')
+_C2 = False
+_C3 = frozenset({'artifact_id', 'decision_rationale', 'evidence_refs', 'generated_at', 'mode', 'phase', 'rejected_alternatives', 'related_artifacts', 'tradeoffs', 'validated_by_human'})
+_C4 = ('brand_dna',)
+_C5 = ('radical_values', 'accepted_biases', 'moral_entity', 'refusal_zones', 'tensions')
+_C6 = ('value', 'tested_in', 'cost_paid')
+_C7 = frozenset({'cost_paid', 'tested_in', 'value'})
+_C8 = ('acceptable', 'unacceptable')
+_C9 = frozenset({'acceptable', 'unacceptable'})
+_C10 = frozenset({'accepted_biases', 'moral_entity', 'radical_values', 'refusal_zones', 'tensions'})
+_C11 = frozenset({'brand_dna'})
+_C12 = frozenset({'meta', 'payload'})
+
+
+def _v0(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C0:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'meta' in instance:
+            _v1(instance['meta'], path + ('meta',), errors)
+        if 'payload' in instance:
+            _v16(instance['payload'], path + ('payload',), errors)
+        extras = [key for key in instance if key not in _C12]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v1(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C1:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'artifact_id' in instance:
+            _v2(instance['artifact_id'], path + ('artifact_id',), errors)
+        if 'phase' in instance:
+            _v3(instance['phase'], path + ('phase',), errors)
+        if 'mode' in instance:
+            _v4(instance['mode'], path + ('mode',), errors)
+        if 'generated_at' in instance:
+            _v5(instance['generated_at'], path + ('generated_at',), errors)
+        if 'validated_by_human' in instance:
+            _v6(instance['validated_by_human'], path + ('validated_by_human',), errors)
+        if 'related_artifacts' in instance:
+            _v7(instance['related_artifacts'], path + ('related_artifacts',), errors)
+        if 'decision_rationale' in instance:
+            _v9(instance['decision_rationale'], path + ('decision_rationale',), errors)
+        if 'evidence_refs' in instance:
+            _v10(instance['evidence_refs'], path + ('evidence_refs',), errors)
+        if 'tradeoffs' in instance:
+            _v12(instance['tradeoffs'], path + ('tradeoffs',), errors)
+        if 'rejected_alternatives' in instance:
+            _v14(instance['rejected_alternatives'], path + ('rejected_alternatives',), errors)
+        extras = [key for key in instance if key not in _C3]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v2(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v3(instance, path, errors):
+    if not (instance == '2'):
+        errors.append((path, "'2' was expected"))
+
+
+def _v4(instance, path, errors):
+    if not (instance == 'brand_archaeology'):
+        errors.append((path, "'brand_archaeology' was expected"))
+
+
+def _v5(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not conforms(instance, 'date-time'):
+        errors.append((path, repr(instance) + " is not a 'date-time'"))
+
+
+def _v6(instance, path, errors):
+    if not (equal(instance, _C2)):
+        errors.append((path, 'False was expected'))
+
+
+def _v7(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v8(item, path + (index,), errors)
+
+
+def _v8(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v9(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v10(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v11(item, path + (index,), errors)
+
+
+def _v11(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v12(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v13(item, path + (index,), errors)
+
+
+def _v13(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v14(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v15(item, path + (index,), errors)
+
+
+def _v15(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v16(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C4:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'brand_dna' in instance:
+            _v17(instance['brand_dna'], path + ('brand_dna',), errors)
+        extras = [key for key in instance if key not in _C11]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v17(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C5:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'radical_values' in instance:
+            _v18(instance['radical_values'], path + ('radical_values',), errors)
+        if 'accepted_biases' in instance:
+            _v23(instance['accepted_biases'], path + ('accepted_biases',), errors)
+        if 'moral_entity' in instance:
+            _v25(instance['moral_entity'], path + ('moral_entity',), errors)
+        if 'refusal_zones' in instance:
+            _v26(instance['refusal_zones'], path + ('refusal_zones',), errors)
+        if 'tensions' in instance:
+            _v28(instance['tensions'], path + ('tensions',), errors)
+        extras = [key for key in instance if key not in _C10]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v18(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v19(item, path + (index,), errors)
+
+
+def _v19(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C6:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'value' in instance:
+            _v20(instance['value'], path + ('value',), errors)
+        if 'tested_in' in instance:
+            _v21(instance['tested_in'], path + ('tested_in',), errors)
+        if 'cost_paid' in instance:
+            _v22(instance['cost_paid'], path + ('cost_paid',), errors)
+        extras = [key for key in instance if key not in _C7]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v20(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v21(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v22(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v23(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v24(item, path + (index,), errors)
+
+
+def _v24(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v25(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v26(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v27(item, path + (index,), errors)
+
+
+def _v27(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v28(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C8:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'acceptable' in instance:
+            _v29(instance['acceptable'], path + ('acceptable',), errors)
+        if 'unacceptable' in instance:
+            _v31(instance['unacceptable'], path + ('unacceptable',), errors)
+        extras = [key for key in instance if key not in _C9]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v29(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v30(item, path + (index,), errors)
+
+
+def _v30(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v31(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v32(item, path + (index,), errors)
+
+
+def _v32(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def collect_errors(instance):
+    """Return `(path, message)` pairs for every violation in `instance`."""
+    errors = []
+    _v0(instance, (), errors)
+    return errors
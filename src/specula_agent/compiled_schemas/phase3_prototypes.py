@@ -0,0 +1,456 @@
+"""Validator compiled from `schemas/phase3_prototypes.schema.json`.
+
+Generated by `specula-agent compile-schemas`; do not edit by hand.
+"""
+
+from ._runtime import conforms, equal, is_integer, is_number
+
+SCHEMA_FILE = 'phase3_prototypes.schema.json'
+SCHEMA_SHA256 = 'ee4eaeac01906c61a54d072bcf574ff08e43b7b361c44afb6d31e01e79cad82d'
+
+_C0 = ('meta', 'payload')
+_C1 = ('artifact_id', 'phase', 'mode', 'generated_at', 'validated_by_human', 'related_artifacts', 'decision_rationale', 'evidence_refs', 'tradeoffs', 'rejected_alternatives')
+_C2 = frozenset({'ethical_gate', 'prototyping'})
+_C3 = False
+_C4 = frozenset({'artifact_id', 'decision_rationale', 'evidence_refs', 'generated_at', 'mode', 'phase', 'rejected_alternatives', 'related_artifacts', 'tradeoffs', 'validated_by_human'})
+_C5 = ('prototypes',)
+_C6 = ('prototype_id', 'scenario_id', 'description', 'role_in_future', 'stakeholder_impact', 'ethical_gate')
+_C7 = ('winners', 'losers')
+_C8 = frozenset({'losers', 'winners'})
+_C9 = ('status', 'violated_values', 'systemic_impact', 'question_1_value_violation_rationale', 'question_2_harmful_practice_rationale', 'question_3_unacceptable_dependency_rationale', 'reviewer_decision_refs')
+_C10 = frozenset({'FAIL', 'HOLD', 'PASS'})
+_C11 = frozenset({'aligned', 'misaligned'})
+_C12 = ('validator_role', 'decision', 'reference')
+_C13 = frozenset({'approve', 'hold', 'reject'})
+_C14 = frozenset({'decision', 'reference', 'validator_role'})
+_C15 = frozenset({'question_1_value_violation_rationale', 'question_2_harmful_practice_rationale', 'question_3_unacceptable_dependency_rationale', 'reviewer_decision_refs', 'status', 'systemic_impact', 'violated_values'})
+_C16 = frozenset({'description', 'ethical_gate', 'prototype_id', 'role_in_future', 'scenario_id', 'stakeholder_impact'})
+_C17 = frozenset({'prototypes'})
+_C18 = frozenset({'meta', 'payload'})
+
+
+def _v0(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C0:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'meta' in instance:
+            _v1(instance['meta'], path + ('meta',), errors)
+        if 'payload' in instance:
+            _v16(instance['payload'], path + ('payload',), errors)
+        extras = [key for key in instance if key not in _C18]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v1(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C1:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'artifact_id' in instance:
+            _v2(instance['artifact_id'], path + ('artifact_id',), errors)
+        if 'phase' in instance:
+            _v3(instance['phase'], path + ('phase',), errors)
+        if 'mode' in instance:
+            _v4(instance['mode'], path + ('mode',), errors)
+        if 'generated_at' in instance:
+            _v5(instance['generated_at'], path + ('generated_at',), errors)
+        if 'validated_by_human' in instance:
+            _v6(instance['validated_by_human'], path + ('validated_by_human',), errors)
+        if 'related_artifacts' in instance:
+            _v7(instance['related_artifacts'], path + ('related_artifacts',), errors)
+        if 'decision_rationale' in instance:
+            _v9(instance['decision_rationale'], path + ('decision_rationale',), errors)
+        if 'evidence_refs' in instance:
+            _v10(instance['evidence_refs'], path + ('evidence_refs',), errors)
+        if 'tradeoffs' in instance:
+            _v12(instance['tradeoffs'], path + ('tradeoffs',), errors)
+        if 'rejected_alternatives' in instance:
+            _v14(instance['rejected_alternatives'], path + ('rejected_alternatives',), errors)
+        extras = [key for key in instance if key not in _C4]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v2(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v3(instance, path, errors):
+    if not (instance == '3'):
+        errors.append((path, "'3' was expected"))
+
+
+def _v4(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not (isinstance(instance, str) and instance in _C2):
+        errors.append((path, repr(instance) + " is not one of ['prototyping', 'ethical_gate']"))
+
+
+def _v5(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not conforms(instance, 'date-time'):
+        errors.append((path, repr(instance) + " is not a 'date-time'"))
+
+
+def _v6(instance, path, errors):
+    if not (equal(instance, _C3)):
+        errors.append((path, 'False was expected'))
+
+
+def _v7(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v8(item, path + (index,), errors)
+
+
+def _v8(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v9(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v10(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v11(item, path + (index,), errors)
+
+
+def _v11(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v12(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v13(item, path + (index,), errors)
+
+
+def _v13(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v14(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v15(item, path + (index,), errors)
+
+
+def _v15(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v16(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C5:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'prototypes' in instance:
+            _v17(instance['prototypes'], path + ('prototypes',), errors)
+        extras = [key for key in instance if key not in _C17]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v17(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v18(item, path + (index,), errors)
+
+
+def _v18(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C6:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'prototype_id' in instance:
+            _v19(instance['prototype_id'], path + ('prototype_id',), errors)
+        if 'scenario_id' in instance:
+            _v20(instance['scenario_id'], path + ('scenario_id',), errors)
+        if 'description' in instance:
+            _v21(instance['description'], path + ('description',), errors)
+        if 'role_in_future' in instance:
+            _v22(instance['role_in_future'], path + ('role_in_future',), errors)
+        if 'stakeholder_impact' in instance:
+            _v23(instance['stakeholder_impact'], path + ('stakeholder_impact',), errors)
+        if 'ethical_gate' in instance:
+            _v28(instance['ethical_gate'], path + ('ethical_gate',), errors)
+        extras = [key for key in instance if key not in _C16]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v19(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v20(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v21(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v22(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v23(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C7:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'winners' in instance:
+            _v24(instance['winners'], path + ('winners',), errors)
+        if 'losers' in instance:
+            _v26(instance['losers'], path + ('losers',), errors)
+        extras = [key for key in instance if key not in _C8]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v24(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v25(item, path + (index,), errors)
+
+
+def _v25(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v26(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v27(item, path + (index,), errors)
+
+
+def _v27(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v28(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C9:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'status' in instance:
+            _v29(instance['status'], path + ('status',), errors)
+        if 'violated_values' in instance:
+            _v30(instance['violated_values'], path + ('violated_values',), errors)
+        if 'systemic_impact' in instance:
+            _v32(instance['systemic_impact'], path + ('systemic_impact',), errors)
+        if 'question_1_value_violation_rationale' in instance:
+            _v33(instance['question_1_value_violation_rationale'], path + ('question_1_value_violation_rationale',), errors)
+        if 'question_2_harmful_practice_rationale' in instance:
+            _v34(instance['question_2_harmful_practice_rationale'], path + ('question_2_harmful_practice_rationale',), errors)
+        if 'question_3_unacceptable_dependency_rationale' in instance:
+            _v35(instance['question_3_unacceptable_dependency_rationale'], path + ('question_3_unacceptable_dependency_rationale',), errors)
+        if 'reviewer_decision_refs' in instance:
+            _v36(instance['reviewer_decision_refs'], path + ('reviewer_decision_refs',), errors)
+        extras = [key for key in instance if key not in _C15]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v29(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not (isinstance(instance, str) and instance in _C10):
+        errors.append((path, repr(instance) + " is not one of ['PASS', 'FAIL', 'HOLD']"))
+
+
+def _v30(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v31(item, path + (index,), errors)
+
+
+def _v31(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v32(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not (isinstance(instance, str) and instance in _C11):
+        errors.append((path, repr(instance) + " is not one of ['aligned', 'misaligned']"))
+
+
+def _v33(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v34(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v35(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v36(instance, path, errors):
+    if not (isinstance(instance, list)):
+        errors.append((path, f"{instance!r} is not of type 'array'"))
+    if isinstance(instance, list) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+    if isinstance(instance, list):
+        for index, item in enumerate(instance):
+            _v37(item, path + (index,), errors)
+
+
+def _v37(instance, path, errors):
+    if not (isinstance(instance, dict)):
+        errors.append((path, f"{instance!r} is not of type 'object'"))
+    if isinstance(instance, dict):
+        for name in _C12:
+            if name not in instance:
+                errors.append((path, f"{name!r} is a required property"))
+        if 'validator_role' in instance:
+            _v38(instance['validator_role'], path + ('validator_role',), errors)
+        if 'decision' in instance:
+            _v39(instance['decision'], path + ('decision',), errors)
+        if 'reference' in instance:
+            _v40(instance['reference'], path + ('reference',), errors)
+        extras = [key for key in instance if key not in _C14]
+        if extras:
+            extras.sort(key=str)
+            verb = "was" if len(extras) == 1 else "were"
+            joined = ", ".join(repr(extra) for extra in extras)
+            errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _v38(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def _v39(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if not (isinstance(instance, str) and instance in _C13):
+        errors.append((path, repr(instance) + " is not one of ['approve', 'reject', 'hold']"))
+
+
+def _v40(instance, path, errors):
+    if not (isinstance(instance, str)):
+        errors.append((path, f"{instance!r} is not of type 'string'"))
+    if isinstance(instance, str) and len(instance) < 1:
+        errors.append((path, repr(instance) + ' should be non-empty'))
+
+
+def collect_errors(instance):
+    """Return `(path, message)` pairs for every violation in `instance`."""
+    errors = []
+    _v0(instance, (), errors)
+    return errors
@@ -0,0 +1,117 @@
+"""Lazily hydrated mappings for `ProjectState` sections loaded from JSON.
+
+`ProjectState.from_dict` wraps the raw `artifact_index` and
+`validation_records` dicts instead of copying and normalizing every entry, so
+loading a state costs the same whatever the project's history. Entries are
+converted the first time they are read; `raw()` hands the original dict back
+to `to_dict` when nothing changed, and otherwise only re-emits changed entries.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterator, MutableMapping, Optional, Set, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _accept_all(value: Any) -> bool:
+    return True
+
+
+class LazyMapping(MutableMapping[str, V]):
+    """Mapping over a raw dict whose values are hydrated on first access.
+
+    The raw dict is never modified: assignments and hydrated values live in an
+    overlay and deletions in a tombstone set. Raw entries rejected by `accept`
+    are invisible, as they would have been dropped by eager normalization.
+    """
+
+    def __init__(
+        self,
+        raw: Dict[str, Any],
+        hydrate: Callable[[Any], V] = _identity,
+        accept: Callable[[Any], bool] = _accept_all,
+    ) -> None:
+        self._raw = raw
+        self._hydrate = hydrate
+        self._accept = accept
+        self._values: Dict[str, V] = {}
+        self._deleted: Set[str] = set()
+        self._raw_size: Optional[int] = None
+
+    def _visible_raw(self, key: str) -> bool:
+        return key in self._raw and key not in self._deleted and self._accept(self._raw[key])
+
+    def __getitem__(self, key: str) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # Single pass without raising: `Mapping.get` would go through
+        # `__getitem__` and a caught KeyError for every missing key.
+        if key in self._values:
+            return self._values[key]
+        raw = self._raw.get(key, _MISSING) if isinstance(key, str) else _MISSING
+        if raw is _MISSING or key in self._deleted or (self._accept is not _accept_all and not self._accept(raw)):
+            return default
+        if self._hydrate is _identity:
+            # The raw object is the value; in-place changes already show up in `raw()`.
+            return raw
+        value = self._values[key] = self._hydrate(raw)
+        return value
+
+    def __setitem__(self, key: str, value: V) -> None:
+        self._values[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._values.pop(key, None)
+        if key in self._raw:
+            self._deleted.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or (isinstance(key, str) and self._visible_raw(key))
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._raw:
+            if key in self._values or self._visible_raw(key):
+                yield key
+        for key in self._values:
+            if key not in self._raw:
+                yield key
+
+    def __len__(self) -> int:
+        if self._raw_size is None:
+            self._raw_size = sum(1 for value in self._raw.values() if self._accept(value))
+        hidden = sum(1 for key in self._deleted if self._accept(self._raw[key]))
+        # Raw entries that were rejected but have since been assigned become visible.
+        revived = sum(1 for key in self._values if key in self._raw and not self._accept(self._raw[key]))
+        added = sum(1 for key in self._values if key not in self._raw)
+        return self._raw_size - hidden + revived + added
+
+    def raw(self) -> Dict[str, Any]:
+        """Return a JSON-ready dict; untouched entries are the original objects."""
+        if not self._values and not self._deleted:
+            return self._raw
+        merged = {key: value for key, value in self._raw.items() if key not in self._deleted}
+        merged.update(self._values)
+        return merged
+
+
+def section_dict(section: MutableMapping[str, Any]) -> Dict[str, Any]:
+    """JSON-ready form of a state section without materializing untouched lazy entries."""
+    if isinstance(section, dict):
+        return section
+    if isinstance(section, LazyMapping):
+        return section.raw()
+    return dict(section)
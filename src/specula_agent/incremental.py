@@ -0,0 +1,330 @@
+"""Incremental re-validation of artifacts edited through JSON Patch operations.
+
+`revalidate_artifact` applies an RFC 6902 change set to a previously validated
+artifact and re-runs schema validation only for the instance paths the patch
+touched. Errors reported elsewhere in the previous result are reused, so the
+cost of an edit follows the size of the change rather than the artifact.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .constants import ALLOWED_MODES, PHASE_SEQUENCE
+from .schemas import _REGISTRY, validate_artifact
+
+Path = Tuple[Any, ...]
+
+# Instance paths that select the schema and drive the canonical meta checks.
+_SCHEMA_SELECTORS: Tuple[Path, ...] = (("meta", "phase"), ("meta", "mode"))
+_DESCENDING_KEYWORDS = ("properties", "items", "additionalProperties")
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch operation cannot be applied."""
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"invalid JSON pointer `{pointer}`")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _copy_container(value: Any) -> Any:
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    raise JsonPatchError(f"cannot descend into {type(value).__name__}")
+
+
+def _array_index(container: List[Any], token: str, *, allow_end: bool) -> int:
+    if token == "-" and allow_end:
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise JsonPatchError(f"invalid array index `{token}`")
+    index = int(token)
+    limit = len(container) if allow_end else len(container) - 1
+    if index > limit:
+        raise JsonPatchError(f"array index `{token}` out of range")
+    return index
+
+
+def _resolve(document: Any, tokens: List[str]) -> Tuple[Any, Path]:
+    node = document
+    path: List[Any] = []
+    for token in tokens:
+        if isinstance(node, dict):
+            if token not in node:
+                raise JsonPatchError(f"path `/{'/'.join(tokens)}` does not exist")
+            node = node[token]
+            path.append(token)
+        elif isinstance(node, list):
+            index = _array_index(node, token, allow_end=False)
+            node = node[index]
+            path.append(index)
+        else:
+            raise JsonPatchError(f"path `/{'/'.join(tokens)}` does not exist")
+    return node, tuple(path)
+
+
+class _PatchedDocument:
+    """Copy-on-write view: containers are copied once along every modified path."""
+
+    def __init__(self, document: Any) -> None:
+        self.root = document
+        # Copies made by this patch, keyed by id and kept alive so ids stay unique.
+        self._owned: Dict[int, Any] = {}
+        # Each region is (instance path, deep) where deep means the whole subtree.
+        self.regions: List[Tuple[Path, bool]] = []
+
+    def _parent(self, tokens: List[str]) -> Tuple[Any, Path]:
+        if id(self.root) not in self._owned:
+            self.root = _copy_container(self.root)
+            self._owned[id(self.root)] = self.root
+        node = self.root
+        path: List[Any] = []
+        for token in tokens[:-1]:
+            if isinstance(node, dict):
+                if token not in node:
+                    raise JsonPatchError(f"path `/{'/'.join(tokens)}` does not exist")
+                key: Any = token
+            elif isinstance(node, list):
+                key = _array_index(node, token, allow_end=False)
+            else:
+                raise JsonPatchError(f"path `/{'/'.join(tokens)}` does not exist")
+            child = node[key]
+            if id(child) not in self._owned:
+                child = _copy_container(child)
+                node[key] = child
+                self._owned[id(child)] = child
+            node = child
+            path.append(key)
+        return node, tuple(path)
+
+    def add(self, tokens: List[str], value: Any) -> None:
+        if not tokens:
+            self.root = value
+            self.regions.append(((), True))
+            return
+        parent, parent_path = self._parent(tokens)
+        token = tokens[-1]
+        if isinstance(parent, dict):
+            existed = token in parent
+            parent[token] = value
+            if not existed:
+                self.regions.append((parent_path, False))
+            self.regions.append((parent_path + (token,), True))
+        elif isinstance(parent, list):
+            index = _array_index(parent, token, allow_end=True)
+            appended = index == len(parent)
+            parent.insert(index, value)
+            if appended:
+                self.regions.append((parent_path, False))
+                self.regions.append((parent_path + (index,), True))
+            else:
+                self.regions.append((parent_path, True))
+        else:
+            raise JsonPatchError(f"cannot add into {type(parent).__name__}")
+
+    def remove(self, tokens: List[str]) -> Any:
+        if not tokens:
+            raise JsonPatchError("cannot remove the document root")
+        parent, parent_path = self._parent(tokens)
+        token = tokens[-1]
+        if isinstance(parent, dict):
+            if token not in parent:
+                raise JsonPatchError(f"path `/{'/'.join(tokens)}` does not exist")
+            self.regions.append((parent_path, False))
+            self.regions.append((parent_path + (token,), True))
+            return parent.pop(token)
+        if isinstance(parent, list):
+            index = _array_index(parent, token, allow_end=False)
+            if index == len(parent) - 1:
+                self.regions.append((parent_path, False))
+                self.regions.append((parent_path + (index,), True))
+            else:
+                # Later items shift left, so the whole array is re-validated.
+                self.regions.append((parent_path, True))
+            return parent.pop(index)
+        raise JsonPatchError(f"cannot remove from {type(parent).__name__}")
+
+    def replace(self, tokens: List[str], value: Any) -> None:
+        if not tokens:
+            self.root = value
+            self.regions.append(((), True))
+            return
+        _resolve(self.root, tokens)
+        parent, parent_path = self._parent(tokens)
+        token = tokens[-1]
+        key: Any = token if isinstance(parent, dict) else _array_index(parent, token, allow_end=False)
+        parent[key] = value
+        self.regions.append((parent_path + (key,), True))
+
+
+def apply_json_patch(document: Any, operations: Iterable[Dict[str, Any]]) -> Tuple[Any, List[Tuple[Path, bool]]]:
+    """Apply RFC 6902 operations without mutating `document`.
+
+    Returns the patched document and the touched regions as `(path, deep)` pairs.
+    Untouched subtrees are shared with the input document.
+    """
+    patched = _PatchedDocument(document)
+    for operation in operations:
+        op = operation.get("op")
+        tokens = _parse_pointer(str(operation.get("path", "")))
+        if op == "add":
+            patched.add(tokens, operation["value"])
+        elif op == "remove":
+            patched.remove(tokens)
+        elif op == "replace":
+            patched.replace(tokens, operation["value"])
+        elif op == "move":
+            source = _parse_pointer(str(operation["from"]))
+            if tokens[: len(source)] == source and tokens != source:
+                raise JsonPatchError("cannot move a value into one of its children")
+            patched.add(tokens, patched.remove(source))
+        elif op == "copy":
+            value, _ = _resolve(patched.root, _parse_pointer(str(operation["from"])))
+            patched.add(tokens, value)
+        elif op == "test":
+            value, _ = _resolve(patched.root, tokens)
+            if value != operation["value"]:
+                raise JsonPatchError(f"test failed at `{operation.get('path')}`")
+        else:
+            raise JsonPatchError(f"unsupported patch operation `{op}`")
+    return patched.root, patched.regions
+
+
+def _subschema_at(schema: Any, path: Path) -> Optional[Dict[str, Any]]:
+    node = schema
+    for token in path:
+        if not isinstance(node, dict):
+            return None
+        if isinstance(token, int):
+            node = node.get("items")
+        elif token in node.get("properties", {}):
+            node = node["properties"][token]
+        elif isinstance(node.get("additionalProperties"), dict):
+            node = node["additionalProperties"]
+        else:
+            return None
+    return node if isinstance(node, dict) else None
+
+
+def _instance_at(document: Any, path: Path) -> Tuple[bool, Any]:
+    node = document
+    for token in path:
+        if isinstance(node, dict) and not isinstance(token, int) and token in node:
+            node = node[token]
+        elif isinstance(node, list) and isinstance(token, int) and token < len(node):
+            node = node[token]
+        else:
+            return False, None
+    return True, node
+
+
+def _shallow(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep a subschema's own keywords but stop it from descending into children."""
+    shallow = {key: value for key, value in schema.items() if key not in _DESCENDING_KEYWORDS}
+    if schema.get("additionalProperties") is False:
+        shallow["properties"] = {name: True for name in schema.get("properties", {})}
+        shallow["additionalProperties"] = False
+    return shallow
+
+
+def _covered(path: Path, deep: bool, regions: List[Tuple[Path, bool]]) -> bool:
+    for other, other_deep in regions:
+        if (other, other_deep) == (path, deep):
+            continue
+        if other_deep and path[: len(other)] == other and (len(other) < len(path) or not deep):
+            return True
+    return False
+
+
+def _format_path(path: Path) -> str:
+    return ".".join(str(item) for item in path) or "$"
+
+
+def _split_error(error: str) -> Tuple[str, str]:
+    path, _, message = error.partition(": ")
+    return path, message
+
+
+def validate_subtrees(artifact: Dict[str, Any], paths: Iterable[Path]) -> List[str]:
+    """Validate only the given instance paths of `artifact` against its schema.
+
+    Assumes `meta.phase` and `meta.mode` select a known schema; missing paths
+    are skipped. Errors use the same `path: message` format as `validate_artifact`.
+    """
+    meta = artifact.get("meta", {})
+    validator = _REGISTRY.get(str(meta.get("phase", "")), str(meta.get("mode", "")))
+    errors: List[Tuple[str, str]] = []
+    for path in paths:
+        subschema = _subschema_at(validator.schema, path)
+        exists, instance = _instance_at(artifact, path)
+        if subschema is None or not exists:
+            continue
+        for issue in validator.evolve(schema=subschema).iter_errors(instance):
+            errors.append((_format_path(path + tuple(issue.path)), issue.message))
+    return [f"{path}: {message}" for path, message in sorted(errors)]
+
+
+def revalidate_artifact(
+    previous: Dict[str, Any],
+    previous_errors: List[str],
+    patch: Iterable[Dict[str, Any]],
+    current_phase: str | None = None,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Apply `patch` to `previous` and return `(artifact, errors)`.
+
+    `previous_errors` must be the result of `validate_artifact(previous,
+    current_phase=current_phase)`. Only subschemas whose instance paths were
+    touched are re-validated; the output equals a full `validate_artifact` run.
+    """
+    artifact, regions = apply_json_patch(previous, patch)
+    if any(path == () for path, _ in regions) or not isinstance(artifact, dict):
+        # The whole document was replaced.
+        return artifact, validate_artifact(artifact, current_phase=current_phase)
+    # A change at or above `meta.phase`/`meta.mode` (e.g. replacing `meta`) can switch the schema.
+    if any(selector[: len(path)] == path for path, _ in regions for selector in _SCHEMA_SELECTORS):
+        return artifact, validate_artifact(artifact, current_phase=current_phase)
+
+    meta = artifact.get("meta", {})
+    phase = str(meta.get("phase", ""))
+    mode = str(meta.get("mode", ""))
+    if phase not in PHASE_SEQUENCE or mode not in ALLOWED_MODES:
+        return artifact, validate_artifact(artifact, current_phase=current_phase)
+
+    meta_errors: List[str] = []
+    if current_phase is not None and phase != str(current_phase):
+        meta_errors.append(f"meta.phase `{phase}` does not match current phase `{current_phase}`")
+    previous_schema_errors = list((Counter(previous_errors) - Counter(meta_errors)).elements())
+
+    regions = [region for region in dict.fromkeys(regions) if not _covered(*region, regions)]
+    deep_prefixes = [tuple(str(item) for item in path) for path, deep in regions if deep]
+    shallow_paths = {_format_path(path) for path, deep in regions if not deep}
+
+    def _stale(error_path: str) -> bool:
+        if error_path in shallow_paths:
+            return True
+        tokens = () if error_path == "$" else tuple(error_path.split("."))
+        return any(tokens[: len(prefix)] == prefix for prefix in deep_prefixes)
+
+    schema_errors = [
+        pair for pair in map(_split_error, previous_schema_errors) if not _stale(pair[0])
+    ]
+
+    validator = _REGISTRY.get(phase, mode)
+    for path, deep in regions:
+        subschema = _subschema_at(validator.schema, path)
+        exists, instance = _instance_at(artifact, path)
+        if subschema is None or not exists:
+            continue
+        scoped = validator.evolve(schema=subschema if deep else _shallow(subschema))
+        for issue in scoped.iter_errors(instance):
+            schema_errors.append((_format_path(path + tuple(issue.path)), issue.message))
+
+    return artifact, meta_errors + [f"{path}: {message}" for path, message in sorted(schema_errors)]
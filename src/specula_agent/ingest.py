@@ -0,0 +1,232 @@
+"""Bulk import of saved project states and NDJSON artifact dumps.
+
+Sources are streamed record by record into `ImportBatch` objects, and each
+batch is loaded by the storage adapter's `import_batch` (COPY into staging
+tables on PostgreSQL). Batches are written by a pool of worker threads, so
+parsing the next files overlaps with database work.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set
+from uuid import NAMESPACE_URL, uuid5
+
+from .state_codec import JSON, detect_codec
+from .state_store import JsonStateStore, journal_path
+from .storage import ImportBatch, StorageAdapter, StorageError
+
+IMPORT_SUFFIXES = (".json", ".ndjson", ".jsonl", ".spst", ".spstz")
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+DEFAULT_BATCH_SIZE = 200
+
+
+class IngestError(StorageError):
+    """Raised when an import source cannot be read."""
+
+
+@dataclass
+class ImportStats:
+    files: int = 0
+    records: int = 0
+    skipped: int = 0
+    rows: Dict[str, int] = field(default_factory=dict)
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rows_written(self) -> int:
+        return sum(self.rows.values())
+
+    def rows_per_second(self) -> float:
+        return self.rows_written / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def iter_import_paths(targets: Iterable[str]) -> Iterator[Path]:
+    """Expand files, directories (recursively) and glob patterns into import sources."""
+    seen: Set[Path] = set()
+    for target in targets:
+        path = Path(target)
+        if path.is_dir():
+            candidates = sorted(item for item in path.rglob("*") if item.suffix in IMPORT_SUFFIXES)
+        elif path.exists():
+            candidates = [path]
+        else:
+            candidates = sorted(Path(item) for item in glob.glob(target, recursive=True))
+        for candidate in candidates:
+            if candidate.is_file() and candidate not in seen:
+                seen.add(candidate)
+                yield candidate
+
+
+def iter_source_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the JSON objects in a state file (JSON or binary), artifact file or NDJSON dump."""
+    if path.suffix not in NDJSON_SUFFIXES:
+        raw = path.read_bytes()
+        codec = detect_codec(raw)
+        try:
+            # Plain JSON sources may be single artifacts, not only state snapshots.
+            record = json.loads(raw) if codec is JSON else codec.decode(raw)
+        except ValueError as exc:
+            label = "JSON" if codec is JSON else f"{codec.name} state"
+            raise IngestError(f"{path}: invalid {label} ({exc})") from exc
+        if isinstance(record, dict) and "artifact_index" in record and journal_path(path).exists():
+            # Changes since the last snapshot live in the state's journal.
+            record = JsonStateStore(path).load().to_dict()
+        yield record
+        return
+    with path.open("r", encoding="utf-8") as handle:
+        for number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                raise IngestError(f"{path}:{number}: invalid JSON ({exc})") from exc
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def _add_artifact(batch: ImportBatch, project_id: str, artifact: Dict[str, Any]) -> None:
+    meta = artifact["meta"]
+    batch.add(
+        "artifacts",
+        (
+            meta["artifact_id"],
+            project_id,
+            str(meta["phase"]),
+            meta["mode"],
+            meta["generated_at"],
+            bool(meta.get("validated_by_human", False)),
+            json.dumps(artifact.get("payload", {})),
+        ),
+    )
+    refusals = artifact.get("payload", {}).get("refusals")
+    for refusal in refusals if isinstance(refusals, list) else []:
+        batch.add(
+            "refusal_register",
+            (
+                refusal["refusal_id"],
+                project_id,
+                refusal["prototype_id"],
+                refusal["violated_value"],
+                refusal["opportunity_cost"],
+                refusal["identity_signal"],
+                refusal["date"],
+            ),
+        )
+
+
+def _add_state(batch: ImportBatch, state: Dict[str, Any], stats: ImportStats) -> None:
+    project_id = state["project_id"]
+    batch.add("projects", (project_id, project_id, str(state.get("current_phase", "0")), _now()))
+    artifact_index = state.get("artifact_index", {})
+    for artifact in artifact_index.values():
+        _add_artifact(batch, project_id, artifact)
+    for artifact_id, records in state.get("validation_records", {}).items():
+        if artifact_id not in artifact_index:
+            # The artifact row is not part of this state; importing would break the foreign key.
+            stats.skipped += len(records)
+            continue
+        for record in records:
+            batch.add(
+                "validations",
+                (
+                    # Deterministic id so re-importing the same state is idempotent.
+                    str(uuid5(NAMESPACE_URL, f"specula:{artifact_id}:{record['validator_id']}")),
+                    artifact_id,
+                    record["validator_id"],
+                    record["validator_role"],
+                    str(record["decision"]).lower(),
+                    record["validated_at"],
+                    bool(record["validated_by_human"]),
+                ),
+            )
+
+
+def add_record(
+    batch: ImportBatch,
+    record: Dict[str, Any],
+    stats: ImportStats,
+    *,
+    project_id: Optional[str] = None,
+) -> None:
+    """Add one source record: a saved state, `{"project_id", "artifact"}`, or a bare artifact."""
+    if "artifact_index" in record:
+        _add_state(batch, record, stats)
+        return
+    artifact = record.get("artifact", record)
+    owner = record.get("project_id") or project_id
+    if not isinstance(artifact, dict) or "meta" not in artifact:
+        raise IngestError("record is neither a project state nor an artifact")
+    if not owner:
+        raise IngestError(f"artifact `{artifact['meta'].get('artifact_id')}` has no project_id; pass --project-id")
+    batch.add_project_stub((owner, owner, str(artifact["meta"]["phase"]), _now()))
+    _add_artifact(batch, owner, artifact)
+
+
+def run_import(
+    storage: StorageAdapter,
+    targets: Iterable[str],
+    *,
+    on_conflict: str = "skip",
+    workers: int = 4,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    project_id: Optional[str] = None,
+    progress: Optional[Callable[[ImportStats], None]] = None,
+) -> ImportStats:
+    """Import every record under `targets`; returns the final statistics.
+
+    At most `2 * workers` batches are in flight, which bounds memory on large
+    imports. The first failing batch stops the import and re-raises its error.
+    """
+    if workers < 1 or batch_size < 1:
+        raise ValueError("workers and batch_size must be at least 1")
+    stats = ImportStats()
+    in_flight: Set["Future[Dict[str, int]]"] = set()
+
+    def _collect(done: Iterable["Future[Dict[str, int]]"]) -> None:
+        for future in done:
+            in_flight.discard(future)
+            for table, count in future.result().items():
+                stats.rows[table] = stats.rows.get(table, 0) + count
+            if progress is not None:
+                progress(stats)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="specula-import") as executor:
+
+        def _submit(batch: ImportBatch) -> None:
+            if len(in_flight) >= 2 * workers:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                _collect(done)
+            in_flight.add(executor.submit(storage.import_batch, batch, on_conflict=on_conflict))
+
+        batch = ImportBatch()
+        records_in_batch = 0
+        for path in iter_import_paths(targets):
+            stats.files += 1
+            for record in iter_source_records(path):
+                add_record(batch, record, stats, project_id=project_id)
+                stats.records += 1
+                records_in_batch += 1
+                if records_in_batch >= batch_size:
+                    _submit(batch)
+                    batch = ImportBatch()
+                    records_in_batch = 0
+        if len(batch):
+            _submit(batch)
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            _collect(done)
+    return stats
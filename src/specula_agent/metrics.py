@@ -0,0 +1,243 @@
+"""Instrumentation hooks for storage adapter calls.
+
+Storage adapters report one `CallMetrics` per public method call to their
+`metrics` hook: time spent waiting for a connection, time spent executing,
+rows affected or returned, and the error type if the call failed.
+`InMemoryMetrics` aggregates those into per-operation latency histograms for
+the CLI's `--stats` summary; other hooks can forward them to a metrics system.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+# Upper bounds in seconds; the last bucket is open-ended.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass
+class CallMetrics:
+    """Measurements of one adapter call.
+
+    `caller_seconds` is time spent in caller code while the call was open
+    (the body of a `unit_of_work`); it is excluded from `execute_seconds`.
+    """
+
+    operation: str
+    acquire_seconds: float = 0.0
+    execute_seconds: float = 0.0
+    caller_seconds: float = 0.0
+    connections: int = 0
+    rows: int = 0
+    error: Optional[str] = None
+
+
+class MetricsHook:
+    """No-op hook used when instrumentation is disabled."""
+
+    def observe(self, call: CallMetrics) -> None:
+        return
+
+
+_current_call: ContextVar[Optional[CallMetrics]] = ContextVar("specula_storage_call", default=None)
+
+
+@contextmanager
+def measure(hook: MetricsHook, operation: str) -> Iterator[CallMetrics]:
+    """Time a block as one call of `operation` and report it to `hook`.
+
+    Calls made while another call is being measured (an adapter method that
+    delegates to another one) are folded into the outer call.
+    """
+    outer = _current_call.get()
+    if outer is not None:
+        yield outer
+        return
+    call = CallMetrics(operation)
+    token = _current_call.set(call)
+    started = time.perf_counter()
+    try:
+        yield call
+    except BaseException as exc:
+        call.error = type(exc).__name__
+        raise
+    finally:
+        _current_call.reset(token)
+        elapsed = time.perf_counter() - started
+        call.execute_seconds = max(0.0, elapsed - call.acquire_seconds - call.caller_seconds)
+        hook.observe(call)
+
+
+@contextmanager
+def caller_block(call: CallMetrics) -> Iterator[None]:
+    """Hand control back to the caller; nested adapter calls are measured on their own."""
+    token = _current_call.set(None)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        call.caller_seconds += time.perf_counter() - started
+        _current_call.reset(token)
+
+
+def note_acquire(seconds: float) -> None:
+    """Record time spent obtaining a connection (or lock) for the current call."""
+    call = _current_call.get()
+    if call is not None:
+        call.acquire_seconds += seconds
+        call.connections += 1
+
+
+def note_rows(count: int) -> None:
+    """Record rows affected or returned by the current call; negative counts are ignored."""
+    call = _current_call.get()
+    if call is not None and count > 0:
+        call.rows += count
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def instrumented(method: F) -> F:
+    """Measure every call of an adapter method with the adapter's `metrics` hook."""
+    operation = method.__name__
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            with measure(self.metrics, operation):
+                return await method(self, *args, **kwargs)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with measure(self.metrics, operation):
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+class Histogram:
+    """Fixed-bucket histogram; quantiles are bucket upper bounds capped at the maximum."""
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= target:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+
+@dataclass
+class OperationStats:
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    connections: int = 0
+    acquire: Histogram = field(default_factory=Histogram)
+    execute: Histogram = field(default_factory=Histogram)
+    error_types: Dict[str, int] = field(default_factory=dict)
+
+
+class InMemoryMetrics(MetricsHook):
+    """Thread-safe in-process aggregation of adapter calls per operation."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.operations: Dict[str, OperationStats] = {}
+
+    def observe(self, call: CallMetrics) -> None:
+        with self._lock:
+            stats = self.operations.setdefault(call.operation, OperationStats())
+            stats.calls += 1
+            stats.rows += call.rows
+            stats.connections += call.connections
+            stats.acquire.add(call.acquire_seconds)
+            stats.execute.add(call.execute_seconds)
+            if call.error is not None:
+                stats.errors += 1
+                stats.error_types[call.error] = stats.error_types.get(call.error, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-operation totals and latency quantiles in seconds."""
+        with self._lock:
+            return {
+                operation: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "error_types": dict(stats.error_types),
+                    "rows": stats.rows,
+                    "connections": stats.connections,
+                    "acquire_seconds": stats.acquire.total,
+                    "execute_seconds": stats.execute.total,
+                    "execute_p50": stats.execute.quantile(0.5),
+                    "execute_p95": stats.execute.quantile(0.95),
+                    "execute_max": stats.execute.max,
+                }
+                for operation, stats in sorted(self.operations.items())
+            }
+
+    def format_summary(self, wall_seconds: Optional[float] = None) -> str:
+        """Render a table of the snapshot; with `wall_seconds`, also the share spent in storage."""
+        snapshot = self.snapshot()
+        lines: List[str] = [
+            f"{'operation':<24} {'calls':>6} {'errors':>6} {'rows':>8} "
+            f"{'acquire ms':>11} {'execute ms':>11} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}"
+        ]
+        storage_seconds = 0.0
+        for operation, row in snapshot.items():
+            storage_seconds += row["acquire_seconds"] + row["execute_seconds"]
+            lines.append(
+                f"{operation:<24} {row['calls']:>6} {row['errors']:>6} {row['rows']:>8} "
+                f"{row['acquire_seconds'] * 1000:>11.2f} {row['execute_seconds'] * 1000:>11.2f} "
+                f"{row['execute_p50'] * 1000:>8.2f} {row['execute_p95'] * 1000:>8.2f} {row['execute_max'] * 1000:>8.2f}"
+            )
+        if wall_seconds is not None and wall_seconds > 0:
+            lines.append(
+                f"storage {storage_seconds * 1000:.2f} ms of {wall_seconds * 1000:.2f} ms wall time "
+                f"({storage_seconds / wall_seconds:.0%}); "
+                f"{sum(row['connections'] for row in snapshot.values())} connection checkouts"
+            )
+        return "\n".join(lines)
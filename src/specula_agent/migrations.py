@@ -0,0 +1,387 @@
+"""Ordered schema migrations for the persistence layer.
+
+Each `Migration` is applied once and recorded in the `schema_version` table
+(`PRAGMA user_version` for the embedded SQLite schema).
+`sql/specula_persistence.sql` is generated from `MIGRATIONS` with
+`specula-agent export-sql`, so the exported file always matches what the
+runtime applies.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from textwrap import dedent
+from typing import List, Tuple
+
+SCHEMA_VERSION_SQL = dedent(
+    """
+    CREATE TABLE IF NOT EXISTS schema_version (
+      version INTEGER PRIMARY KEY,
+      name TEXT NOT NULL,
+      applied_at TIMESTAMP NOT NULL
+    );
+    """
+).strip()
+
+CURRENT_VERSION_SQL = "SELECT max(version) FROM schema_version"
+RECORD_VERSION_SQL = "INSERT INTO schema_version (version, name, applied_at) VALUES (%s, %s, %s)"
+# Serializes concurrent migrators; arbitrary constant shared by every runtime.
+MIGRATION_LOCK_ID = 0x5EC01A
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One forward-only schema change."""
+
+    version: int
+    name: str
+    sql: str
+
+
+MIGRATIONS: Tuple[Migration, ...] = (
+    Migration(
+        version=1,
+        name="initial_schema",
+        # IF NOT EXISTS keeps this safe on databases created before versioning.
+        sql=dedent(
+            """
+            CREATE TABLE IF NOT EXISTS projects (
+              project_id TEXT PRIMARY KEY,
+              name TEXT NOT NULL,
+              current_phase TEXT NOT NULL,
+              created_at TIMESTAMP NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS artifacts (
+              artifact_id TEXT PRIMARY KEY,
+              project_id TEXT NOT NULL REFERENCES projects(project_id),
+              phase TEXT NOT NULL,
+              mode TEXT NOT NULL,
+              generated_at TIMESTAMP NOT NULL,
+              validated_by_human BOOLEAN NOT NULL DEFAULT false,
+              payload JSONB NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS validations (
+              validation_id TEXT PRIMARY KEY,
+              artifact_id TEXT NOT NULL REFERENCES artifacts(artifact_id),
+              validator_id TEXT NOT NULL,
+              validator_role TEXT NOT NULL,
+              decision TEXT NOT NULL CHECK (decision IN ('approve', 'reject', 'hold')),
+              validated_at TIMESTAMP NOT NULL,
+              validated_by_human BOOLEAN NOT NULL,
+              UNIQUE (artifact_id, validator_id)
+            );
+
+            CREATE TABLE IF NOT EXISTS refusal_register (
+              refusal_id TEXT PRIMARY KEY,
+              project_id TEXT NOT NULL REFERENCES projects(project_id),
+              prototype_id TEXT NOT NULL,
+              violated_value TEXT NOT NULL,
+              opportunity_cost TEXT NOT NULL,
+              identity_signal TEXT NOT NULL,
+              refusal_date TIMESTAMP NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS guardian_reports (
+              guardian_id TEXT PRIMARY KEY,
+              project_id TEXT NOT NULL REFERENCES projects(project_id),
+              quarter TEXT NOT NULL,
+              divergence_level TEXT NOT NULL,
+              recommended_action TEXT NOT NULL,
+              report JSONB NOT NULL,
+              generated_at TIMESTAMP NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS audit_logs (
+              event_id TEXT PRIMARY KEY,
+              project_id TEXT NOT NULL REFERENCES projects(project_id),
+              phase TEXT,
+              mode TEXT,
+              event TEXT NOT NULL,
+              content TEXT NOT NULL,
+              created_at TIMESTAMP NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_artifacts_project_phase
+              ON artifacts(project_id, phase);
+
+            CREATE INDEX IF NOT EXISTS idx_refusals_project_value
+              ON refusal_register(project_id, violated_value);
+
+            CREATE INDEX IF NOT EXISTS idx_guardian_project_quarter
+              ON guardian_reports(project_id, quarter);
+
+            CREATE INDEX IF NOT EXISTS idx_audit_project_created
+              ON audit_logs(project_id, created_at);
+
+            CREATE INDEX IF NOT EXISTS idx_validations_artifact
+              ON validations(artifact_id);
+            """
+        ).strip(),
+    ),
+    Migration(
+        version=2,
+        name="partition_audit_logs_by_month",
+        # Rebuilds audit_logs as a monthly range-partitioned table; rows outside
+        # every monthly partition land in audit_logs_default until one exists.
+        sql=dedent(
+            """
+            ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned;
+            ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey;
+            ALTER INDEX idx_audit_project_created RENAME TO idx_audit_unpartitioned_project_created;
+
+            CREATE TABLE audit_logs (
+              event_id TEXT NOT NULL,
+              project_id TEXT NOT NULL REFERENCES projects(project_id),
+              phase TEXT,
+              mode TEXT,
+              event TEXT NOT NULL,
+              content TEXT NOT NULL,
+              created_at TIMESTAMP NOT NULL,
+              PRIMARY KEY (event_id, created_at)
+            ) PARTITION BY RANGE (created_at);
+
+            CREATE INDEX idx_audit_project_created
+              ON audit_logs(project_id, created_at);
+
+            CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT;
+
+            CREATE OR REPLACE FUNCTION specula_ensure_audit_partition(month_start DATE)
+            RETURNS TEXT
+            LANGUAGE plpgsql
+            AS $fn$
+            DECLARE
+              first_day DATE := date_trunc('month', month_start)::date;
+              next_day DATE := (date_trunc('month', month_start) + interval '1 month')::date;
+              partition_name TEXT := 'audit_logs_p' || to_char(month_start, 'YYYYMM');
+            BEGIN
+              IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN partition_name;
+              END IF;
+              PERFORM pg_advisory_xact_lock(hashtext('specula_audit_partitions'));
+              IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN partition_name;
+              END IF;
+              -- Rows that fell into the default partition move to the new one.
+              EXECUTE format('CREATE TABLE %I (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition_name);
+              EXECUTE format(
+                'WITH moved AS (DELETE FROM audit_logs_default WHERE created_at >= %L AND created_at < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                first_day, next_day, partition_name
+              );
+              EXECUTE format(
+                'ALTER TABLE audit_logs ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name, first_day, next_day
+              );
+              RETURN partition_name;
+            END;
+            $fn$;
+
+            SELECT specula_ensure_audit_partition(month::date)
+            FROM generate_series(
+              date_trunc('month', coalesce((SELECT min(created_at) FROM audit_logs_unpartitioned), now())),
+              date_trunc('month', now()) + interval '1 month',
+              interval '1 month'
+            ) AS month;
+
+            INSERT INTO audit_logs (event_id, project_id, phase, mode, event, content, created_at)
+            SELECT event_id, project_id, phase, mode, event, content, created_at
+            FROM audit_logs_unpartitioned;
+
+            DROP TABLE audit_logs_unpartitioned;
+            """
+        ).strip(),
+    ),
+    Migration(
+        version=3,
+        name="index_artifact_payloads",
+        # jsonb_path_ops serves `payload @> ...` containment (refusals by
+        # violated_value, guardian reports by action); the expression index
+        # serves equality on divergence_level; the last one backs keyset pages.
+        sql=dedent(
+            """
+            CREATE INDEX IF NOT EXISTS idx_artifacts_payload_path
+              ON artifacts USING GIN (payload jsonb_path_ops);
+
+            CREATE INDEX IF NOT EXISTS idx_artifacts_divergence_level
+              ON artifacts ((payload #>> '{guardian_report,divergence_level}'));
+
+            CREATE INDEX IF NOT EXISTS idx_artifacts_generated_id
+              ON artifacts(generated_at, artifact_id);
+            """
+        ).strip(),
+    ),
+)
+
+
+# Embedded SQLite schema, versioned with `PRAGMA user_version`. Timestamps are
+# ISO-8601 text and JSON columns are text checked with json_valid().
+SQLITE_MIGRATIONS: Tuple[Migration, ...] = (
+    Migration(
+        version=1,
+        name="initial_schema",
+        sql=dedent(
+            """
+            CREATE TABLE IF NOT EXISTS projects (
+              project_id TEXT PRIMARY KEY,
+              name TEXT NOT NULL,
+              current_phase TEXT NOT NULL,
+              created_at TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS artifacts (
+              artifact_id TEXT PRIMARY KEY,
+              project_id TEXT NOT NULL REFERENCES projects(project_id),
+              phase TEXT NOT NULL,
+              mode TEXT NOT NULL,
+              generated_at TEXT NOT NULL,
+              validated_by_human INTEGER NOT NULL DEFAULT 0,
+              payload TEXT NOT NULL CHECK (json_valid(payload))
+            );
+
+            CREATE TABLE IF NOT EXISTS validations (
+              validation_id TEXT PRIMARY KEY,
+              artifact_id TEXT NOT NULL REFERENCES artifacts(artifact_id),
+              validator_id TEXT NOT NULL,
+              validator_role TEXT NOT NULL,
+              decision TEXT NOT NULL CHECK (decision IN ('approve', 'reject', 'hold')),
+              validated_at TEXT NOT NULL,
+              validated_by_human INTEGER NOT NULL,
+              UNIQUE (artifact_id, validator_id)
+            );
+
+            CREATE TABLE IF NOT EXISTS refusal_register (
+              refusal_id TEXT PRIMARY KEY,
+              project_id TEXT NOT NULL REFERENCES projects(project_id),
+              prototype_id TEXT NOT NULL,
+              violated_value TEXT NOT NULL,
+              opportunity_cost TEXT NOT NULL,
+              identity_signal TEXT NOT NULL,
+              refusal_date TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS guardian_reports (
+              guardian_id TEXT PRIMARY KEY,
+              project_id TEXT NOT NULL REFERENCES projects(project_id),
+              quarter TEXT NOT NULL,
+              divergence_level TEXT NOT NULL,
+              recommended_action TEXT NOT NULL,
+              report TEXT NOT NULL CHECK (json_valid(report)),
+              generated_at TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS audit_logs (
+              event_id TEXT PRIMARY KEY,
+              project_id TEXT NOT NULL REFERENCES projects(project_id),
+              phase TEXT,
+              mode TEXT,
+              event TEXT NOT NULL,
+              content TEXT NOT NULL,
+              created_at TEXT NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_artifacts_project_phase
+              ON artifacts(project_id, phase);
+
+            CREATE INDEX IF NOT EXISTS idx_refusals_project_value
+              ON refusal_register(project_id, violated_value);
+
+            CREATE INDEX IF NOT EXISTS idx_guardian_project_quarter
+              ON guardian_reports(project_id, quarter);
+
+            CREATE INDEX IF NOT EXISTS idx_audit_project_created
+              ON audit_logs(project_id, created_at);
+
+            CREATE INDEX IF NOT EXISTS idx_validations_artifact
+              ON validations(artifact_id);
+            """
+        ).strip(),
+    ),
+    Migration(
+        version=2,
+        name="index_artifact_payloads",
+        # SQLite cannot index array elements, so refusal lookups still walk
+        # json_each() of each candidate row.
+        sql=dedent(
+            """
+            CREATE INDEX IF NOT EXISTS idx_artifacts_divergence_level
+              ON artifacts(json_extract(payload, '$.guardian_report.divergence_level'));
+
+            CREATE INDEX IF NOT EXISTS idx_artifacts_generated_id
+              ON artifacts(generated_at, artifact_id);
+            """
+        ).strip(),
+    ),
+)
+
+
+def _check_order(migrations: Tuple[Migration, ...]) -> None:
+    expected = list(range(1, len(migrations) + 1))
+    if [migration.version for migration in migrations] != expected:
+        raise ValueError("migrations must be numbered consecutively from 1")
+
+
+_check_order(MIGRATIONS)
+_check_order(SQLITE_MIGRATIONS)
+LATEST_VERSION = MIGRATIONS[-1].version
+SQLITE_LATEST_VERSION = SQLITE_MIGRATIONS[-1].version
+
+
+# Migration that introduced monthly audit partitions named `audit_logs_pYYYYMM`.
+AUDIT_PARTITIONING_VERSION = 2
+AUDIT_PARTITION_PREFIX = "audit_logs_p"
+# Schema version plus whether next month's audit partition exists, in one round trip.
+SCHEMA_STATUS_SQL = "SELECT (SELECT max(version) FROM schema_version), to_regclass(%s) IS NOT NULL"
+ENSURE_AUDIT_PARTITIONS_SQL = "SELECT specula_ensure_audit_partition(%s), specula_ensure_audit_partition(%s)"
+
+
+def month_start(value: date, months: int = 0) -> date:
+    """Return the first day of `value`'s month shifted by `months`."""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def audit_partition_name(month: date) -> str:
+    return f"{AUDIT_PARTITION_PREFIX}{month:%Y%m}"
+
+
+def pending_migrations(current_version: int, migrations: Tuple[Migration, ...] = MIGRATIONS) -> List[Migration]:
+    """Return migrations newer than `current_version`, in apply order."""
+    return [migration for migration in migrations if migration.version > current_version]
+
+
+def default_sql_path() -> Path:
+    return Path(__file__).resolve().parents[2] / "sql" / "specula_persistence.sql"
+
+
+def render_sql() -> str:
+    """Render every migration as one SQL script that can be re-run safely.
+
+    Each migration runs inside a guard that skips it when `schema_version`
+    already records it, mirroring what the runtime migrator does.
+    """
+    sections = [
+        "-- SPECULA runtime persistence schema (PostgreSQL)\n"
+        "-- Generated from src/specula_agent/migrations.py by `specula-agent export-sql`; do not edit.",
+        SCHEMA_VERSION_SQL,
+    ]
+    for migration in MIGRATIONS:
+        sections.append(
+            f"-- Migration {migration.version:04d}: {migration.name}\n"
+            "DO $migration$\n"
+            "BEGIN\n"
+            f"  IF EXISTS (SELECT 1 FROM schema_version WHERE version = {migration.version}) THEN\n"
+            "    RETURN;\n"
+            "  END IF;\n"
+            "  EXECUTE $sql$\n"
+            f"{migration.sql}\n"
+            "$sql$;\n"
+            "  INSERT INTO schema_version (version, name, applied_at)\n"
+            f"  VALUES ({migration.version}, '{migration.name}', now());\n"
+            "END\n"
+            "$migration$;"
+        )
+    return "\n\n".join(sections) + "\n"
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import copy
+import random
+import re
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Set, Tuple
 from uuid import uuid4
 
 from .constants import NEXT_PHASE, PHASE_DEFAULT_MODE, PHASE_SEQUENCE
+from .hydration import LazyMapping, section_dict
 from .llm import LLMClient, LLMProviderError
 from .policy import validate_assistant_text
-from .schemas import assert_artifact_valid
+from .schemas import SchemaValidationError, assert_artifact_valid, loaded_schema_fingerprint, schema_fingerprint
 
 VALIDATION_DECISIONS = {"approve", "reject", "hold"}
 PHASE_PREREQUISITES = {
@@ -26,6 +30,91 @@ PHASE_PREREQUISITES = {
 PHASE_ORDER = {phase: idx for idx, phase in enumerate(PHASE_SEQUENCE)}
 
 
+# How trusted-template mode re-checks a field that changes on every step: these
+# are direct checks of what `generate_step` and `build_payload_template` write,
+# much cheaper than running the schema validator on each path.
+SLOT_ID = "id"
+SLOT_TIMESTAMP = "timestamp"
+SLOT_ID_LIST = "id_list"
+
+# Fields of a generated artifact that change on every step; in trusted-template
+# mode these are the only ones re-checked once a template has been verified.
+TRUSTED_DYNAMIC_PATHS: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("meta", "artifact_id"), SLOT_ID),
+    (("meta", "generated_at"), SLOT_TIMESTAMP),
+    (("meta", "related_artifacts"), SLOT_ID_LIST),
+)
+# (phase, mode, schema digest) combinations whose template passed full validation.
+_VERIFIED_TEMPLATES: Set[Tuple[str, str, str]] = set()
+
+# Payload paths that `build_payload_template` fills with a fresh id or timestamp
+# on every call, per phase (and Phase 3 mode). Trusted-template mode re-checks them.
+_TEMPLATE_SLOTS: Dict[Tuple[str, str], Tuple[Tuple[Tuple[Any, ...], str], ...]] = {
+    ("1", ""): ((("scenarios", 0, "scenario_id"), SLOT_ID),),
+    ("1.5", ""): ((("white_spaces", 0, "white_space_id"), SLOT_ID),),
+    ("3", "refusal_register"): (
+        (("refusals", 0, "refusal_id"), SLOT_ID),
+        (("refusals", 0, "prototype_id"), SLOT_ID),
+        (("refusals", 0, "date"), SLOT_TIMESTAMP),
+    ),
+    ("3", ""): (
+        (("prototypes", 0, "prototype_id"), SLOT_ID),
+        (("prototypes", 0, "scenario_id"), SLOT_ID),
+    ),
+}
+
+# `<prefix>-<uuid4>`, as written by `generate_step` and `build_payload_template`.
+_GENERATED_ID = re.compile(r"[a-z]+(?:-[a-z]+)*-[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z")
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})\Z")
+_MISSING_SLOT = object()
+
+
+def _template_slots(phase: str, mode: str) -> Tuple[Tuple[Tuple[Any, ...], str], ...]:
+    # Only Phase 3 has a mode-specific payload shape.
+    key = (phase, "refusal_register" if phase == "3" and mode == "refusal_register" else "")
+    return _TEMPLATE_SLOTS.get(key, ())
+
+
+def template_slot_paths(phase: str, mode: str) -> Tuple[Tuple[Any, ...], ...]:
+    """Return payload paths that receive fresh ids or timestamps on every call."""
+    return tuple(path for path, _ in _template_slots(phase, mode))
+
+
+def _slot_error(kind: str, value: Any) -> Optional[str]:
+    """Return why `value` is not a valid `kind` slot value, or None."""
+    if kind == SLOT_ID:
+        if isinstance(value, str) and _GENERATED_ID.match(value):
+            return None
+        return f"{value!r} is not a generated id"
+    if kind == SLOT_TIMESTAMP:
+        if isinstance(value, str) and _TIMESTAMP.match(value):
+            try:
+                datetime.fromisoformat(value.replace("Z", "+00:00"))
+                return None
+            except ValueError:
+                pass
+        return f"{value!r} is not a 'date-time'"
+    if isinstance(value, list) and all(isinstance(item, str) and item for item in value):
+        return None
+    return f"{value!r} is not a list of non-empty strings"
+
+
+def _slot_errors(artifact: Dict[str, Any], slots: Tuple[Tuple[Tuple[Any, ...], str], ...]) -> List[str]:
+    errors: List[str] = []
+    for path, kind in slots:
+        value: Any = artifact
+        for key in path:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                value = _MISSING_SLOT
+                break
+        message = "is missing" if value is _MISSING_SLOT else _slot_error(kind, value)
+        if message is not None:
+            errors.append(f"{'.'.join(str(key) for key in path)}: {message}")
+    return errors
+
+
 GUARDIAN_CRITICAL_LEVELS = {"critical"}
 GUARDIAN_RESPÉCULATE_ACTIONS = {"re_speculate"}
 
@@ -62,9 +151,12 @@ class ProjectState:
     current_phase: str = "0"
     latest_artifacts: Dict[str, str] = field(default_factory=dict)
     phase_validated_artifacts: Dict[str, str] = field(default_factory=dict)
-    artifact_index: Dict[str, Dict[str, Any]] = field(default_factory=dict)
-    validation_records: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    # A plain dict, or a lazily loading mapping from `state_store.SegmentedStateStore`.
+    artifact_index: MutableMapping[str, Dict[str, Any]] = field(default_factory=dict)
+    validation_records: MutableMapping[str, List[Dict[str, Any]]] = field(default_factory=dict)
     continuity_context: Dict[str, List[str]] = field(default_factory=_default_continuity_context)
+    # Changes made through the methods below since the last save, replayable with `apply_change`.
+    changes: List[Dict[str, Any]] = field(default_factory=list, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProjectState":
@@ -79,39 +171,21 @@ class ProjectState:
                 else:
                     continuity[key] = _normalize_str_list(raw_continuity.get(key, []))
 
+        # Artifacts and validation rows grow with the project's history; they are
+        # wrapped rather than copied and each entry is normalized on first access.
         raw_validation_records = data.get("validation_records", {})
-        validation_records: Dict[str, List[Dict[str, Any]]] = {}
-        if isinstance(raw_validation_records, dict):
-            for artifact_id, rows in raw_validation_records.items():
-                if not isinstance(rows, list):
-                    continue
-                clean_rows: List[Dict[str, Any]] = []
-                for row in rows:
-                    if not isinstance(row, dict):
-                        continue
-                    validator_id = str(row.get("validator_id", "")).strip()
-                    validator_role = str(row.get("validator_role", "")).strip()
-                    decision = str(row.get("decision", "hold")).lower().strip()
-                    if not validator_id or not validator_role or decision not in VALIDATION_DECISIONS:
-                        continue
-                    clean_rows.append(
-                        {
-                            "validator_id": validator_id,
-                            "validator_role": validator_role,
-                            "decision": decision,
-                            "validated_by_human": bool(row.get("validated_by_human", False)),
-                            "validated_at": str(row.get("validated_at") or _now_iso()),
-                        }
-                    )
-                validation_records[str(artifact_id)] = clean_rows
-
+        raw_artifact_index = data.get("artifact_index", {})
         return cls(
             project_id=data["project_id"],
             current_phase=str(data.get("current_phase", "0")),
             latest_artifacts=dict(data.get("latest_artifacts", {})),
             phase_validated_artifacts=dict(data.get("phase_validated_artifacts", {})),
-            artifact_index=dict(data.get("artifact_index", {})),
-            validation_records=validation_records,
+            artifact_index=LazyMapping(raw_artifact_index if isinstance(raw_artifact_index, dict) else {}),
+            validation_records=LazyMapping(
+                raw_validation_records if isinstance(raw_validation_records, dict) else {},
+                hydrate=_normalize_validation_rows,
+                accept=lambda rows: isinstance(rows, list),
+            ),
             continuity_context=continuity,
         )
 
@@ -121,8 +195,8 @@ class ProjectState:
             "current_phase": self.current_phase,
             "latest_artifacts": self.latest_artifacts,
             "phase_validated_artifacts": self.phase_validated_artifacts,
-            "artifact_index": self.artifact_index,
-            "validation_records": self.validation_records,
+            "artifact_index": section_dict(self.artifact_index),
+            "validation_records": section_dict(self.validation_records),
             "continuity_context": self.continuity_context,
         }
 
@@ -152,20 +226,91 @@ class ProjectState:
                 f"duplicate validator signature is not allowed for `{artifact_key}` and `{validator_key}`"
             )
 
-        rows.append(
+        row = {
+            "validator_id": validator_key,
+            "validator_role": role_key,
+            "decision": decision_key,
+            "validated_by_human": bool(validated_by_human),
+            "validated_at": _now_iso(),
+        }
+        rows.append(row)
+        self.changes.append({"op": "validation", "artifact_id": artifact_key, "record": dict(row)})
+
+    def record_artifact(self, phase: str, artifact: Dict[str, Any]) -> None:
+        """Index a generated artifact and make it the latest one for `phase`."""
+        artifact_id = artifact["meta"]["artifact_id"]
+        self.latest_artifacts[phase] = artifact_id
+        self.artifact_index[artifact_id] = artifact
+        self.changes.append({"op": "artifact", "phase": phase, "artifact": artifact})
+
+    def mark_phase_validated(self, phase: str, artifact_id: str, next_phase: str) -> None:
+        """Record `artifact_id` as the validated output of `phase` and move to `next_phase`."""
+        self.latest_artifacts[phase] = artifact_id
+        self.phase_validated_artifacts[phase] = artifact_id
+        self.current_phase = next_phase
+        self.changes.append(
             {
-                "validator_id": validator_key,
-                "validator_role": role_key,
-                "decision": decision_key,
-                "validated_by_human": bool(validated_by_human),
-                "validated_at": _now_iso(),
+                "op": "advance",
+                "phase": phase,
+                "artifact_id": artifact_id,
+                "current_phase": next_phase,
+                # Continuity lists are deduplicated and trimmed, so the result is recorded.
+                "continuity_context": copy.deepcopy(self.continuity_context),
             }
         )
 
+    def apply_change(self, change: Dict[str, Any]) -> None:
+        """Replay one entry of `changes` (from a state journal) without recording it again."""
+        op = change.get("op")
+        if op == "artifact":
+            artifact = change["artifact"]
+            self.latest_artifacts[change["phase"]] = artifact["meta"]["artifact_id"]
+            self.artifact_index[artifact["meta"]["artifact_id"]] = artifact
+        elif op == "validation":
+            rows = self.validation_records.setdefault(change["artifact_id"], [])
+            record = change["record"]
+            if not any(row.get("validator_id") == record["validator_id"] for row in rows):
+                rows.append(dict(record))
+        elif op == "advance":
+            self.latest_artifacts[change["phase"]] = change["artifact_id"]
+            self.phase_validated_artifacts[change["phase"]] = change["artifact_id"]
+            self.current_phase = change["current_phase"]
+            self.continuity_context = copy.deepcopy(change["continuity_context"])
+        else:
+            raise ValueError(f"unknown state change `{op}`")
+
+    def drain_changes(self) -> List[Dict[str, Any]]:
+        """Return and clear the changes recorded since the last call."""
+        changes, self.changes = self.changes, []
+        return changes
+
     def validation_snapshot(self, artifact_id: str) -> List[Dict[str, Any]]:
         return list(self.validation_records.get(str(artifact_id), []))
 
 
+def _normalize_validation_rows(rows: List[Any]) -> List[Dict[str, Any]]:
+    """Drop malformed validation rows and normalize the rest."""
+    clean_rows: List[Dict[str, Any]] = []
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        validator_id = str(row.get("validator_id", "")).strip()
+        validator_role = str(row.get("validator_role", "")).strip()
+        decision = str(row.get("decision", "hold")).lower().strip()
+        if not validator_id or not validator_role or decision not in VALIDATION_DECISIONS:
+            continue
+        clean_rows.append(
+            {
+                "validator_id": validator_id,
+                "validator_role": validator_role,
+                "decision": decision,
+                "validated_by_human": bool(row.get("validated_by_human", False)),
+                "validated_at": str(row.get("validated_at") or _now_iso()),
+            }
+        )
+    return clean_rows
+
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
@@ -380,11 +525,46 @@ def build_payload_template(phase: str, mode: str) -> Dict[str, Any]:
 
 
 class SpeculaOrchestrator:
-    """State-aware orchestrator that emits validated artifacts."""
+    """State-aware orchestrator that emits validated artifacts.
+
+    Artifacts are looked up in `state.artifact_index` first, then in
+    `artifact_source` (for example an `artifact_archive.ArtifactArchive`), so
+    older artifacts can stay on disk instead of in the state.
+    """
 
-    def __init__(self, state: ProjectState, llm_client: LLMClient | None = None) -> None:
+    def __init__(
+        self,
+        state: ProjectState,
+        llm_client: LLMClient | None = None,
+        *,
+        trusted_templates: bool = False,
+        full_validation_rate: float = 0.0,
+        rng: Optional[random.Random] = None,
+        artifact_source: Optional[Mapping[str, Dict[str, Any]]] = None,
+    ) -> None:
+        if not 0.0 <= full_validation_rate <= 1.0:
+            raise ValueError("full_validation_rate must be between 0 and 1")
         self.state = state
         self.llm_client = llm_client
+        self.trusted_templates = trusted_templates
+        self.full_validation_rate = full_validation_rate
+        self.artifact_source = artifact_source
+        self._rng = rng or random.Random()
+
+    def resolve_artifact(self, artifact_id: str) -> Optional[Dict[str, Any]]:
+        """Return the artifact from the state or, failing that, from `artifact_source`."""
+        artifact = self.state.artifact_index.get(artifact_id)
+        if artifact is None and self.artifact_source is not None:
+            artifact = self.artifact_source.get(artifact_id)
+        return artifact
+
+    def resolve_related_artifacts(self, artifact_id: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Resolve an artifact's `meta.related_artifacts`; ids that cannot be found map to None."""
+        artifact = self.resolve_artifact(artifact_id)
+        if artifact is None:
+            raise ValueError(f"artifact `{artifact_id}` is not available in state context")
+        related = artifact.get("meta", {}).get("related_artifacts", [])
+        return {str(related_id): self.resolve_artifact(str(related_id)) for related_id in related}
 
     def generate_step(self, user_input: str, phase: str | None = None, mode: str | None = None) -> Dict[str, Any]:
         if not user_input or not user_input.strip():
@@ -430,15 +610,43 @@ class SpeculaOrchestrator:
         if text_errors:
             raise ValueError("assistant text validation failed:\n" + "\n".join(text_errors))
 
-        assert_artifact_valid(artifact, current_phase=selected_phase)
-        self.state.latest_artifacts[selected_phase] = artifact_id
-        self.state.artifact_index[artifact_id] = artifact
+        self._assert_generated_artifact_valid(artifact, phase=selected_phase, mode=selected_mode)
+        self.state.record_artifact(selected_phase, artifact)
 
         return {
             "assistant_text": assistant_text,
             "artifact": artifact,
         }
 
+    def _assert_generated_artifact_valid(self, artifact: Dict[str, Any], *, phase: str, mode: str) -> None:
+        """Validate a generated artifact, trusting verified templates when enabled.
+
+        In trusted-template mode the first artifact per phase/mode (and schema
+        version) gets full validation; later ones only check the values at
+        `TRUSTED_DYNAMIC_PATHS` and the payload's id/timestamp slots, with
+        direct type and format checks rather than the schema validator. A
+        `full_validation_rate` sample still runs full validation to catch
+        template/schema drift.
+        """
+        if not self.trusted_templates:
+            assert_artifact_valid(artifact, current_phase=phase)
+            return
+
+        # The digest of the schema the registry last loaded: no stat per step.
+        # Full validation (first use, samples) reloads a changed schema file,
+        # which changes the digest and retires the verified template.
+        fingerprint = loaded_schema_fingerprint(phase, mode)
+        sampled = self.full_validation_rate > 0 and self._rng.random() < self.full_validation_rate
+        if fingerprint is None or (phase, mode, fingerprint) not in _VERIFIED_TEMPLATES or sampled:
+            assert_artifact_valid(artifact, current_phase=phase)
+            _VERIFIED_TEMPLATES.add((phase, mode, schema_fingerprint(phase, mode)))
+            return
+
+        payload_slots = tuple((("payload",) + path, kind) for path, kind in _template_slots(phase, mode))
+        errors = _slot_errors(artifact, TRUSTED_DYNAMIC_PATHS + payload_slots)
+        if errors:
+            raise SchemaValidationError("\n".join(errors))
+
     def refusals_due_for_review(self, reference_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Return refusal_learning entries whose review_after date has passed.
 
@@ -508,16 +716,14 @@ class SpeculaOrchestrator:
             raise ValueError(
                 f"phase mismatch: current phase is `{self.state.current_phase}` but received `{phase}`"
             )
-        artifact = self.state.artifact_index.get(artifact_id)
+        artifact = self.resolve_artifact(artifact_id)
         if artifact is None:
             raise ValueError(f"artifact `{artifact_id}` is not available in state context")
         self._assert_validation_requirements(artifact_id=artifact_id, validations=validations)
 
-        self.state.latest_artifacts[phase] = artifact_id
-        self.state.phase_validated_artifacts[phase] = artifact_id
         self._update_continuity_context(phase=phase, artifact=artifact, validations=validations)
         next_phase = NEXT_PHASE[phase]
-        self.state.current_phase = next_phase
+        self.state.mark_phase_validated(phase, artifact_id, next_phase)
         return next_phase
 
     def _assert_phase_prerequisites(self, phase: str) -> None:
@@ -556,7 +762,7 @@ class SpeculaOrchestrator:
         # dissent_log must be non-empty (active dissent collection is mandatory) and
         # rejected_changes must be explicitly present (even if empty list) so the
         # co-creation record is unambiguous about what was declined.
-        artifact = self.state.artifact_index.get(artifact_id, {})
+        artifact = self.resolve_artifact(artifact_id) or {}
         phase = str(artifact.get("meta", {}).get("phase", ""))
         if phase == "5":
             co_creation = artifact.get("payload", {}).get("co_creation", {})
@@ -580,7 +786,7 @@ class SpeculaOrchestrator:
         )
         recent = []
         for phase, artifact_id in validated[-4:]:
-            artifact = self.state.artifact_index.get(artifact_id, {})
+            artifact = self.resolve_artifact(artifact_id) or {}
             recent.append(
                 {
                     "phase": phase,
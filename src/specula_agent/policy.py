@@ -2,20 +2,110 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from .cache import get_validation_cache
 from .constants import FORBIDDEN_PHRASES
 
 HEADER_RE = re.compile(r"^MODE:\s+([a-z_]+)\s+\|\s+PHASE:\s+(0|1|1\.5|2|3|4|5|6)$")
+DECISION_MARKERS = ("decision: true", "decision=true")
+
+
+class PhraseMatcher:
+    """Case-folded, word-bounded phrase search.
+
+    A candidate phrase is confirmed with a plain substring test and then its
+    precompiled word-boundary regex, so a match only counts when it is not
+    glued to surrounding word characters. With `INDEX_MIN_PHRASES` or more
+    phrases, candidates are narrowed by first word: the text is split into
+    words once and only phrases whose first word occurs in it are checked,
+    so the cost grows with the matching phrases rather than the phrase count.
+    Smaller lists are scanned directly, which is cheaper than splitting.
+    """
+
+    INDEX_MIN_PHRASES = 32
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self.phrases: Tuple[str, ...] = tuple(phrase.casefold() for phrase in phrases)
+        if not all(self.phrases):
+            raise ValueError("phrases cannot be empty")
+        self._patterns: Tuple[re.Pattern[str], ...] = tuple(re.compile(_bounded(phrase)) for phrase in self.phrases)
+        self._by_first_word: Optional[Dict[str, List[int]]] = None
+        # Phrases starting with punctuation or space can begin anywhere.
+        self._unanchored: List[int] = []
+        if len(self.phrases) >= self.INDEX_MIN_PHRASES:
+            self._by_first_word = {}
+            for index, phrase in enumerate(self.phrases):
+                if _is_word_char(phrase[0]):
+                    first_word = phrase.translate(_WORD_SEPARATORS).split()[0]
+                    self._by_first_word.setdefault(first_word, []).append(index)
+                else:
+                    self._unanchored.append(index)
+
+    def find(self, text: str) -> Set[int]:
+        """Return indices of every phrase occurring in `text` (case-folded)."""
+        folded = text.casefold()
+        candidates: Iterable[int] = range(len(self.phrases))
+        if self._by_first_word is not None:
+            # A bounded match starts a word, and that whole word is the phrase's first word.
+            words = self._by_first_word.keys() & folded.translate(_WORD_SEPARATORS).split()
+            candidates = self._unanchored + [index for word in words for index in self._by_first_word[word]]
+        return {index for index in candidates if self.phrases[index] in folded and self._patterns[index].search(folded)}
+
+
+class _WordSeparators(dict):
+    """`str.translate` table mapping every non-word character to a space."""
+
+    def __missing__(self, codepoint: int) -> int:
+        mapped = codepoint if _is_word_char(chr(codepoint)) else ord(" ")
+        self[codepoint] = mapped
+        return mapped
+
+
+_WORD_SEPARATORS = _WordSeparators()
+
+
+def _bounded(phrase: str) -> str:
+    """Regex for `phrase` that refuses to extend a word on either side."""
+    prefix = r"(?<!\w)" if _is_word_char(phrase[0]) else ""
+    suffix = r"(?!\w)" if _is_word_char(phrase[-1]) else ""
+    return prefix + re.escape(phrase) + suffix
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+_PHRASE_MATCHER = PhraseMatcher(FORBIDDEN_PHRASES + DECISION_MARKERS)
+# Cache namespace for text results; changes whenever the rule inputs change.
+POLICY_FINGERPRINT = hashlib.sha256(
+    repr((HEADER_RE.pattern, FORBIDDEN_PHRASES, DECISION_MARKERS)).encode("utf-8")
+).hexdigest()
 
 
 def validate_assistant_text(text: str) -> List[str]:
     """Validate non-oracular and formatting constraints for assistant output."""
-    errors: List[str] = []
     if not text or not text.strip():
         return ["assistant text is empty"]
 
+    cache = get_validation_cache()
+    if cache is None:
+        return _check_assistant_text(text)
+    namespace = f"policy-{POLICY_FINGERPRINT}"
+    key = hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+    cached = cache.get(namespace, key)
+    if cached is not None:
+        return cached
+    errors = _check_assistant_text(text)
+    cache.put(namespace, key, errors)
+    return errors
+
+
+def _check_assistant_text(text: str) -> List[str]:
+    errors: List[str] = []
+
     lines = text.strip().splitlines()
     if not HEADER_RE.match(lines[0].strip()):
         errors.append("first line must match `MODE: <mode> | PHASE: <phase>`")
@@ -31,12 +121,12 @@ def validate_assistant_text(text: str) -> List[str]:
         if question_line_idx > 6:
             errors.append("assistant text has more than 6 lines before the question line")
 
-    lowered = text.lower()
-    for phrase in FORBIDDEN_PHRASES:
-        if phrase in lowered:
+    matched = _PHRASE_MATCHER.find(text)
+    for index, phrase in enumerate(FORBIDDEN_PHRASES):
+        if index in matched:
             errors.append(f"forbidden prescriptive phrase detected: `{phrase}`")
 
-    if "decision: true" in lowered or "decision=true" in lowered:
+    if any(index >= len(FORBIDDEN_PHRASES) for index in matched):
         errors.append("forbidden decision field detected in assistant text")
 
     return errors
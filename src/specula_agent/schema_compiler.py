@@ -0,0 +1,228 @@
+"""Ahead-of-time compiler from phase JSON Schemas to plain-Python validators.
+
+The generated modules live in `specula_agent.compiled_schemas` and reproduce the
+`(path, message)` pairs that jsonschema's Draft 2020-12 validator reports for
+the keyword subset used by `schemas/*.schema.json`. Each module records the
+SHA-256 of its source schema so stale modules are ignored at runtime.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ANNOTATION_KEYWORDS = {"$schema", "$id", "$comment", "title", "description", "default", "examples"}
+SUPPORTED_KEYWORDS = {
+    "type",
+    "const",
+    "enum",
+    "format",
+    "minLength",
+    "minItems",
+    "required",
+    "properties",
+    "additionalProperties",
+    "items",
+}
+
+TYPE_CHECKS = {
+    "object": "isinstance({var}, dict)",
+    "array": "isinstance({var}, list)",
+    "string": "isinstance({var}, str)",
+    "boolean": "isinstance({var}, bool)",
+    "null": "{var} is None",
+    "number": "is_number({var})",
+    "integer": "is_integer({var})",
+}
+
+
+class SchemaCompileError(ValueError):
+    """Raised when a schema uses keywords the compiler does not support."""
+
+
+def default_output_dir() -> Path:
+    return Path(__file__).resolve().parent / "compiled_schemas"
+
+
+def module_name_for(schema_filename: str) -> str:
+    """Map `phase1_scenarios.schema.json` to `phase1_scenarios`."""
+    return schema_filename.split(".", 1)[0]
+
+
+def schema_digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+class _Emitter:
+    def __init__(self) -> None:
+        self.functions: List[List[str]] = []
+        self.constants: List[str] = []
+
+    def constant(self, value: Any) -> str:
+        name = f"_C{len(self.constants)}"
+        if isinstance(value, frozenset):
+            # Sorted so regenerated modules are byte-identical across runs.
+            literal = "frozenset({" + ", ".join(repr(item) for item in sorted(value)) + "})"
+        else:
+            literal = repr(value)
+        self.constants.append(f"{name} = {literal}")
+        return name
+
+    def compile_node(self, schema: Any, location: str) -> Optional[str]:
+        """Emit a function for `schema` and return its name (None for `true`)."""
+        if schema is True or schema == {}:
+            return None
+        name = f"_v{len(self.functions)}"
+        body: List[str] = []
+        self.functions.append(body)
+
+        if schema is False:
+            body.append('errors.append((path, f"False schema does not allow {instance!r}"))')
+            return name
+        if not isinstance(schema, dict):
+            raise SchemaCompileError(f"{location}: schema must be an object or boolean")
+
+        unknown = set(schema) - SUPPORTED_KEYWORDS - ANNOTATION_KEYWORDS
+        if unknown:
+            raise SchemaCompileError(f"{location}: unsupported keywords {sorted(unknown)}")
+
+        if "type" in schema:
+            types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            checks = " or ".join(TYPE_CHECKS[item].format(var="instance") for item in types)
+            reprs = ", ".join(repr(item) for item in types)
+            body.append(f"if not ({checks}):")
+            body.append(f'    errors.append((path, f"{{instance!r}} is not of type {reprs}"))')
+
+        if "const" in schema:
+            const = schema["const"]
+            if isinstance(const, str):
+                check = f"instance == {const!r}"
+            else:
+                check = f"equal(instance, {self.constant(const)})"
+            body.append(f"if not ({check}):")
+            body.append(f"    errors.append((path, {f'{const!r} was expected'!r}))")
+
+        if "enum" in schema:
+            enum = schema["enum"]
+            message = f" is not one of {enum!r}"
+            if all(isinstance(item, str) for item in enum):
+                members = self.constant(frozenset(enum))
+                check = f"isinstance(instance, str) and instance in {members}"
+            else:
+                members = self.constant(tuple(enum))
+                check = f"any(equal(instance, item) for item in {members})"
+            body.append(f"if not ({check}):")
+            body.append(f"    errors.append((path, repr(instance) + {message!r}))")
+
+        if "format" in schema:
+            fmt = schema["format"]
+            body.append(f"if not conforms(instance, {fmt!r}):")
+            body.append(f"    errors.append((path, repr(instance) + {f' is not a {fmt!r}'!r}))")
+
+        for keyword, kind in (("minLength", "str"), ("minItems", "list")):
+            if keyword in schema:
+                limit = int(schema[keyword])
+                suffix = " should be non-empty" if limit == 1 else " is too short"
+                body.append(f"if isinstance(instance, {kind}) and len(instance) < {limit}:")
+                body.append(f"    errors.append((path, repr(instance) + {suffix!r}))")
+
+        object_lines: List[str] = []
+        if "required" in schema:
+            required = self.constant(tuple(schema["required"]))
+            object_lines.append(f"for name in {required}:")
+            object_lines.append("    if name not in instance:")
+            object_lines.append('        errors.append((path, f"{name!r} is a required property"))')
+
+        properties: Dict[str, Any] = schema.get("properties", {})
+        for prop, subschema in properties.items():
+            child = self.compile_node(subschema, f"{location}/properties/{prop}")
+            if child is None:
+                continue
+            object_lines.append(f"if {prop!r} in instance:")
+            object_lines.append(f"    {child}(instance[{prop!r}], path + ({prop!r},), errors)")
+
+        if "additionalProperties" in schema:
+            additional = schema["additionalProperties"]
+            known = self.constant(frozenset(properties))
+            if additional is False:
+                object_lines.append(f"extras = [key for key in instance if key not in {known}]")
+                object_lines.append("if extras:")
+                object_lines.append("    extras.sort(key=str)")
+                object_lines.append('    verb = "was" if len(extras) == 1 else "were"')
+                object_lines.append('    joined = ", ".join(repr(extra) for extra in extras)')
+                object_lines.append(
+                    '    errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))'
+                )
+            else:
+                child = self.compile_node(additional, f"{location}/additionalProperties")
+                if child is not None:
+                    object_lines.append("for key, value in instance.items():")
+                    object_lines.append(f"    if key not in {known}:")
+                    object_lines.append(f"        {child}(value, path + (key,), errors)")
+
+        if object_lines:
+            body.append("if isinstance(instance, dict):")
+            body.extend(f"    {line}" for line in object_lines)
+
+        if "items" in schema:
+            child = self.compile_node(schema["items"], f"{location}/items")
+            if child is not None:
+                body.append("if isinstance(instance, list):")
+                body.append("    for index, item in enumerate(instance):")
+                body.append(f"        {child}(item, path + (index,), errors)")
+
+        if not body:
+            body.append("return")
+        return name
+
+
+def compile_schema_source(schema_filename: str, raw: bytes) -> str:
+    """Return Python source for a validator module compiled from `raw` schema bytes."""
+    schema = json.loads(raw)
+    emitter = _Emitter()
+    root = emitter.compile_node(schema, schema_filename)
+
+    lines = [
+        f'"""Validator compiled from `schemas/{schema_filename}`.',
+        "",
+        "Generated by `specula-agent compile-schemas`; do not edit by hand.",
+        '"""',
+        "",
+        "from ._runtime import conforms, equal, is_integer, is_number",
+        "",
+        f"SCHEMA_FILE = {schema_filename!r}",
+        f"SCHEMA_SHA256 = {schema_digest(raw)!r}",
+        "",
+    ]
+    lines.extend(emitter.constants)
+    for index, body in enumerate(emitter.functions):
+        lines.extend(["", "", f"def _v{index}(instance, path, errors):"])
+        lines.extend(f"    {line}" for line in body)
+    lines.extend(
+        [
+            "",
+            "",
+            "def collect_errors(instance):",
+            '    """Return `(path, message)` pairs for every violation in `instance`."""',
+            "    errors = []",
+        ]
+    )
+    if root is not None:
+        lines.append(f"    {root}(instance, (), errors)")
+    lines.extend(["    return errors", ""])
+    return "\n".join(lines)
+
+
+def compile_all(schema_dir: Path, output_dir: Optional[Path] = None) -> List[Path]:
+    """Compile every `*.schema.json` under `schema_dir` and return written module paths."""
+    target = output_dir or default_output_dir()
+    target.mkdir(parents=True, exist_ok=True)
+    written: List[Path] = []
+    for schema_path in sorted(schema_dir.glob("*.schema.json")):
+        source = compile_schema_source(schema_path.name, schema_path.read_bytes())
+        module_path = target / f"{module_name_for(schema_path.name)}.py"
+        module_path.write_text(source, encoding="utf-8")
+        written.append(module_path)
+    return written
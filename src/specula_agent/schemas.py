@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import glob
+import hashlib
+import importlib
 import json
+import multiprocessing
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from jsonschema import Draft202012Validator, FormatChecker
 
-from .constants import ALLOWED_MODES, PHASE_SEQUENCE
+from .cache import canonical_hash, get_validation_cache
+from .constants import ALLOWED_MODES, PHASE_DEFAULT_MODE, PHASE_SEQUENCE
+from .policy import validate_assistant_text
 
 SCHEMA_FILES: Dict[str, str] = {
     "0": "phase0_activation.schema.json",
@@ -43,6 +51,186 @@ def schema_filename_for(phase: str, mode: str) -> str:
     return SCHEMA_FILES[phase]
 
 
+CompiledCollector = Callable[[Any], List[Tuple[Tuple[Any, ...], str]]]
+
+
+@dataclass
+class _CompiledSchema:
+    filename: str
+    mtime_ns: int
+    sha256: str
+    validator: Draft202012Validator
+    collector: Optional[CompiledCollector] = None
+
+
+def _load_compiled_collector(filename: str, sha256: str) -> Optional[CompiledCollector]:
+    """Return the generated validator for `filename` when it matches the schema digest."""
+    module_name = filename.split(".", 1)[0]
+    try:
+        module = importlib.import_module(f"{__package__}.compiled_schemas.{module_name}")
+    except ImportError:
+        return None
+    if getattr(module, "SCHEMA_SHA256", None) != sha256:
+        return None
+    return getattr(module, "collect_errors", None)
+
+
+class ValidatorRegistry:
+    """Process-wide cache of compiled validators keyed by `(phase, mode)`.
+
+    Validators are built lazily on first use (or eagerly through `warm`) and
+    rebuilt when the schema file's mtime changes. Pairs resolving to the same
+    schema file share one compiled validator. When a generated module from
+    `compiled_schemas` matches the schema digest it is used instead of jsonschema.
+    """
+
+    def __init__(
+        self,
+        schema_dir: Optional[Path] = None,
+        use_compiled: bool = True,
+        on_reload: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self._schema_dir = schema_dir
+        self.use_compiled = use_compiled
+        self._on_reload = on_reload
+        self._entries: Dict[Tuple[str, str], _CompiledSchema] = {}
+        self._by_file: Dict[str, _CompiledSchema] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def _path_for(self, filename: str) -> Path:
+        return (self._schema_dir or _schema_dir()) / filename
+
+    def _compile(self, filename: str, mtime_ns: int) -> _CompiledSchema:
+        compiled = self._by_file.get(filename)
+        if compiled is not None and compiled.mtime_ns == mtime_ns:
+            return compiled
+        raw = self._path_for(filename).read_bytes()
+        sha256 = hashlib.sha256(raw).hexdigest()
+        if compiled is not None:
+            self.reloads += 1
+            if self._on_reload is not None and compiled.sha256 != sha256:
+                self._on_reload(compiled.sha256)
+        compiled = _CompiledSchema(
+            filename=filename,
+            mtime_ns=mtime_ns,
+            sha256=sha256,
+            validator=Draft202012Validator(json.loads(raw), format_checker=FormatChecker()),
+            collector=_load_compiled_collector(filename, sha256) if self.use_compiled else None,
+        )
+        self._by_file[filename] = compiled
+        return compiled
+
+    def entry(self, phase: str, mode: str) -> _CompiledSchema:
+        key = (str(phase), str(mode))
+        filename = schema_filename_for(*key)
+        mtime_ns = self._path_for(filename).stat().st_mtime_ns
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.mtime_ns == mtime_ns:
+                self.hits += 1
+                return entry
+            self.misses += 1
+            entry = self._compile(filename, mtime_ns)
+            self._entries[key] = entry
+            return entry
+
+    def loaded_entry(self, phase: str, mode: str) -> Optional[_CompiledSchema]:
+        """Return the entry last loaded for a phase/mode pair without checking the file."""
+        return self._entries.get((str(phase), str(mode)))
+
+    def get(self, phase: str, mode: str) -> Draft202012Validator:
+        """Return the compiled validator for a phase/mode pair."""
+        return self.entry(phase, mode).validator
+
+    def schema_errors(self, phase: str, mode: str, artifact: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Return unsorted `(path, message)` pairs for `artifact`."""
+        return self.entry_errors(self.entry(phase, mode), artifact)
+
+    @staticmethod
+    def entry_errors(entry: _CompiledSchema, artifact: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Like `schema_errors`, for an entry the caller already looked up."""
+        if entry.collector is not None:
+            return [
+                (".".join(str(item) for item in path) or "$", message)
+                for path, message in entry.collector(artifact)
+            ]
+        return [
+            (".".join(str(item) for item in issue.path) or "$", issue.message)
+            for issue in entry.validator.iter_errors(artifact)
+        ]
+
+    def warm(self) -> None:
+        """Compile the validators for every phase default mode plus refusal register."""
+        pairs = [(phase, PHASE_DEFAULT_MODE[phase]) for phase in PHASE_SEQUENCE]
+        pairs.append(("3", "refusal_register"))
+        for phase, mode in pairs:
+            self.get(phase, mode)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "size": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_file.clear()
+            self.hits = 0
+            self.misses = 0
+            self.reloads = 0
+
+
+def _drop_cached_results(schema_sha256: str) -> None:
+    cache = get_validation_cache()
+    if cache is not None:
+        cache.drop_namespace(f"schema-{schema_sha256}")
+
+
+_REGISTRY = ValidatorRegistry(on_reload=_drop_cached_results)
+
+
+def get_validator(phase: str, mode: str) -> Draft202012Validator:
+    """Return the cached validator for a phase/mode pair."""
+    return _REGISTRY.get(phase, mode)
+
+
+def schema_fingerprint(phase: str, mode: str) -> str:
+    """Return the SHA-256 of the schema file currently used for a phase/mode pair."""
+    return _REGISTRY.entry(phase, mode).sha256
+
+
+def loaded_schema_fingerprint(phase: str, mode: str) -> Optional[str]:
+    """Like `schema_fingerprint`, but without a stat: the digest of the schema last loaded.
+
+    None until the pair has been used once; it changes when a lookup that does
+    check the file (such as `validate_artifact`) reloads an edited schema.
+    """
+    entry = _REGISTRY.loaded_entry(phase, mode)
+    return entry.sha256 if entry is not None else None
+
+
+def warm_validator_cache() -> None:
+    """Pre-compile every phase schema, e.g. at process startup."""
+    _REGISTRY.warm()
+
+
+def validator_cache_stats() -> Dict[str, int]:
+    """Return hit/miss/reload counters for the process-wide validator cache."""
+    return _REGISTRY.stats()
+
+
+def clear_validator_cache() -> None:
+    """Drop all cached validators and reset counters."""
+    _REGISTRY.clear()
+
+
 def validate_artifact(
     artifact: Dict[str, Any],
     current_phase: str | None = None,
@@ -64,18 +252,26 @@ def validate_artifact(
         errors.append(f"meta.mode `{mode}` is not in canonical mode enum")
         return errors
 
-    schema_filename = schema_filename_for(phase, mode)
-    schema = _load_schema(schema_filename)
-    validator = Draft202012Validator(schema, format_checker=FormatChecker())
-    schema_errors: List[Tuple[str, str]] = []
+    entry = _REGISTRY.entry(phase, mode)
+    # Results are cached per schema digest, so editing a schema file retires them.
+    cache = get_validation_cache()
+    key: Optional[str] = None
+    if cache is not None:
+        namespace = f"schema-{entry.sha256}"
+        try:
+            key = canonical_hash([artifact, current_phase])
+        except TypeError:
+            pass  # Not plain JSON data (e.g. tuples or datetimes): validated without caching.
+        if key is not None:
+            cached = cache.get(namespace, key)
+            if cached is not None:
+                return cached
 
-    for issue in validator.iter_errors(artifact):
-        path = ".".join(str(item) for item in issue.path) or "$"
-        schema_errors.append((path, issue.message))
-
-    for path, message in sorted(schema_errors):
+    for path, message in sorted(ValidatorRegistry.entry_errors(entry, artifact)):
         errors.append(f"{path}: {message}")
 
+    if key is not None:
+        cache.put(namespace, key, errors)
     return errors
 
 
@@ -84,3 +280,130 @@ def assert_artifact_valid(artifact: Dict[str, Any], current_phase: str | None =
     errors = validate_artifact(artifact, current_phase=current_phase)
     if errors:
         raise SchemaValidationError("\n".join(errors))
+
+
+@dataclass
+class BatchResult:
+    """Outcome of validating one artifact file in a batch run."""
+
+    path: str
+    errors: List[str] = field(default_factory=list)
+    phase: Optional[str] = None
+    mode: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def iter_artifact_paths(targets: Iterable[Union[str, Path]]) -> Iterator[Path]:
+    """Expand directories (recursively, `*.json`) and glob patterns into file paths."""
+    for target in targets:
+        target_path = Path(target)
+        if target_path.is_dir():
+            yield from sorted(target_path.rglob("*.json"))
+        elif target_path.is_file():
+            yield target_path
+        else:
+            for match in sorted(glob.glob(str(target), recursive=True)):
+                if Path(match).is_file():
+                    yield Path(match)
+
+
+def _validate_artifact_file(path: Union[str, Path], current_phase: Optional[str] = None) -> BatchResult:
+    """Validate one artifact file plus its sibling `.txt` assistant text, if any."""
+    artifact_path = Path(path)
+    result = BatchResult(path=str(artifact_path))
+    try:
+        with artifact_path.open("r", encoding="utf-8") as handle:
+            artifact = json.load(handle)
+    except (OSError, ValueError) as exc:
+        result.errors.append(f"$: cannot load artifact: {exc}")
+        return result
+    if not isinstance(artifact, dict):
+        result.errors.append("$: artifact must be a JSON object")
+        return result
+
+    meta = artifact.get("meta", {})
+    if isinstance(meta, dict):
+        result.phase = None if meta.get("phase") is None else str(meta.get("phase"))
+        result.mode = None if meta.get("mode") is None else str(meta.get("mode"))
+
+    text_path = artifact_path.with_suffix(".txt")
+    if text_path.is_file():
+        result.errors.extend(validate_assistant_text(text_path.read_text(encoding="utf-8")))
+    result.errors.extend(validate_artifact(artifact, current_phase=current_phase))
+    return result
+
+
+def _validate_artifact_file_star(args: Tuple[str, Optional[str]]) -> BatchResult:
+    return _validate_artifact_file(*args)
+
+
+def validate_many(
+    paths: Iterable[Union[str, Path]],
+    current_phase: str | None = None,
+    workers: int | None = None,
+    chunksize: int = 16,
+) -> Iterator[BatchResult]:
+    """Validate many artifact files, yielding results in input order as they complete.
+
+    With `workers=1` files are validated in-process; otherwise they are fanned out
+    across a process pool whose workers warm the validator cache on startup.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    jobs = ((str(path), current_phase) for path in paths)
+    if workers == 1:
+        warm_validator_cache()
+        for job in jobs:
+            yield _validate_artifact_file_star(job)
+        return
+
+    with multiprocessing.Pool(processes=workers, initializer=warm_validator_cache) as pool:
+        yield from pool.imap(_validate_artifact_file_star, jobs, chunksize=chunksize)
+
+
+def validate_ndjson(
+    lines: Iterable[str],
+    current_phase: str | None = None,
+    require_text: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Validate newline-delimited JSON records one at a time.
+
+    Each record is either `{"artifact": {...}, "assistant_text": "..."}` or a bare
+    artifact object. Yields one result dict per non-blank input line, so memory
+    use does not depend on the size of the input.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        result: Dict[str, Any] = {"line": line_number, "artifact_id": None, "valid": False, "errors": []}
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            result["errors"].append(f"$: invalid JSON: {exc}")
+            yield result
+            continue
+        if not isinstance(record, dict):
+            result["errors"].append("$: record must be a JSON object")
+            yield result
+            continue
+
+        artifact = record.get("artifact", record)
+        assistant_text = record.get("assistant_text") if "artifact" in record else None
+        if not isinstance(artifact, dict):
+            result["errors"].append("artifact: must be a JSON object")
+            yield result
+            continue
+
+        meta = artifact.get("meta")
+        if isinstance(meta, dict):
+            result["artifact_id"] = meta.get("artifact_id")
+        if assistant_text is not None:
+            result["errors"].extend(validate_assistant_text(str(assistant_text)))
+        elif require_text:
+            result["errors"].append("assistant_text: missing from record")
+        result["errors"].extend(validate_artifact(artifact, current_phase=current_phase))
+        result["valid"] = not result["errors"]
+        yield result
@@ -0,0 +1,294 @@
+"""Encodings for project state snapshots.
+
+`JsonCodec` writes the original pretty-printed JSON. `BinaryCodec` writes a
+compact tagged encoding in which dict keys and short strings (phase ids,
+modes, `validator_role`, `decision` values...) are stored once and referenced
+by number afterwards, optionally followed by a zlib pass. Binary snapshots
+start with `MAGIC`, so a file's codec is detected from its first bytes;
+the codec used for writing is chosen by name or by file suffix.
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+MAGIC = b"SPST"
+BINARY_VERSION = 1
+FLAG_ZLIB = 0x01
+# Strings up to this many bytes are interned; longer ones are written inline.
+INTERN_MAX_BYTES = 32
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_FLOAT = 0x04
+_STR = 0x05
+_STR_DEF = 0x06
+_STR_REF = 0x07
+_LIST = 0x08
+_DICT = 0x09
+
+_DOUBLE = struct.Struct(">d")
+
+
+class StateCodecError(ValueError):
+    """Raised when a state snapshot cannot be encoded or decoded."""
+
+
+class StateCodec(abc.ABC):
+    """Converts a `ProjectState.to_dict()` payload to and from bytes."""
+
+    name = ""
+    suffixes: Tuple[str, ...] = ()
+
+    @abc.abstractmethod
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """Serialize a state dict."""
+
+    @abc.abstractmethod
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        """Parse bytes written by `encode`; raise StateCodecError when they are not valid."""
+
+
+class JsonCodec(StateCodec):
+    name = "json"
+    suffixes = (".json",)
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        try:
+            value = json.loads(data)
+        except ValueError as exc:
+            raise StateCodecError(f"invalid JSON ({exc})") from exc
+        if not isinstance(value, dict):
+            raise StateCodecError("state snapshot is not a JSON object")
+        return value
+
+
+class BinaryCodec(StateCodec):
+    """`MAGIC`, version byte, flags byte, then the (optionally zlib-compressed) body."""
+
+    def __init__(self, *, compress: bool = False, level: int = 6) -> None:
+        self.compress = compress
+        self.level = level
+        self.name = "binary-zlib" if compress else "binary"
+        self.suffixes = (".spstz",) if compress else (".spst",)
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        body = _encode_value(data)
+        flags = 0
+        if self.compress:
+            body = zlib.compress(body, self.level)
+            flags |= FLAG_ZLIB
+        return MAGIC + bytes((BINARY_VERSION, flags)) + body
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        if data[: len(MAGIC)] != MAGIC or len(data) < len(MAGIC) + 2:
+            raise StateCodecError("not a binary state snapshot")
+        version, flags = data[len(MAGIC)], data[len(MAGIC) + 1]
+        if version != BINARY_VERSION:
+            raise StateCodecError(f"unsupported binary state version {version}")
+        body = data[len(MAGIC) + 2 :]
+        if flags & FLAG_ZLIB:
+            try:
+                body = zlib.decompress(body)
+            except zlib.error as exc:
+                raise StateCodecError(f"corrupt compressed state ({exc})") from exc
+        try:
+            value, end = _decode_value(body)
+        except (IndexError, UnicodeDecodeError, struct.error) as exc:
+            raise StateCodecError(f"truncated or corrupt binary state ({exc})") from exc
+        if end != len(body) or not isinstance(value, dict):
+            raise StateCodecError("truncated or corrupt binary state")
+        return value
+
+
+JSON = JsonCodec()
+BINARY = BinaryCodec()
+BINARY_ZLIB = BinaryCodec(compress=True)
+CODECS: Dict[str, StateCodec] = {codec.name: codec for codec in (JSON, BINARY, BINARY_ZLIB)}
+
+
+def get_codec(name: str) -> StateCodec:
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise StateCodecError(f"unknown state format `{name}` (expected one of {', '.join(CODECS)})") from None
+
+
+def codec_for_path(path: Path) -> StateCodec:
+    """Codec for writing `path`, by suffix; unknown suffixes keep JSON."""
+    suffix = Path(path).suffix
+    for codec in CODECS.values():
+        if suffix in codec.suffixes:
+            return codec
+    return JSON
+
+
+def detect_codec(data: bytes) -> StateCodec:
+    """Codec that wrote `data`, from its magic bytes."""
+    if data[: len(MAGIC)] == MAGIC:
+        flags = data[len(MAGIC) + 1] if len(data) > len(MAGIC) + 1 else 0
+        return BINARY_ZLIB if flags & FLAG_ZLIB else BINARY
+    return JSON
+
+
+def decode_state(data: bytes) -> Dict[str, Any]:
+    return detect_codec(data).decode(data)
+
+
+def _varint(value: int, out: bytearray) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _encode_value(root: Any) -> bytes:
+    out = bytearray()
+    table: Dict[str, int] = {}
+
+    def put_str(text: str) -> None:
+        raw = text.encode("utf-8")
+        if len(raw) > INTERN_MAX_BYTES:
+            out.append(_STR)
+        else:
+            index = table.get(text)
+            if index is not None:
+                out.append(_STR_REF)
+                _varint(index, out)
+                return
+            table[text] = len(table)
+            out.append(_STR_DEF)
+        _varint(len(raw), out)
+        out.extend(raw)
+
+    def put(value: Any) -> None:
+        # bool before int: True is an int.
+        if value is None:
+            out.append(_NONE)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif isinstance(value, str):
+            put_str(value)
+        elif isinstance(value, int):
+            out.append(_INT)
+            _varint(value * 2 if value >= 0 else -value * 2 - 1, out)
+        elif isinstance(value, float):
+            out.append(_FLOAT)
+            out.extend(_DOUBLE.pack(value))
+        elif isinstance(value, dict):
+            out.append(_DICT)
+            _varint(len(value), out)
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise StateCodecError(f"state keys must be strings, got {type(key).__name__}")
+                put_str(key)
+                put(item)
+        elif isinstance(value, (list, tuple)):
+            out.append(_LIST)
+            _varint(len(value), out)
+            for item in value:
+                put(item)
+        else:
+            raise StateCodecError(f"cannot encode {type(value).__name__} in state")
+
+    put(root)
+    return bytes(out)
+
+
+def _decode_value(data: bytes) -> Tuple[Any, int]:
+    table: List[str] = []
+    unpack_double: Callable[[bytes, int], Tuple[float]] = _DOUBLE.unpack_from
+    size = len(data)
+
+    def varint(pos: int) -> Tuple[int, int]:
+        value = 0
+        shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, pos
+            shift += 7
+
+    def string(tag: int, pos: int) -> Tuple[str, int]:
+        length = data[pos]
+        if length < 0x80:
+            pos += 1
+        else:
+            length, pos = varint(pos)
+        end = pos + length
+        if end > size:
+            raise IndexError("string runs past the end of the data")
+        text = data[pos:end].decode("utf-8")
+        if tag == _STR_DEF:
+            table.append(text)
+        return text, end
+
+    def get(pos: int) -> Tuple[Any, int]:
+        # Branches are ordered by how often each tag occurs in project states.
+        tag = data[pos]
+        pos += 1
+        if tag == _STR_REF:
+            index = data[pos]
+            if index < 0x80:
+                return table[index], pos + 1
+            index, pos = varint(pos)
+            return table[index], pos
+        if tag == _STR_DEF or tag == _STR:
+            return string(tag, pos)
+        if tag == _DICT:
+            count = data[pos]
+            if count < 0x80:
+                pos += 1
+            else:
+                count, pos = varint(pos)
+            result: Dict[str, Any] = {}
+            for _ in range(count):
+                key_tag = data[pos]
+                if key_tag == _STR_REF:
+                    index = data[pos + 1]
+                    if index < 0x80:
+                        key, pos = table[index], pos + 2
+                    else:
+                        index, pos = varint(pos + 1)
+                        key = table[index]
+                elif key_tag == _STR_DEF or key_tag == _STR:
+                    key, pos = string(key_tag, pos + 1)
+                else:
+                    raise StateCodecError(f"expected a string key at offset {pos}")
+                result[key], pos = get(pos)
+            return result, pos
+        if tag == _LIST:
+            count, pos = varint(pos)
+            items: List[Any] = []
+            for _ in range(count):
+                item, pos = get(pos)
+                items.append(item)
+            return items, pos
+        if tag == _INT:
+            raw, pos = varint(pos)
+            return (raw >> 1) if not raw & 1 else -((raw + 1) >> 1), pos
+        if tag == _TRUE:
+            return True, pos
+        if tag == _FALSE:
+            return False, pos
+        if tag == _NONE:
+            return None, pos
+        if tag == _FLOAT:
+            return unpack_double(data, pos)[0], pos + 8
+        raise StateCodecError(f"unknown tag 0x{tag:02x} at offset {pos - 1}")
+
+    return get(0)
@@ -0,0 +1,431 @@
+"""On-disk layouts for `ProjectState`.
+
+`JsonStateStore` keeps the original `.specula_state.json` file as a snapshot
+and appends the state's recorded changes (`ProjectState.changes`) to a
+`.specula_state.json.journal` next to it, one fsync'd JSON line per save.
+Loading replays the journal over the snapshot; once the journal outgrows the
+snapshot it is compacted into a new snapshot written to a temporary file and
+renamed into place. Snapshots are written with a `state_codec` codec (JSON,
+or the binary encoding for `.spst`/`.spstz` files) and read with whichever
+codec their first bytes identify.
+
+`SegmentedStateStore` splits the state into a directory:
+
+- `header.json`: phase pointers, validation records and continuity context,
+  plus the committed sizes of the two files below;
+- `artifacts.log`: append-only log of artifacts, one compact JSON per line;
+- `artifacts.idx`: offset index, one `artifact_id<TAB>offset<TAB>length` line
+  per log record (the latest line for an id wins; length -1 is a deletion).
+
+Loading reads only the header and the offset index; `state.artifact_index` is
+a `LazyArtifactIndex` that reads artifacts from the log on first access. Saving
+appends new or changed artifacts and atomically replaces the header, so the
+cost of a command no longer grows with the project's history. Bytes past the
+committed sizes (from a crash mid-save) are ignored and overwritten.
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Set, Tuple
+from uuid import uuid4
+
+from .hydration import section_dict
+from .orchestrator import ProjectState
+from .state_codec import StateCodec, StateCodecError, codec_for_path, detect_codec
+
+JOURNAL_SUFFIX = ".journal"
+# Journals smaller than this are never compacted, however small the snapshot.
+MIN_COMPACT_BYTES = 64 * 1024
+HEADER_FILE = "header.json"
+LOG_FILE = "artifacts.log"
+INDEX_FILE = "artifacts.idx"
+SEGMENTED_FORMAT = "specula-segmented-state/1"
+
+
+class StateStoreError(ValueError):
+    """Raised when a state file or directory cannot be read."""
+
+
+def _encode_artifact(artifact: Dict[str, Any]) -> bytes:
+    return json.dumps(artifact, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _replace_atomically(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+class LazyArtifactIndex(MutableMapping[str, Dict[str, Any]]):
+    """`artifact_index` mapping backed by the segmented artifact log.
+
+    Membership tests and iteration use the offset index only; values are read
+    and parsed on first access and cached. Assigned or in-place modified
+    artifacts are written back by `SegmentedStateStore.save`.
+    """
+
+    def __init__(self, log_path: Path, offsets: Dict[str, Tuple[int, int]]) -> None:
+        self._log_path = log_path
+        self._offsets = offsets
+        self._loaded: Dict[str, Dict[str, Any]] = {}
+        # Bytes each loaded artifact was read from; missing for assigned ones.
+        self._raw: Dict[str, bytes] = {}
+        self._deleted: Set[str] = set()
+        self._handle: Any = None
+
+    def _read(self, offset: int, length: int) -> bytes:
+        if self._handle is None:
+            self._handle = self._log_path.open("rb")
+        self._handle.seek(offset)
+        return self._handle.read(length)
+
+    def __getitem__(self, artifact_id: str) -> Dict[str, Any]:
+        cached = self._loaded.get(artifact_id)
+        if cached is not None:
+            return cached
+        if artifact_id not in self._offsets:
+            raise KeyError(artifact_id)
+        raw = self._read(*self._offsets[artifact_id])
+        try:
+            artifact = json.loads(raw)
+        except ValueError as exc:
+            raise StateStoreError(f"{self._log_path}: corrupt record for artifact `{artifact_id}`") from exc
+        self._loaded[artifact_id] = artifact
+        self._raw[artifact_id] = raw
+        return artifact
+
+    def __setitem__(self, artifact_id: str, artifact: Dict[str, Any]) -> None:
+        self._loaded[artifact_id] = artifact
+        self._raw.pop(artifact_id, None)
+        self._deleted.discard(artifact_id)
+
+    def __delitem__(self, artifact_id: str) -> None:
+        if artifact_id not in self:
+            raise KeyError(artifact_id)
+        self._loaded.pop(artifact_id, None)
+        self._raw.pop(artifact_id, None)
+        if self._offsets.pop(artifact_id, None) is not None:
+            self._deleted.add(artifact_id)
+
+    def __contains__(self, artifact_id: object) -> bool:
+        return artifact_id in self._loaded or artifact_id in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._offsets
+        for artifact_id in self._loaded:
+            if artifact_id not in self._offsets:
+                yield artifact_id
+
+    def __len__(self) -> int:
+        return len(self._offsets) + sum(1 for artifact_id in self._loaded if artifact_id not in self._offsets)
+
+    def pending_writes(self) -> List[Tuple[str, bytes]]:
+        """Return `(artifact_id, encoded)` for assigned or modified artifacts."""
+        pending: List[Tuple[str, bytes]] = []
+        for artifact_id, artifact in self._loaded.items():
+            encoded = _encode_artifact(artifact)
+            if self._raw.get(artifact_id) != encoded:
+                pending.append((artifact_id, encoded))
+        return pending
+
+    def pending_deletes(self) -> List[str]:
+        return sorted(self._deleted)
+
+    def mark_written(self, written: Dict[str, Tuple[int, int]], raw: Dict[str, bytes]) -> None:
+        self._offsets.update(written)
+        self._raw.update(raw)
+        self._deleted.clear()
+        # The log grew; reopen so reads see the appended records.
+        self.close()
+
+    def is_backed_by(self, log_path: Path) -> bool:
+        return self._log_path == log_path
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class StateStore(abc.ABC):
+    """Loads and saves a `ProjectState` at a fixed location."""
+
+    @abc.abstractmethod
+    def exists(self) -> bool:
+        """True when a state has been saved at this location."""
+
+    @abc.abstractmethod
+    def load(self) -> ProjectState:
+        """Read the saved state."""
+
+    @abc.abstractmethod
+    def save(self, state: ProjectState) -> None:
+        """Persist `state`."""
+
+    def load_or_create(self) -> ProjectState:
+        if self.exists():
+            return self.load()
+        return ProjectState(project_id=f"project-{uuid4()}", current_phase="0")
+
+
+def journal_path(path: Path) -> Path:
+    """Return the journal that belongs to the JSON state snapshot at `path`."""
+    return path.with_name(path.name + JOURNAL_SUFFIX)
+
+
+class JsonStateStore(StateStore):
+    """JSON snapshot plus write-ahead journal of state changes.
+
+    Each journal line is `{"seq": n, "change": {...}}`; the snapshot records the
+    last sequence number it contains as `journal_seq`, so records left behind
+    by a crash between compaction and journal truncation are skipped on load.
+    Changes made by assigning to state fields directly (not through the
+    `ProjectState` methods that record them) are only persisted by compaction.
+
+    `codec` is the snapshot encoding to write (by default from the file
+    suffix). A snapshot written with another codec is still loaded, and is
+    rewritten with `codec` on the next save.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        codec: Optional[StateCodec] = None,
+        min_compact_bytes: int = MIN_COMPACT_BYTES,
+    ) -> None:
+        self.path = Path(path)
+        self.journal_path = journal_path(self.path)
+        self.codec = codec if codec is not None else codec_for_path(self.path)
+        self.min_compact_bytes = min_compact_bytes
+        self._seq = 0
+        self._journal_bytes = 0
+        self._loaded = False
+        self._needs_migration = False
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        """Return journal records, truncating a torn or corrupt tail left by a crash."""
+        if not self.journal_path.exists():
+            return []
+        records: List[Dict[str, Any]] = []
+        valid_bytes = 0
+        with self.journal_path.open("rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+                valid_bytes += len(line)
+        if valid_bytes != self.journal_path.stat().st_size:
+            with self.journal_path.open("r+b") as handle:
+                handle.truncate(valid_bytes)
+        self._journal_bytes = valid_bytes
+        return records
+
+    def load(self) -> ProjectState:
+        raw = self.path.read_bytes()
+        codec = detect_codec(raw)
+        try:
+            data = codec.decode(raw)
+        except StateCodecError as exc:
+            raise StateStoreError(f"{self.path}: {exc}") from exc
+        self._needs_migration = codec.name != self.codec.name
+        state = ProjectState.from_dict(data)
+        seq = int(data.get("journal_seq", 0))
+        for record in self._read_journal():
+            if record["seq"] <= seq:
+                continue
+            state.apply_change(record["change"])
+            seq = record["seq"]
+        self._seq = seq
+        self._loaded = True
+        return state
+
+    def save(self, state: ProjectState) -> None:
+        """Append the state's recorded changes, compacting when the journal outgrows the snapshot."""
+        changes = state.drain_changes()
+        if not self._loaded or self._needs_migration or not self.path.exists():
+            self.compact(state)
+            return
+        if not changes:
+            return
+        lines = []
+        for change in changes:
+            self._seq += 1
+            lines.append(json.dumps({"seq": self._seq, "change": change}, ensure_ascii=False, separators=(",", ":")))
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        with self.journal_path.open("ab") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        self._journal_bytes += len(data)
+        if self._journal_bytes >= max(self.min_compact_bytes, self.path.stat().st_size):
+            self.compact(state)
+
+    def compact(self, state: ProjectState) -> None:
+        """Write `state` as a new snapshot (atomic rename), then empty the journal."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = state.to_dict()
+        data["journal_seq"] = self._seq
+        _replace_atomically(self.path, self.codec.encode(data))
+        if self.journal_path.exists():
+            with self.journal_path.open("r+b") as handle:
+                handle.truncate(0)
+                os.fsync(handle.fileno())
+        self._journal_bytes = 0
+        self._loaded = True
+        self._needs_migration = False
+
+
+class SegmentedStateStore(StateStore):
+    """Header plus append-only artifact log in a directory (see module docstring)."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.header_path = self.root / HEADER_FILE
+        self.log_path = self.root / LOG_FILE
+        self.index_path = self.root / INDEX_FILE
+
+    def exists(self) -> bool:
+        return self.header_path.exists()
+
+    def _read_header(self) -> Dict[str, Any]:
+        try:
+            with self.header_path.open("r", encoding="utf-8") as handle:
+                header = json.load(handle)
+        except ValueError as exc:
+            raise StateStoreError(f"{self.header_path}: invalid JSON ({exc})") from exc
+        if header.get("format") != SEGMENTED_FORMAT:
+            raise StateStoreError(f"{self.header_path}: unsupported state format `{header.get('format')}`")
+        return header
+
+    def _read_offsets(self, index_size: int) -> Dict[str, Tuple[int, int]]:
+        offsets: Dict[str, Tuple[int, int]] = {}
+        if index_size == 0:
+            return offsets
+        with self.index_path.open("rb") as handle:
+            data = handle.read(index_size)
+        for line in data.decode("utf-8").splitlines():
+            artifact_id, offset, length = line.split("\t")
+            if int(length) < 0:
+                offsets.pop(artifact_id, None)
+            else:
+                offsets[artifact_id] = (int(offset), int(length))
+        return offsets
+
+    def load(self) -> ProjectState:
+        header = self._read_header()
+        state = ProjectState.from_dict(header["state"])
+        state.artifact_index = LazyArtifactIndex(self.log_path, self._read_offsets(int(header["index_size"])))
+        return state
+
+    def save(self, state: ProjectState) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Artifacts are appended to the log and the header is replaced atomically; no journal needed.
+        state.drain_changes()
+        committed = self._read_header() if self.exists() else {"log_size": 0, "index_size": 0}
+        index = state.artifact_index
+        backed = isinstance(index, LazyArtifactIndex) and index.is_backed_by(self.log_path)
+        if backed:
+            writes = index.pending_writes()
+            deletes = index.pending_deletes()
+        else:
+            # A state from elsewhere (new project, JSON file): artifacts whose
+            # stored bytes already match are not rewritten.
+            on_disk = self._read_offsets(int(committed["index_size"])) if committed["index_size"] else {}
+            writes = self._changed_artifacts(index, on_disk)
+            deletes = sorted(set(on_disk) - set(index))
+
+        log_size = int(committed["log_size"])
+        index_size = int(committed["index_size"])
+        written: Dict[str, Tuple[int, int]] = {}
+        if writes or deletes:
+            index_lines: List[str] = []
+            with self.log_path.open("ab") as log:
+                # Drop bytes from an interrupted save before appending.
+                log.truncate(log_size)
+                for artifact_id, encoded in writes:
+                    log.write(encoded)
+                    log.write(b"\n")
+                    written[artifact_id] = (log_size, len(encoded))
+                    index_lines.append(f"{artifact_id}\t{log_size}\t{len(encoded)}\n")
+                    log_size += len(encoded) + 1
+                log.flush()
+                os.fsync(log.fileno())
+            index_lines.extend(f"{artifact_id}\t0\t-1\n" for artifact_id in deletes)
+            index_bytes = "".join(index_lines).encode("utf-8")
+            with self.index_path.open("ab") as index_file:
+                index_file.truncate(index_size)
+                index_file.write(index_bytes)
+                index_file.flush()
+                os.fsync(index_file.fileno())
+            index_size += len(index_bytes)
+
+        header = {
+            "format": SEGMENTED_FORMAT,
+            "log_size": log_size,
+            "index_size": index_size,
+            "state": _header_fields(state),
+        }
+        _replace_atomically(
+            self.header_path,
+            json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        )
+        if backed:
+            index.mark_written(written, dict(writes))
+
+
+    def _changed_artifacts(
+        self, index: MutableMapping[str, Dict[str, Any]], on_disk: Dict[str, Tuple[int, int]]
+    ) -> List[Tuple[str, bytes]]:
+        """Return `(artifact_id, encoded)` for artifacts missing from the log or stored differently."""
+        changed: List[Tuple[str, bytes]] = []
+        log = self.log_path.open("rb") if on_disk else None
+        try:
+            for artifact_id, artifact in index.items():
+                encoded = _encode_artifact(artifact)
+                location = on_disk.get(artifact_id)
+                if log is not None and location is not None:
+                    log.seek(location[0])
+                    if log.read(location[1]) == encoded:
+                        continue
+                changed.append((artifact_id, encoded))
+        finally:
+            if log is not None:
+                log.close()
+        return changed
+
+
+def _header_fields(state: ProjectState) -> Dict[str, Any]:
+    return {
+        "project_id": state.project_id,
+        "current_phase": state.current_phase,
+        "latest_artifacts": state.latest_artifacts,
+        "phase_validated_artifacts": state.phase_validated_artifacts,
+        "validation_records": section_dict(state.validation_records),
+        "continuity_context": state.continuity_context,
+    }
+
+
+def open_state_store(path: Path, *, codec: Optional[StateCodec] = None) -> StateStore:
+    """Pick the layout for `path`: a directory (or a suffix-less path) is segmented.
+
+    `codec` selects the snapshot encoding of a state file; it does not apply
+    to the segmented layout.
+    """
+    path = Path(path)
+    if path.is_dir() or (not path.exists() and not path.suffix):
+        return SegmentedStateStore(path)
+    return JsonStateStore(path, codec=codec)
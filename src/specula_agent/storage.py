@@ -2,103 +2,461 @@
 
 from __future__ import annotations
 
+import base64
+import gzip
 import json
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from textwrap import dedent
-from typing import Any, Dict, List, Optional
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
+from .migrations import (
+    AUDIT_PARTITION_PREFIX,
+    AUDIT_PARTITIONING_VERSION,
+    CURRENT_VERSION_SQL,
+    ENSURE_AUDIT_PARTITIONS_SQL,
+    LATEST_VERSION,
+    MIGRATION_LOCK_ID,
+    MIGRATIONS,
+    RECORD_VERSION_SQL,
+    SCHEMA_STATUS_SQL,
+    SCHEMA_VERSION_SQL,
+    SQLITE_LATEST_VERSION,
+    SQLITE_MIGRATIONS,
+    audit_partition_name,
+    month_start,
+    pending_migrations,
+)
+from .metrics import MetricsHook, caller_block, instrumented, measure, note_acquire, note_rows
 from .orchestrator import ProjectState
 
-SCHEMA_SQL = dedent(
-    """
-    CREATE TABLE IF NOT EXISTS projects (
-      project_id TEXT PRIMARY KEY,
-      name TEXT NOT NULL,
-      current_phase TEXT NOT NULL,
-      created_at TIMESTAMP NOT NULL
-    );
-
-    CREATE TABLE IF NOT EXISTS artifacts (
-      artifact_id TEXT PRIMARY KEY,
-      project_id TEXT NOT NULL REFERENCES projects(project_id),
-      phase TEXT NOT NULL,
-      mode TEXT NOT NULL,
-      generated_at TIMESTAMP NOT NULL,
-      validated_by_human BOOLEAN NOT NULL DEFAULT false,
-      payload JSONB NOT NULL
-    );
-
-    CREATE TABLE IF NOT EXISTS validations (
-      validation_id TEXT PRIMARY KEY,
-      artifact_id TEXT NOT NULL REFERENCES artifacts(artifact_id),
-      validator_id TEXT NOT NULL,
-      validator_role TEXT NOT NULL,
-      decision TEXT NOT NULL CHECK (decision IN ('approve', 'reject', 'hold')),
-      validated_at TIMESTAMP NOT NULL,
-      validated_by_human BOOLEAN NOT NULL,
-      UNIQUE (artifact_id, validator_id)
-    );
-
-    CREATE TABLE IF NOT EXISTS refusal_register (
-      refusal_id TEXT PRIMARY KEY,
-      project_id TEXT NOT NULL REFERENCES projects(project_id),
-      prototype_id TEXT NOT NULL,
-      violated_value TEXT NOT NULL,
-      opportunity_cost TEXT NOT NULL,
-      identity_signal TEXT NOT NULL,
-      refusal_date TIMESTAMP NOT NULL
-    );
-
-    CREATE TABLE IF NOT EXISTS guardian_reports (
-      guardian_id TEXT PRIMARY KEY,
-      project_id TEXT NOT NULL REFERENCES projects(project_id),
-      quarter TEXT NOT NULL,
-      divergence_level TEXT NOT NULL,
-      recommended_action TEXT NOT NULL,
-      report JSONB NOT NULL,
-      generated_at TIMESTAMP NOT NULL
-    );
-
-    CREATE TABLE IF NOT EXISTS audit_logs (
-      event_id TEXT PRIMARY KEY,
-      project_id TEXT NOT NULL REFERENCES projects(project_id),
-      phase TEXT,
-      mode TEXT,
-      event TEXT NOT NULL,
-      content TEXT NOT NULL,
-      created_at TIMESTAMP NOT NULL
-    );
-
-    CREATE INDEX IF NOT EXISTS idx_artifacts_project_phase
-      ON artifacts(project_id, phase);
-
-    CREATE INDEX IF NOT EXISTS idx_refusals_project_value
-      ON refusal_register(project_id, violated_value);
-
-    CREATE INDEX IF NOT EXISTS idx_guardian_project_quarter
-      ON guardian_reports(project_id, quarter);
-
-    CREATE INDEX IF NOT EXISTS idx_audit_project_created
-      ON audit_logs(project_id, created_at);
-
-    CREATE INDEX IF NOT EXISTS idx_validations_artifact
-      ON validations(artifact_id);
-    """
-).strip()
+# The original, re-runnable schema (migration 1). Later migrations rename and
+# rebuild tables and must go through `StorageAdapter.migrate()` or the guarded
+# script from `specula-agent export-sql`.
+SCHEMA_SQL = MIGRATIONS[0].sql
+
+UPSERT_PROJECT_SQL = """
+INSERT INTO projects (project_id, name, current_phase, created_at)
+VALUES (%s, %s, %s, %s)
+ON CONFLICT (project_id)
+DO UPDATE SET current_phase = EXCLUDED.current_phase
+"""
+INSERT_ARTIFACT_SQL = """
+INSERT INTO artifacts
+  (artifact_id, project_id, phase, mode, generated_at, validated_by_human, payload)
+VALUES (%s, %s, %s, %s, %s, %s, %s::jsonb)
+ON CONFLICT (artifact_id) DO NOTHING
+"""
+INSERT_VALIDATION_SQL = """
+INSERT INTO validations
+  (validation_id, artifact_id, validator_id, validator_role, decision, validated_at, validated_by_human)
+VALUES (%s, %s, %s, %s, %s, %s, %s)
+ON CONFLICT (artifact_id, validator_id) DO NOTHING
+RETURNING validation_id
+"""
+SELECT_VALIDATIONS_SQL = """
+SELECT validator_id, validator_role, decision, validated_by_human, validated_at
+FROM validations
+WHERE artifact_id = %s
+ORDER BY validated_at ASC
+"""
+INSERT_AUDIT_SQL = """
+INSERT INTO audit_logs (event_id, project_id, phase, mode, event, content, created_at)
+VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+# Rows per multi-row audit INSERT; 7 parameters each stays far below the protocol limit.
+AUDIT_INSERT_CHUNK = 1000
+
+
+def _multi_row_audit_sql(row_count: int) -> str:
+    values = ", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * row_count)
+    # Replayed events keep their event_id, so re-sending a batch is a no-op.
+    return (
+        "INSERT INTO audit_logs (event_id, project_id, phase, mode, event, content, created_at) "
+        f"VALUES {values} ON CONFLICT DO NOTHING"
+    )
 
 
 class StorageError(RuntimeError):
     """Raised when persistence operations fail."""
 
 
+def _project_row(state: ProjectState, now: datetime) -> Tuple[Any, ...]:
+    return (state.project_id, state.project_id, state.current_phase, now)
+
+
+def _artifact_row(project_id: str, artifact: Dict[str, Any]) -> Tuple[Any, ...]:
+    meta = artifact["meta"]
+    return (
+        meta["artifact_id"],
+        project_id,
+        str(meta["phase"]),
+        meta["mode"],
+        meta["generated_at"],
+        bool(meta["validated_by_human"]),
+        json.dumps(artifact["payload"]),
+    )
+
+
+def _validation_row(
+    artifact_id: str,
+    *,
+    validated_by_human: bool,
+    validator_id: str,
+    validator_role: str,
+    decision: str,
+    validated_at: datetime | str,
+) -> Tuple[Any, ...]:
+    decision_key = decision.lower().strip()
+    if decision_key not in {"approve", "reject", "hold"}:
+        raise StorageError("decision must be approve, reject, or hold")
+    return (
+        str(uuid4()),
+        artifact_id,
+        validator_id,
+        validator_role,
+        decision_key,
+        validated_at,
+        validated_by_human,
+    )
+
+
+def _duplicate_validation(artifact_id: str, validator_id: str) -> StorageError:
+    return StorageError(
+        f"duplicate validator signature for artifact `{artifact_id}` and validator `{validator_id}`"
+    )
+
+
+def _validation_from_row(row: Any) -> Dict[str, Any]:
+    return {
+        "validator_id": row[0],
+        "validator_role": row[1],
+        "decision": row[2],
+        "validated_by_human": bool(row[3]),
+        "validated_at": row[4].isoformat() if hasattr(row[4], "isoformat") else str(row[4]),
+    }
+
+
+def _audit_rows(events: Iterable[Dict[str, Any]], now: datetime | str) -> List[Tuple[Any, ...]]:
+    """Build audit rows; events may carry their own `event_id` and `created_at`."""
+    return [
+        (
+            event.get("event_id") or str(uuid4()),
+            event["project_id"],
+            event.get("phase"),
+            event.get("mode"),
+            event["event"],
+            event["content"],
+            event.get("created_at") or now,
+        )
+        for event in events
+    ]
+
+
+DEFAULT_QUERY_LIMIT = 50
+MAX_QUERY_LIMIT = 1000
+
+
+@dataclass(frozen=True)
+class PayloadFilter:
+    """An indexed payload predicate; `{p}` stands for the driver's placeholder."""
+
+    name: str
+    postgres: str
+    sqlite: str
+    postgres_value: Callable[[str], Any] = str
+
+
+PAYLOAD_FILTERS: Tuple[PayloadFilter, ...] = (
+    PayloadFilter(
+        name="violated_value",
+        postgres="payload @> {p}::jsonb",
+        sqlite=(
+            "EXISTS (SELECT 1 FROM json_each(artifacts.payload, '$.refusals') AS refusal "
+            "WHERE json_extract(refusal.value, '$.violated_value') = {p})"
+        ),
+        postgres_value=lambda value: json.dumps({"refusals": [{"violated_value": value}]}),
+    ),
+    PayloadFilter(
+        name="divergence_level",
+        postgres="payload #>> '{guardian_report,divergence_level}' = {p}",
+        sqlite="json_extract(payload, '$.guardian_report.divergence_level') = {p}",
+    ),
+    PayloadFilter(
+        name="recommended_action",
+        postgres="payload @> {p}::jsonb",
+        sqlite="json_extract(payload, '$.guardian_report.recommended_action') = {p}",
+        postgres_value=lambda value: json.dumps({"guardian_report": {"recommended_action": value}}),
+    ),
+)
+PAYLOAD_FILTER_BY_NAME = {payload_filter.name: payload_filter for payload_filter in PAYLOAD_FILTERS}
+ARTIFACT_COLUMNS = ("artifact_id", "project_id", "phase", "mode", "generated_at", "validated_by_human", "payload")
+
+
+@dataclass
+class ArtifactPage:
+    """One page of `query_artifacts` results; pass `next_cursor` as `after` for the next one."""
+
+    artifacts: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
+def _encode_cursor(generated_at: str, artifact_id: str) -> str:
+    raw = json.dumps([generated_at, artifact_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        generated_at, artifact_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (TypeError, ValueError) as exc:
+        raise StorageError(f"invalid page cursor `{cursor}`") from exc
+    return str(generated_at), str(artifact_id)
+
+
+def _artifact_query(
+    dialect: str,
+    *,
+    project_id: Optional[str],
+    phase: Optional[str],
+    mode: Optional[str],
+    payload: Optional[Dict[str, str]],
+    limit: int,
+    after: Optional[str],
+) -> Tuple[str, List[Any]]:
+    """Build the keyset-paginated artifact query for `postgres` or `sqlite`.
+
+    One extra row is fetched so the caller knows whether another page exists.
+    """
+    if not 1 <= limit <= MAX_QUERY_LIMIT:
+        raise StorageError(f"limit must be between 1 and {MAX_QUERY_LIMIT}")
+    postgres = dialect == "postgres"
+    placeholder = "%s" if postgres else "?"
+    clauses: List[str] = []
+    params: List[Any] = []
+    for column, value in (("project_id", project_id), ("phase", phase), ("mode", mode)):
+        if value is not None:
+            clauses.append(f"{column} = {placeholder}")
+            params.append(value)
+    for name, value in (payload or {}).items():
+        payload_filter = PAYLOAD_FILTER_BY_NAME.get(name)
+        if payload_filter is None:
+            raise StorageError(f"unknown payload filter `{name}`; expected one of {sorted(PAYLOAD_FILTER_BY_NAME)}")
+        template = payload_filter.postgres if postgres else payload_filter.sqlite
+        clauses.append(template.replace("{p}", placeholder))
+        params.append(payload_filter.postgres_value(value) if postgres else value)
+    if after:
+        generated_at, artifact_id = _decode_cursor(after)
+        cast = "::timestamp" if postgres else ""
+        clauses.append(f"(generated_at, artifact_id) > ({placeholder}{cast}, {placeholder})")
+        params.extend([generated_at, artifact_id])
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    sql = (
+        f"SELECT {', '.join(ARTIFACT_COLUMNS)} FROM artifacts{where} "
+        f"ORDER BY generated_at, artifact_id LIMIT {placeholder}"
+    )
+    params.append(limit + 1)
+    return sql, params
+
+
+def _artifact_from_row(row: Any) -> Dict[str, Any]:
+    payload = row[6] if isinstance(row[6], dict) else json.loads(row[6])
+    return {
+        "artifact_id": row[0],
+        "project_id": row[1],
+        "phase": row[2],
+        "mode": row[3],
+        "generated_at": row[4].isoformat() if hasattr(row[4], "isoformat") else str(row[4]),
+        "validated_by_human": bool(row[5]),
+        "payload": payload,
+    }
+
+
+def _artifact_page(rows: List[Any], limit: int) -> ArtifactPage:
+    artifacts = [_artifact_from_row(row) for row in rows[:limit]]
+    if len(rows) <= limit:
+        return ArtifactPage(artifacts)
+    last = artifacts[-1]
+    return ArtifactPage(artifacts, _encode_cursor(last["generated_at"], last["artifact_id"]))
+
+
+AUDIT_ARCHIVE_COLUMNS = ("event_id", "project_id", "phase", "mode", "event", "content", "created_at")
+_PARTITION_NAME_RE = re.compile(rf"^{AUDIT_PARTITION_PREFIX}(\d{{4}})(\d{{2}})$")
+
+
+def _partition_month(name: str) -> Optional[date]:
+    match = _PARTITION_NAME_RE.match(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def _write_audit_archive(archive_dir: Path, name: str, lines: Iterable[str]) -> Path:
+    """Write NDJSON lines to `<archive_dir>/<name>.ndjson.gz` atomically."""
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    target = archive_dir / f"{name}.ndjson.gz"
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as handle:
+        for line in lines:
+            handle.write(line)
+            handle.write("\n")
+    os.replace(tmp_path, target)
+    return target
+
+
+@dataclass(frozen=True)
+class ImportTable:
+    """Column layout of a table filled by bulk import."""
+
+    name: str
+    columns: Tuple[str, ...]
+    key: Tuple[str, ...]
+    # Columns overwritten by the `update` conflict policy.
+    update_columns: Tuple[str, ...]
+
+
+IMPORT_TABLES: Tuple[ImportTable, ...] = (
+    ImportTable(
+        "projects",
+        ("project_id", "name", "current_phase", "created_at"),
+        ("project_id",),
+        ("name", "current_phase"),
+    ),
+    ImportTable(
+        "artifacts",
+        ("artifact_id", "project_id", "phase", "mode", "generated_at", "validated_by_human", "payload"),
+        ("artifact_id",),
+        ("project_id", "phase", "mode", "generated_at", "validated_by_human", "payload"),
+    ),
+    ImportTable(
+        "validations",
+        (
+            "validation_id",
+            "artifact_id",
+            "validator_id",
+            "validator_role",
+            "decision",
+            "validated_at",
+            "validated_by_human",
+        ),
+        ("artifact_id", "validator_id"),
+        ("validator_role", "decision", "validated_at", "validated_by_human"),
+    ),
+    ImportTable(
+        "refusal_register",
+        (
+            "refusal_id",
+            "project_id",
+            "prototype_id",
+            "violated_value",
+            "opportunity_cost",
+            "identity_signal",
+            "refusal_date",
+        ),
+        ("refusal_id",),
+        ("project_id", "prototype_id", "violated_value", "opportunity_cost", "identity_signal", "refusal_date"),
+    ),
+)
+IMPORT_TABLE_BY_NAME = {table.name: table for table in IMPORT_TABLES}
+CONFLICT_POLICIES = ("skip", "update", "error")
+
+
+@dataclass
+class ImportBatch:
+    """Rows to bulk-load, keyed per table so duplicates within a batch collapse.
+
+    `project_stubs` are projects referenced by bare artifacts: they are created
+    when missing but never overwrite an existing project.
+    """
+
+    rows: Dict[str, Dict[Tuple[Any, ...], Tuple[Any, ...]]] = field(
+        default_factory=lambda: {table.name: {} for table in IMPORT_TABLES}
+    )
+    project_stubs: Dict[Tuple[Any, ...], Tuple[Any, ...]] = field(default_factory=dict)
+
+    def add(self, table_name: str, row: Tuple[Any, ...]) -> None:
+        table = IMPORT_TABLE_BY_NAME[table_name]
+        key = tuple(row[table.columns.index(column)] for column in table.key)
+        self.rows[table_name][key] = row
+
+    def add_project_stub(self, row: Tuple[Any, ...]) -> None:
+        self.project_stubs.setdefault((row[0],), row)
+
+    def __len__(self) -> int:
+        return len(self.project_stubs) + sum(len(rows) for rows in self.rows.values())
+
+    def plan(self, on_conflict: str) -> Iterator[Tuple[ImportTable, List[Tuple[Any, ...]], str]]:
+        """Yield `(table, rows, policy)` in foreign-key order."""
+        if on_conflict not in CONFLICT_POLICIES:
+            raise StorageError(f"on_conflict must be one of {', '.join(CONFLICT_POLICIES)}")
+        if self.project_stubs:
+            yield IMPORT_TABLE_BY_NAME["projects"], list(self.project_stubs.values()), "skip"
+        for table in IMPORT_TABLES:
+            if self.rows[table.name]:
+                yield table, list(self.rows[table.name].values()), on_conflict
+
+
+def _conflict_clause(table: ImportTable, policy: str) -> str:
+    if policy == "error":
+        return ""
+    target = ", ".join(table.key)
+    if policy == "skip":
+        return f"ON CONFLICT ({target}) DO NOTHING"
+    assignments = ", ".join(f"{column} = excluded.{column}" for column in table.update_columns)
+    return f"ON CONFLICT ({target}) DO UPDATE SET {assignments}"
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool sizing for `PostgresStorage`.
+
+    `max_idle` is in seconds; with `check` enabled, connections are tested
+    before being handed out so dropped sockets are replaced transparently.
+    """
+
+    min_size: int = 1
+    max_size: int = 4
+    max_idle: float = 300.0
+    timeout: float = 30.0
+    check: bool = True
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0 or self.max_size < 1 or self.min_size > self.max_size:
+            raise StorageError("pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+
+
 class StorageAdapter:
     """No-op adapter used when DB persistence is disabled."""
 
-    def init_schema(self) -> None:
+    def close(self) -> None:
         return
 
+    def current_schema_version(self) -> int:
+        return 0
+
+    def migrate(self) -> List[int]:
+        """Apply pending schema migrations and return their versions."""
+        return []
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator["StorageAdapter"]:
+        """Group the writes made inside the block into one transaction."""
+        yield self
+
+    def __enter__(self) -> "StorageAdapter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def init_schema(self) -> None:
+        self.migrate()
+
     def upsert_project_state(self, state: ProjectState) -> None:
         return
 
@@ -130,12 +488,66 @@ class StorageAdapter:
     ) -> None:
         return
 
+    def import_batch(self, batch: ImportBatch, *, on_conflict: str = "skip") -> Dict[str, int]:
+        """Bulk-load `batch`; returns rows written per table."""
+        return {}
+
+    def prune_audit(self, before: date, archive_dir: Path) -> List[Path]:
+        """Archive audit months older than `before` to gzip NDJSON and drop them.
+
+        Returns the archive files written, one per month (`audit_logs_pYYYYMM.ndjson.gz`).
+        """
+        return []
+
+    def query_artifacts(
+        self,
+        *,
+        project_id: Optional[str] = None,
+        phase: Optional[str] = None,
+        mode: Optional[str] = None,
+        payload: Optional[Dict[str, str]] = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+        after: Optional[str] = None,
+    ) -> ArtifactPage:
+        """Return artifacts matching every filter, ordered by `(generated_at, artifact_id)`.
+
+        `payload` maps `PAYLOAD_FILTERS` names (e.g. `violated_value`,
+        `divergence_level`) to the value to match; `after` is the cursor of the
+        previous page.
+        """
+        return ArtifactPage([])
+
+    def append_audit_many(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Persist several audit events at once.
+
+        Each event carries the `append_audit` keyword arguments
+        (`project_id`, `phase`, `mode`, `event`, `content`).
+        """
+        for event in events:
+            self.append_audit(
+                project_id=event["project_id"],
+                phase=event.get("phase"),
+                mode=event.get("mode"),
+                event=event["event"],
+                content=event["content"],
+            )
+
 
 @dataclass
 class PostgresStorage(StorageAdapter):
-    """PostgreSQL adapter for runtime persistence."""
+    """PostgreSQL adapter for runtime persistence.
+
+    Without `pool` every call opens its own connection. With `pool`, all
+    methods share a `psycopg_pool.ConnectionPool`; call `close()` (or use the
+    adapter as a context manager) to release it.
+    """
 
     database_url: str
+    pool: Optional[PoolSettings] = None
+    metrics: MetricsHook = field(default_factory=MetricsHook)
+    _pool: Any = field(default=None, init=False, repr=False)
+    _local: Any = field(default_factory=threading.local, init=False, repr=False)
+    _schema_current: bool = field(default=False, init=False, repr=False)
 
     def __post_init__(self) -> None:
         try:
@@ -145,6 +557,23 @@ class PostgresStorage(StorageAdapter):
                 "psycopg is required for --database-url usage. Install with `pip install psycopg[binary]`."
             ) from exc
         self._psycopg = psycopg
+        if self.pool is None:
+            return
+        try:
+            from psycopg_pool import ConnectionPool  # type: ignore
+        except ImportError as exc:  # pragma: no cover
+            raise StorageError(
+                "psycopg_pool is required for pooled storage. Install with `pip install psycopg[binary,pool]`."
+            ) from exc
+        self._pool = ConnectionPool(
+            self.database_url,
+            min_size=self.pool.min_size,
+            max_size=self.pool.max_size,
+            max_idle=self.pool.max_idle,
+            timeout=self.pool.timeout,
+            check=ConnectionPool.check_connection if self.pool.check else None,
+            open=True,
+        )
 
     @staticmethod
     def _utc_now() -> datetime:
@@ -153,47 +582,126 @@ class PostgresStorage(StorageAdapter):
     def _connect(self):
         return self._psycopg.connect(self.database_url)
 
-    def init_schema(self) -> None:
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        """Yield a connection that commits on success and rolls back on error.
+
+        Inside `unit_of_work` the shared connection is yielded instead and the
+        commit is left to the unit of work.
+        """
+        shared = getattr(self._local, "connection", None)
+        if shared is not None:
+            yield shared
+            return
+        started = time.perf_counter()
+        if self._pool is not None:
+            with self._pool.connection() as conn:
+                note_acquire(time.perf_counter() - started)
+                yield conn
+            return
+        # psycopg connections commit on a clean exit and roll back on an exception.
         with self._connect() as conn:
-            with conn.cursor() as cur:
-                cur.execute(SCHEMA_SQL)
+            note_acquire(time.perf_counter() - started)
+            yield conn
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator["PostgresStorage"]:
+        """Run every adapter call in the block on one connection and transaction.
+
+        Statements are sent in pipeline mode and committed once on exit; any
+        exception rolls the whole block back. Nested calls join the outer unit.
+        """
+        if getattr(self._local, "connection", None) is not None:
+            yield self
+            return
+        # Reported as its own operation: connection checkout plus the pipelined commit.
+        with measure(self.metrics, "unit_of_work") as call:
+            with self._connection() as conn:
+                with conn.transaction(), conn.pipeline():
+                    self._local.connection = conn
+                    try:
+                        with caller_block(call):
+                            yield self
+                    finally:
+                        self._local.connection = None
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
+    @instrumented
+    def current_schema_version(self) -> int:
+        """Return the applied schema version (0 for an unversioned database)."""
+        with self._connection() as conn:
+            try:
+                # A savepoint keeps an enclosing unit of work usable on failure.
+                with conn.transaction(), conn.cursor() as cur:
+                    cur.execute(CURRENT_VERSION_SQL)
+                    row = cur.fetchone()
+            except self._psycopg.errors.UndefinedTable:
+                return 0
+        return int(row[0] or 0)
+
+    def _schema_status(self) -> Tuple[int, bool]:
+        """Return the schema version and whether next month's audit partition exists."""
+        next_partition = audit_partition_name(month_start(self._utc_now().date(), 1))
+        with self._connection() as conn:
+            try:
+                with conn.transaction(), conn.cursor() as cur:
+                    cur.execute(SCHEMA_STATUS_SQL, (next_partition,))
+                    row = cur.fetchone()
+            except self._psycopg.errors.UndefinedTable:
+                return 0, False
+        return int(row[0] or 0), bool(row[1])
+
+    @instrumented
+    def migrate(self) -> List[int]:
+        """Apply pending migrations; costs a single query when the schema is current.
+
+        Also creates this and next month's audit partitions when they are missing.
+        """
+        if self._schema_current:
+            return []
+        version, partition_ready = self._schema_status()
+        applied: List[int] = []
+        if version < LATEST_VERSION:
+            with self._connection() as conn:
+                with conn.transaction(), conn.cursor() as cur:
+                    cur.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+                    cur.execute(SCHEMA_VERSION_SQL)
+                    cur.execute(CURRENT_VERSION_SQL)
+                    row = cur.fetchone()
+                    for migration in pending_migrations(int(row[0] or 0)):
+                        cur.execute(migration.sql)
+                        cur.execute(RECORD_VERSION_SQL, (migration.version, migration.name, self._utc_now()))
+                        applied.append(migration.version)
+        if not partition_ready and LATEST_VERSION >= AUDIT_PARTITIONING_VERSION:
+            this_month = month_start(self._utc_now().date())
+            with self._connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(ENSURE_AUDIT_PARTITIONS_SQL, (this_month, month_start(this_month, 1)))
+        self._schema_current = True
+        return applied
+
+    def init_schema(self) -> None:
+        self.migrate()
+
+    @instrumented
     def upsert_project_state(self, state: ProjectState) -> None:
-        now = self._utc_now()
-        with self._connect() as conn:
+        with self._connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO projects (project_id, name, current_phase, created_at)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (project_id)
-                    DO UPDATE SET current_phase = EXCLUDED.current_phase
-                    """,
-                    (state.project_id, state.project_id, state.current_phase, now),
-                )
+                cur.execute(UPSERT_PROJECT_SQL, _project_row(state, self._utc_now()))
+                note_rows(cur.rowcount)
 
+    @instrumented
     def insert_artifact(self, project_id: str, artifact: Dict[str, Any]) -> None:
-        meta = artifact["meta"]
-        with self._connect() as conn:
+        with self._connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO artifacts
-                      (artifact_id, project_id, phase, mode, generated_at, validated_by_human, payload)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s::jsonb)
-                    ON CONFLICT (artifact_id) DO NOTHING
-                    """,
-                    (
-                        meta["artifact_id"],
-                        project_id,
-                        str(meta["phase"]),
-                        meta["mode"],
-                        meta["generated_at"],
-                        bool(meta["validated_by_human"]),
-                        json.dumps(artifact["payload"]),
-                    ),
-                )
+                cur.execute(INSERT_ARTIFACT_SQL, _artifact_row(project_id, artifact))
+                note_rows(cur.rowcount)
 
+    @instrumented
     def insert_validation(
         self,
         artifact_id: str,
@@ -203,57 +711,310 @@ class PostgresStorage(StorageAdapter):
         validator_role: str,
         decision: str,
     ) -> None:
-        decision_key = decision.lower().strip()
-        if decision_key not in {"approve", "reject", "hold"}:
-            raise StorageError("decision must be approve, reject, or hold")
-        with self._connect() as conn:
+        row = _validation_row(
+            artifact_id,
+            validated_by_human=validated_by_human,
+            validator_id=validator_id,
+            validator_role=validator_role,
+            decision=decision,
+            validated_at=self._utc_now(),
+        )
+        with self._connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(INSERT_VALIDATION_SQL, row)
+                # fetchone() rather than rowcount: it also syncs in pipeline mode.
+                if cur.fetchone() is None:
+                    raise _duplicate_validation(artifact_id, validator_id)
+                note_rows(1)
+
+    @instrumented
+    def get_validations(self, artifact_id: str) -> List[Dict[str, Any]]:
+        with self._connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(SELECT_VALIDATIONS_SQL, (artifact_id,))
+                rows = cur.fetchall()
+        note_rows(len(rows))
+        return [_validation_from_row(row) for row in rows]
+
+    @instrumented
+    def append_audit(
+        self,
+        *,
+        project_id: str,
+        phase: Optional[str],
+        mode: Optional[str],
+        event: str,
+        content: str,
+    ) -> None:
+        with self._connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
-                    INSERT INTO validations
-                      (validation_id, artifact_id, validator_id, validator_role, decision, validated_at, validated_by_human)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (artifact_id, validator_id) DO NOTHING
-                    """,
-                    (
-                        str(uuid4()),
-                        artifact_id,
-                        validator_id,
-                        validator_role,
-                        decision_key,
-                        self._utc_now(),
-                        validated_by_human,
-                    ),
+                    INSERT_AUDIT_SQL,
+                    (str(uuid4()), project_id, phase, mode, event, content, self._utc_now()),
                 )
-                if cur.rowcount == 0:
-                    raise StorageError(
-                        f"duplicate validator signature for artifact `{artifact_id}` and validator `{validator_id}`"
+                note_rows(cur.rowcount)
+
+    @instrumented
+    def append_audit_many(self, events: Iterable[Dict[str, Any]]) -> None:
+        rows = _audit_rows(events, self._utc_now())
+        if not rows:
+            return
+        with self._connection() as conn:
+            with conn.cursor() as cur:
+                for start in range(0, len(rows), AUDIT_INSERT_CHUNK):
+                    chunk = rows[start : start + AUDIT_INSERT_CHUNK]
+                    cur.execute(_multi_row_audit_sql(len(chunk)), [value for row in chunk for value in row])
+                    note_rows(cur.rowcount)
+
+    @instrumented
+    def import_batch(self, batch: ImportBatch, *, on_conflict: str = "skip") -> Dict[str, int]:
+        """COPY each table's rows into a temp staging table, then merge with ON CONFLICT."""
+        counts: Dict[str, int] = {}
+        with self._connection() as conn:
+            with conn.cursor() as cur:
+                for table, rows, policy in batch.plan(on_conflict):
+                    columns = ", ".join(table.columns)
+                    stage = f"specula_import_{table.name}"
+                    cur.execute(
+                        f"CREATE TEMP TABLE IF NOT EXISTS {stage} "
+                        f"(LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
                     )
+                    cur.execute(f"TRUNCATE {stage}")
+                    with cur.copy(f"COPY {stage} ({columns}) FROM STDIN") as copy:
+                        for row in rows:
+                            copy.write_row(row)
+                    cur.execute(
+                        f"INSERT INTO {table.name} ({columns}) SELECT {columns} FROM {stage} "
+                        + _conflict_clause(table, policy)
+                    )
+                    counts[table.name] = counts.get(table.name, 0) + max(cur.rowcount, 0)
+        note_rows(sum(counts.values()))
+        return counts
 
-    def get_validations(self, artifact_id: str) -> List[Dict[str, Any]]:
-        with self._connect() as conn:
+    @instrumented
+    def query_artifacts(
+        self,
+        *,
+        project_id: Optional[str] = None,
+        phase: Optional[str] = None,
+        mode: Optional[str] = None,
+        payload: Optional[Dict[str, str]] = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+        after: Optional[str] = None,
+    ) -> ArtifactPage:
+        sql, params = _artifact_query(
+            "postgres", project_id=project_id, phase=phase, mode=mode, payload=payload, limit=limit, after=after
+        )
+        with self._connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, params)
+                rows = cur.fetchall()
+        note_rows(min(len(rows), limit))
+        return _artifact_page(rows, limit)
+
+    @instrumented
+    def prune_audit(self, before: date, archive_dir: Path) -> List[Path]:
+        """Detach monthly audit partitions older than `before`, archive, then drop them.
+
+        Partitions left detached by an interrupted run are archived too. Rows
+        in `audit_logs_default` are not pruned.
+        """
+        cutoff = month_start(before)
+        with self._connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
-                    SELECT validator_id, validator_role, decision, validated_by_human, validated_at
-                    FROM validations
-                    WHERE artifact_id = %s
-                    ORDER BY validated_at ASC
+                    SELECT c.relname, c.relispartition
+                    FROM pg_class c
+                    WHERE c.relkind = 'r' AND c.relname ~ %s
+                    ORDER BY c.relname
                     """,
-                    (artifact_id,),
+                    (_PARTITION_NAME_RE.pattern,),
                 )
-                rows = cur.fetchall()
-        return [
-            {
-                "validator_id": row[0],
-                "validator_role": row[1],
-                "decision": row[2],
-                "validated_by_human": bool(row[3]),
-                "validated_at": row[4].isoformat() if hasattr(row[4], "isoformat") else str(row[4]),
-            }
-            for row in rows
-        ]
+                candidates = [
+                    (name, attached)
+                    for name, attached in cur.fetchall()
+                    if (_partition_month(name) or cutoff) < cutoff
+                ]
+
+        archives: List[Path] = []
+        for name, attached in candidates:
+            if attached:
+                with self._connection() as conn:
+                    conn.execute(f'ALTER TABLE audit_logs DETACH PARTITION "{name}"')
+            with self._connection() as conn:
+                columns = ", ".join(AUDIT_ARCHIVE_COLUMNS)
+                with conn.cursor(name=f"specula_archive_{name}") as cur:
+                    cur.itersize = 5000
+                    cur.execute(f'SELECT row_to_json(t)::text FROM (SELECT {columns} FROM "{name}" ORDER BY created_at) t')
+                    archives.append(_write_audit_archive(archive_dir, name, (row[0] for row in cur)))
+            with self._connection() as conn:
+                conn.execute(f'DROP TABLE "{name}"')
+        return archives
+
 
+@dataclass
+class SQLiteStorage(StorageAdapter):
+    """Embedded SQLite adapter (WAL mode) for edge and single-developer setups.
+
+    One connection is shared by all methods behind a lock; `unit_of_work`
+    holds the lock and a single transaction for the whole block.
+    """
+
+    path: str
+    busy_timeout_ms: int = 5000
+    metrics: MetricsHook = field(default_factory=MetricsHook)
+    _conn: Any = field(default=None, init=False, repr=False)
+    _lock: Any = field(default_factory=threading.RLock, init=False, repr=False)
+    _local: Any = field(default_factory=threading.local, init=False, repr=False)
+    _schema_current: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; transactions are opened explicitly in `_connection`.
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+
+    @staticmethod
+    def _utc_now() -> datetime:
+        return datetime.now(timezone.utc).replace(microsecond=0)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield the connection inside a transaction (or the enclosing unit of work)."""
+        if getattr(self._local, "in_unit", False):
+            yield self._conn
+            return
+        started = time.perf_counter()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            note_acquire(time.perf_counter() - started)
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator["SQLiteStorage"]:
+        if getattr(self._local, "in_unit", False):
+            yield self
+            return
+        with measure(self.metrics, "unit_of_work") as call:
+            with self._connection():
+                self._local.in_unit = True
+                try:
+                    with caller_block(call):
+                        yield self
+                finally:
+                    self._local.in_unit = False
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @instrumented
+    def current_schema_version(self) -> int:
+        return int(self._conn.execute("PRAGMA user_version").fetchone()[0])
+
+    @instrumented
+    def migrate(self) -> List[int]:
+        if self._schema_current:
+            return []
+        if self.current_schema_version() >= SQLITE_LATEST_VERSION:
+            self._schema_current = True
+            return []
+        applied: List[int] = []
+        with self._connection() as conn:
+            for migration in pending_migrations(self.current_schema_version(), SQLITE_MIGRATIONS):
+                for statement in migration.sql.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {migration.version}")
+                applied.append(migration.version)
+        self._schema_current = True
+        return applied
+
+    @instrumented
+    def upsert_project_state(self, state: ProjectState) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO projects (project_id, name, current_phase, created_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (project_id) DO UPDATE SET current_phase = excluded.current_phase
+                """,
+                (state.project_id, state.project_id, state.current_phase, self._utc_now().isoformat()),
+            )
+            note_rows(1)
+
+    @instrumented
+    def insert_artifact(self, project_id: str, artifact: Dict[str, Any]) -> None:
+        with self._connection() as conn:
+            cur = conn.execute(
+                """
+                INSERT OR IGNORE INTO artifacts
+                  (artifact_id, project_id, phase, mode, generated_at, validated_by_human, payload)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                _artifact_row(project_id, artifact),
+            )
+            note_rows(cur.rowcount)
+
+    @instrumented
+    def insert_validation(
+        self,
+        artifact_id: str,
+        *,
+        validated_by_human: bool,
+        validator_id: str,
+        validator_role: str,
+        decision: str,
+    ) -> None:
+        row = _validation_row(
+            artifact_id,
+            validated_by_human=validated_by_human,
+            validator_id=validator_id,
+            validator_role=validator_role,
+            decision=decision,
+            validated_at=self._utc_now().isoformat(),
+        )
+        with self._connection() as conn:
+            cur = conn.execute(
+                """
+                INSERT OR IGNORE INTO validations
+                  (validation_id, artifact_id, validator_id, validator_role, decision, validated_at, validated_by_human)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                row,
+            )
+            if cur.rowcount == 0:
+                raise _duplicate_validation(artifact_id, validator_id)
+            note_rows(1)
+
+    @instrumented
+    def get_validations(self, artifact_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT validator_id, validator_role, decision, validated_by_human, validated_at
+                FROM validations
+                WHERE artifact_id = ?
+                ORDER BY validated_at ASC
+                """,
+                (artifact_id,),
+            ).fetchall()
+        note_rows(len(rows))
+        return [_validation_from_row(row) for row in rows]
+
+    @instrumented
     def append_audit(
         self,
         *,
@@ -263,19 +1024,106 @@ class PostgresStorage(StorageAdapter):
         event: str,
         content: str,
     ) -> None:
-        with self._connect() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO audit_logs (event_id, project_id, phase, mode, event, content, created_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (str(uuid4()), project_id, phase, mode, event, content, self._utc_now()),
+        self.append_audit_many(
+            [{"project_id": project_id, "phase": phase, "mode": mode, "event": event, "content": content}]
+        )
+
+    @instrumented
+    def append_audit_many(self, events: Iterable[Dict[str, Any]]) -> None:
+        rows = _audit_rows(events, self._utc_now().isoformat())
+        if not rows:
+            return
+        with self._connection() as conn:
+            cur = conn.executemany(
+                """
+                INSERT OR IGNORE INTO audit_logs (event_id, project_id, phase, mode, event, content, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            note_rows(cur.rowcount)
+
+    @instrumented
+    def import_batch(self, batch: ImportBatch, *, on_conflict: str = "skip") -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        with self._connection() as conn:
+            for table, rows, policy in batch.plan(on_conflict):
+                placeholders = ", ".join("?" for _ in table.columns)
+                before = conn.total_changes
+                conn.executemany(
+                    f"INSERT INTO {table.name} ({', '.join(table.columns)}) VALUES ({placeholders}) "
+                    + _conflict_clause(table, policy),
+                    rows,
+                )
+                counts[table.name] = counts.get(table.name, 0) + conn.total_changes - before
+        note_rows(sum(counts.values()))
+        return counts
+
+    @instrumented
+    def query_artifacts(
+        self,
+        *,
+        project_id: Optional[str] = None,
+        phase: Optional[str] = None,
+        mode: Optional[str] = None,
+        payload: Optional[Dict[str, str]] = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+        after: Optional[str] = None,
+    ) -> ArtifactPage:
+        sql, params = _artifact_query(
+            "sqlite", project_id=project_id, phase=phase, mode=mode, payload=payload, limit=limit, after=after
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        note_rows(min(len(rows), limit))
+        return _artifact_page(rows, limit)
+
+    @instrumented
+    def prune_audit(self, before: date, archive_dir: Path) -> List[Path]:
+        """Archive audit rows older than `before` per month, then delete them."""
+        cutoff = month_start(before).isoformat()
+        with self._lock:
+            months = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT DISTINCT substr(created_at, 1, 7) FROM audit_logs WHERE created_at < ? ORDER BY 1",
+                    (cutoff,),
+                )
+            ]
+        archives: List[Path] = []
+        for month in months:
+            first_day = date.fromisoformat(f"{month}-01")
+            bounds = (first_day.isoformat(), month_start(first_day, 1).isoformat())
+            with self._connection() as conn:
+                rows = conn.execute(
+                    f"SELECT {', '.join(AUDIT_ARCHIVE_COLUMNS)} FROM audit_logs "
+                    "WHERE created_at >= ? AND created_at < ? ORDER BY created_at",
+                    bounds,
                 )
+                lines = (json.dumps(dict(zip(AUDIT_ARCHIVE_COLUMNS, row)), ensure_ascii=False) for row in rows)
+                archives.append(_write_audit_archive(archive_dir, audit_partition_name(first_day), lines))
+                conn.execute("DELETE FROM audit_logs WHERE created_at >= ? AND created_at < ?", bounds)
+        return archives
+
 
+SQLITE_URL_PREFIX = "sqlite:///"
 
-def build_storage(database_url: str | None) -> StorageAdapter:
-    """Factory for storage adapter."""
+
+def build_storage(
+    database_url: str | None,
+    *,
+    pool: Optional[PoolSettings] = None,
+    metrics: Optional[MetricsHook] = None,
+) -> StorageAdapter:
+    """Factory for storage adapter.
+
+    `sqlite:///path/to/file.db` selects the embedded SQLite backend (`sqlite:////abs/path`
+    for absolute paths); any other URL is PostgreSQL, pooled when `pool` is given.
+    Every adapter call is reported to `metrics` when given.
+    """
     if not database_url:
         return StorageAdapter()
-    return PostgresStorage(database_url=database_url)
+    metrics = metrics or MetricsHook()
+    if database_url.startswith(SQLITE_URL_PREFIX):
+        return SQLiteStorage(path=database_url[len(SQLITE_URL_PREFIX) :], metrics=metrics)
+    return PostgresStorage(database_url=database_url, pool=pool, metrics=metrics)
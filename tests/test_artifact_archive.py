@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from specula_agent.artifact_archive import ArchiveError, ArtifactArchive, is_archive, write_archive
+from specula_agent.cli import main
+from specula_agent.orchestrator import ProjectState, SpeculaOrchestrator
+
+
+def _artifact(artifact_id, related=()):
+    return {
+        "meta": {"artifact_id": artifact_id, "phase": "0", "related_artifacts": list(related)},
+        "payload": {"note": f"draft {artifact_id} ✓"},
+    }
+
+
+def test_archive_lookups_use_the_sorted_index(tmp_path):
+    path = tmp_path / "artifacts.spa"
+    ids = ["b", "a", "é", "c-10", "c-9", "b"]
+    assert write_archive(path, ((artifact_id, _artifact(artifact_id)) for artifact_id in ids)) == 5
+    assert is_archive(path)
+
+    with ArtifactArchive(path) as archive:
+        assert list(archive) == sorted(set(ids), key=lambda item: item.encode("utf-8"))
+        assert len(archive) == 5
+        assert archive["é"] == _artifact("é")
+        assert "c-9" in archive and "c" not in archive and "zz" not in archive
+        assert archive.get("missing") is None
+        view = archive.raw("a")
+        assert isinstance(view, memoryview)
+        assert json.loads(bytes(view)) == _artifact("a")
+        view.release()
+
+
+def test_empty_and_corrupt_archives(tmp_path):
+    empty = tmp_path / "empty.spa"
+    write_archive(empty, [])
+    with ArtifactArchive(empty) as archive:
+        assert len(archive) == 0 and "a" not in archive
+
+    truncated = tmp_path / "truncated.spa"
+    write_archive(truncated, [("a", _artifact("a"))])
+    truncated.write_bytes(truncated.read_bytes()[:-4])
+    with pytest.raises(ArchiveError):
+        ArtifactArchive(truncated)
+    not_archive = tmp_path / "state.json"
+    not_archive.write_text("{}", encoding="utf-8")
+    assert not is_archive(not_archive)
+    with pytest.raises(ArchiveError):
+        ArtifactArchive(not_archive)
+
+
+def test_orchestrator_resolves_artifacts_from_the_archive(tmp_path):
+    path = tmp_path / "artifacts.spa"
+    write_archive(path, [("old", _artifact("old"))])
+    state = ProjectState(project_id="project-test")
+    state.artifact_index["new"] = _artifact("new", related=["old", "gone"])
+    with ArtifactArchive(path) as archive:
+        orchestrator = SpeculaOrchestrator(state, artifact_source=archive)
+        assert orchestrator.resolve_artifact("new") is state.artifact_index["new"]
+        assert orchestrator.resolve_artifact("old") == _artifact("old")
+        assert orchestrator.resolve_related_artifacts("new") == {"old": _artifact("old"), "gone": None}
+        with pytest.raises(ValueError):
+            orchestrator.resolve_related_artifacts("gone")
+
+
+def test_cli_export_archive_and_show_artifact(tmp_path, capsys):
+    state_file = tmp_path / "state.json"
+    assert main(["step", "--state-file", str(state_file), "--user-input", "activate"]) == 0
+    archive = tmp_path / "artifacts.spa"
+    assert main(["export-archive", str(state_file), str(archive)]) == 0
+    capsys.readouterr()
+
+    with ArtifactArchive(archive) as opened:
+        (artifact_id,) = list(opened)
+    assert main(["show-artifact", artifact_id, "--archive", str(archive), "--related"]) == 0
+    shown = json.loads(capsys.readouterr().out)
+    assert shown["artifact"]["meta"]["artifact_id"] == artifact_id
+    assert shown["related_artifacts"] == {}
+    assert main(["show-artifact", "missing", "--archive", str(archive)]) == 1
@@ -0,0 +1,29 @@
+import asyncio
+
+from specula_agent.async_storage import AsyncStorageAdapter, build_async_storage
+from specula_agent.orchestrator import ProjectState
+
+
+def test_noop_async_storage_adapter_methods_are_safe():
+    async def scenario():
+        async with build_async_storage(None) as storage:
+            assert isinstance(storage, AsyncStorageAdapter)
+            await storage.init_schema()
+            state = ProjectState(project_id="project-test", current_phase="0")
+            async with storage.unit_of_work():
+                await asyncio.gather(
+                    storage.upsert_project_state(state),
+                    storage.append_audit(
+                        project_id=state.project_id, phase="0", mode=None, event="TEST_EVENT", content="ok"
+                    ),
+                )
+            await storage.insert_validation(
+                "artifact-1",
+                validated_by_human=True,
+                validator_id="validator",
+                validator_role="strategy_lead",
+                decision="approve",
+            )
+            return await storage.get_validations("artifact-1")
+
+    assert asyncio.run(scenario()) == []
@@ -0,0 +1,108 @@
+import signal
+import time
+
+import pytest
+
+from specula_agent.audit import AuditBackpressureError, BufferedAuditSink
+from specula_agent.storage import StorageAdapter
+
+
+class _RecordingStorage(StorageAdapter):
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    def append_audit_many(self, events):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append([dict(event) for event in events])
+
+
+def _event(sink, index):
+    sink.append_audit(project_id="project-test", phase="0", mode=None, event="TEST_EVENT", content=str(index))
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_sink_flushes_on_batch_size_interval_and_close():
+    storage = _RecordingStorage()
+    sink = BufferedAuditSink(storage, max_batch=3, flush_interval=60, install_exit_hooks=False)
+    for index in range(3):
+        _event(sink, index)
+    assert _wait_for(lambda: len(storage.batches) == 1)
+    assert [event["content"] for event in storage.batches[0]] == ["0", "1", "2"]
+
+    _event(sink, 3)
+    sink.close()
+    assert [event["content"] for event in storage.batches[-1]] == ["3"]
+
+    timed = _RecordingStorage()
+    with BufferedAuditSink(timed, max_batch=100, flush_interval=0.05, install_exit_hooks=False) as sink:
+        _event(sink, 0)
+        assert _wait_for(lambda: len(timed.batches) == 1)
+
+
+def test_sink_applies_backpressure_when_writes_fail():
+    storage = _RecordingStorage(fail=True)
+    sink = BufferedAuditSink(storage, max_queue=1, put_timeout=0.01, flush_interval=60, install_exit_hooks=False)
+    _event(sink, 0)
+    with pytest.raises(AuditBackpressureError):
+        _event(sink, 1)
+    sink.close()
+    assert sink.failures >= 1
+
+
+def test_spilled_events_are_replayed_after_failed_flush(tmp_path):
+    spill = tmp_path / "audit.spill.ndjson"
+    failing = _RecordingStorage(fail=True)
+    sink = BufferedAuditSink(failing, spill_path=spill, flush_interval=60, install_exit_hooks=False)
+    _event(sink, 0)
+    _event(sink, 1)
+    sink.close()
+    assert len(spill.read_text(encoding="utf-8").splitlines()) == 2
+
+    storage = _RecordingStorage()
+    replay = BufferedAuditSink(storage, spill_path=spill, flush_interval=60, install_exit_hooks=False)
+    _event(replay, 2)
+    replay.close()
+
+    written = [event for batch in storage.batches for event in batch]
+    assert [event["content"] for event in written] == ["0", "1", "2"]
+    assert len({event["event_id"] for event in written}) == 3
+    assert not spill.exists()
+
+
+def test_sigterm_handler_takes_no_locks_and_exits_through_atexit():
+    previous = signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    try:
+        storage = _RecordingStorage()
+        sink = BufferedAuditSink(storage, flush_interval=60)
+        _event(sink, 0)
+        handler = signal.getsignal(signal.SIGTERM)
+        # As if the signal arrived while the main thread was inside the sink.
+        with sink._spill_lock, sink._flush_lock:
+            with pytest.raises(SystemExit) as excinfo:
+                handler(signal.SIGTERM, None)
+        assert excinfo.value.code == 128 + signal.SIGTERM
+        assert storage.batches == []
+
+        sink.close()  # what the atexit hook does once the stack has unwound
+        assert [event["content"] for event in storage.batches[0]] == ["0"]
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+
+def test_spill_file_is_fsynced_before_each_batch(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr("specula_agent.audit.os.fsync", synced.append)
+    storage = _RecordingStorage()
+    sink = BufferedAuditSink(storage, spill_path=tmp_path / "spill.ndjson", flush_interval=60, install_exit_hooks=False)
+    _event(sink, 0)
+    sink.flush()
+    assert len(synced) == 1 and len(storage.batches) == 1
+    sink.close()
@@ -0,0 +1,110 @@
+import importlib
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from specula_agent import cache as cache_module
+from specula_agent.cache import ValidationCache, canonical_hash, configure_validation_cache
+from specula_agent.policy import validate_assistant_text
+from specula_agent.schemas import ValidatorRegistry, validate_artifact, validator_cache_stats
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples" / "basic-case"
+SCHEMAS = Path(__file__).resolve().parent.parent / "schemas"
+
+
+@pytest.fixture
+def fresh_cache():
+    previous = cache_module.get_validation_cache()
+    cache = configure_validation_cache(max_entries=8)
+    yield cache
+    cache_module._RESULT_CACHE = previous
+
+
+def test_canonical_hash_ignores_key_order():
+    assert canonical_hash({"a": 1, "b": [1, 2]}) == canonical_hash({"b": [1, 2], "a": 1})
+    assert canonical_hash({"a": 1}) != canonical_hash({"a": 2})
+
+
+def test_lru_evicts_oldest_entry():
+    cache = ValidationCache(max_entries=2)
+    cache.put("ns", "a", [])
+    cache.put("ns", "b", ["x"])
+    assert cache.get("ns", "a") == []
+    cache.put("ns", "c", [])
+    assert cache.get("ns", "b") is None
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1, "size": 2}
+
+
+def test_disk_tier_survives_new_instance_and_namespace_drop(tmp_path):
+    ValidationCache(disk_dir=tmp_path).put("schema-1", "key", ["error"])
+    reopened = ValidationCache(disk_dir=tmp_path)
+    assert reopened.get("schema-1", "key") == ["error"]
+    assert reopened.stats()["disk_hits"] == 1
+
+    reopened.drop_namespace("schema-1")
+    assert ValidationCache(disk_dir=tmp_path).get("schema-1", "key") is None
+
+
+def test_validate_artifact_and_text_use_result_cache(fresh_cache):
+    with (EXAMPLES / "phase-2-brand-dna.json").open(encoding="utf-8") as handle:
+        artifact = json.load(handle)
+    text = "MODE: brand_archaeology | PHASE: 2\nWhich value stays?"
+
+    first = validate_artifact(artifact, current_phase="1")
+    first.append("caller mutation must not leak into the cache")
+    assert validate_artifact(artifact, current_phase="1") == first[:-1]
+    assert validate_assistant_text(text) == validate_assistant_text(text) == []
+    assert fresh_cache.stats()["hits"] == 2
+
+
+def test_schema_reload_drops_cached_namespace(tmp_path):
+    filename = "phase0_activation.schema.json"
+    shutil.copy(SCHEMAS / filename, tmp_path)
+    dropped = []
+    registry = ValidatorRegistry(schema_dir=tmp_path, on_reload=dropped.append)
+    original_sha = registry.entry("0", "sensemaking").sha256
+
+    schema_path = tmp_path / filename
+    schema_path.write_text(schema_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    stat = schema_path.stat()
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    registry.entry("0", "sensemaking")
+
+    assert dropped == [original_sha]
+
+
+@pytest.mark.parametrize("value", [{"a": (1, 2)}, {1: "a"}, [datetime(2024, 1, 1)]])
+def test_canonical_hash_rejects_non_json_values(value):
+    with pytest.raises(TypeError):
+        canonical_hash(value)
+
+
+def test_validate_artifact_skips_cache_for_non_json_artifacts(fresh_cache):
+    with (EXAMPLES / "phase-2-brand-dna.json").open(encoding="utf-8") as handle:
+        artifact = json.load(handle)
+    artifact["payload"]["tuple_field"] = (1, 2)
+
+    validate_artifact(artifact, current_phase="1")
+    assert fresh_cache.stats()["size"] == 0
+
+
+def test_validate_artifact_looks_up_registry_once(fresh_cache):
+    with (EXAMPLES / "phase-2-brand-dna.json").open(encoding="utf-8") as handle:
+        artifact = json.load(handle)
+    before = validator_cache_stats()
+    validate_artifact(artifact, current_phase="1")
+    after = validator_cache_stats()
+    assert after["hits"] + after["misses"] - before["hits"] - before["misses"] == 1
+
+
+def test_result_cache_is_off_by_default(monkeypatch):
+    monkeypatch.delenv(cache_module.CACHE_DIR_ENV, raising=False)
+    previous = cache_module.get_validation_cache()
+    try:
+        assert importlib.reload(cache_module).get_validation_cache() is None
+    finally:
+        cache_module._RESULT_CACHE = previous
@@ -0,0 +1,36 @@
+import json
+
+from specula_agent.cli import main
+from specula_agent.state_store import JsonStateStore
+
+
+def test_advance_records_validation_once_even_when_phase_cannot_advance(tmp_path, capsys):
+    state_file = tmp_path / "state.json"
+    assert main(["step", "--state-file", str(state_file), "--user-input", "activate"]) == 0
+    artifact_id = json.loads(state_file.read_text(encoding="utf-8"))["latest_artifacts"]["0"]
+    capsys.readouterr()
+
+    exit_code = main(
+        [
+            "advance",
+            "--state-file",
+            str(state_file),
+            "--phase",
+            "0",
+            "--artifact-id",
+            artifact_id,
+            "--validator-id",
+            "validator-1",
+            "--validator-role",
+            "strategy_lead",
+            "--decision",
+            "approve",
+            "--validated-by-human",
+        ]
+    )
+
+    assert exit_code == 1
+    assert "requires at least two human approvals" in capsys.readouterr().err
+    state = JsonStateStore(state_file).load()
+    assert state.current_phase == "0"
+    assert [row["validator_id"] for row in state.validation_records[artifact_id]] == ["validator-1"]
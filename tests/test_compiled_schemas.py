@@ -0,0 +1,88 @@
+"""Parity test: generated validators must agree with jsonschema.
+
+`specula-agent compile-schemas` turns each phase schema into a plain-Python
+module. These tests run both engines over `examples/basic-case` plus a set of
+mutated copies and require identical `(path, message)` lists.
+"""
+import copy
+import json
+from pathlib import Path
+
+import pytest
+from jsonschema import Draft202012Validator, FormatChecker
+
+from specula_agent.compiled_schemas import phase0_activation
+from specula_agent.schema_compiler import compile_schema_source, module_name_for, schema_digest
+from specula_agent.schemas import ValidatorRegistry, schema_filename_for
+from test_examples import EXAMPLE_SCHEMA_MAP, EXAMPLES, SCHEMAS, _load
+
+
+def _mutations(example):
+    yield example
+    yield {}
+    yield []
+    yield {**example, "unexpected": 1, "another": 2}
+    meta_missing = copy.deepcopy(example)
+    meta_missing["meta"].pop("artifact_id", None)
+    meta_missing["meta"]["phase"] = 3
+    meta_missing["meta"]["validated_by_human"] = 0
+    meta_missing["meta"]["generated_at"] = "not a date"
+    meta_missing["meta"]["evidence_refs"] = []
+    meta_missing["meta"]["tradeoffs"] = [""]
+    meta_missing["meta"]["related_artifacts"] = "artifact-1"
+    yield meta_missing
+
+    def scramble(node):
+        if isinstance(node, dict):
+            return {key: scramble(value) for key, value in node.items()} | {"zz_extra": True}
+        if isinstance(node, list):
+            return [scramble(item) for item in node] + [None, 1.5, True]
+        if isinstance(node, str):
+            return "" if len(node) % 2 else 7
+        if isinstance(node, bool):
+            return int(node)
+        return str(node)
+
+    yield {"meta": example["meta"], "payload": scramble(example["payload"])}
+
+
+def _jsonschema_errors(schema_name, instance):
+    validator = Draft202012Validator(_load(SCHEMAS / schema_name), format_checker=FormatChecker())
+    return sorted((tuple(issue.path), issue.message) for issue in validator.iter_errors(instance))
+
+
+def _compiled_errors(schema_name, instance):
+    source = compile_schema_source(schema_name, (SCHEMAS / schema_name).read_bytes())
+    namespace = {"__name__": f"specula_agent.compiled_schemas.{module_name_for(schema_name)}"}
+    namespace["__package__"] = "specula_agent.compiled_schemas"
+    exec(compile(source, schema_name, "exec"), namespace)
+    return sorted(namespace["collect_errors"](instance), key=lambda item: (repr(item[0]), item[1]))
+
+
+@pytest.mark.parametrize("example_name,schema_name", sorted(EXAMPLE_SCHEMA_MAP.items()))
+def test_compiled_validator_matches_jsonschema(example_name, schema_name):
+    example = _load(EXAMPLES / example_name)
+    for instance in _mutations(example):
+        expected = sorted(_jsonschema_errors(schema_name, instance), key=lambda item: (repr(item[0]), item[1]))
+        assert _compiled_errors(schema_name, instance) == expected
+
+
+@pytest.mark.parametrize("schema_name", sorted(set(EXAMPLE_SCHEMA_MAP.values())))
+def test_shipped_compiled_module_is_current(schema_name):
+    module = __import__(
+        f"specula_agent.compiled_schemas.{module_name_for(schema_name)}", fromlist=["SCHEMA_SHA256"]
+    )
+    assert module.SCHEMA_SHA256 == schema_digest((SCHEMAS / schema_name).read_bytes()), (
+        "stale compiled validator; run `specula-agent compile-schemas`"
+    )
+
+
+def test_registry_prefers_compiled_validator_and_ignores_stale_modules(tmp_path):
+    registry = ValidatorRegistry()
+    assert registry.entry("0", "sensemaking").collector is phase0_activation.collect_errors
+
+    filename = schema_filename_for("0", "sensemaking")
+    schema = json.loads((SCHEMAS / filename).read_text(encoding="utf-8"))
+    (tmp_path / filename).write_text(json.dumps(schema), encoding="utf-8")
+    stale = ValidatorRegistry(schema_dir=tmp_path)
+    assert stale.entry("0", "sensemaking").collector is None
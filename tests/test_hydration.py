@@ -0,0 +1,80 @@
+import json
+
+from specula_agent.hydration import LazyMapping, section_dict
+from specula_agent.orchestrator import ProjectState
+
+
+def _state_dict():
+    return {
+        "project_id": "project-test",
+        "current_phase": "1",
+        "artifact_index": {
+            "a1": {"meta": {"artifact_id": "a1", "phase": "0"}, "payload": {}},
+            "a2": {"meta": {"artifact_id": "a2", "phase": "1"}, "payload": {}},
+        },
+        "validation_records": {
+            "a1": [
+                {"validator_id": "v1", "validator_role": "lead", "decision": "APPROVE"},
+                {"validator_id": "", "validator_role": "lead", "decision": "approve"},
+            ],
+            "broken": "not-a-list",
+        },
+    }
+
+
+def test_untouched_sections_pass_through_to_dict():
+    data = _state_dict()
+    state = ProjectState.from_dict(data)
+
+    assert isinstance(state.validation_records, LazyMapping)
+    out = state.to_dict()
+    assert out["artifact_index"] is data["artifact_index"]
+    assert out["validation_records"] is data["validation_records"]
+
+
+def test_validation_rows_are_normalized_on_first_access():
+    state = ProjectState.from_dict(_state_dict())
+
+    assert set(state.validation_records) == {"a1"}
+    assert len(state.validation_records) == 1
+    rows = state.validation_records["a1"]
+    assert [(row["validator_id"], row["decision"]) for row in rows] == [("v1", "approve")]
+    assert rows is state.validation_records["a1"]
+
+
+def test_changes_are_overlaid_without_touching_the_raw_dict():
+    data = _state_dict()
+    snapshot = json.loads(json.dumps(data))
+    state = ProjectState.from_dict(data)
+
+    state.add_validation_record(
+        artifact_id="a2", validator_id="v2", validator_role="peer", decision="hold", validated_by_human=True
+    )
+    state.artifact_index["a3"] = {"meta": {"artifact_id": "a3", "phase": "1"}, "payload": {}}
+    del state.artifact_index["a1"]
+
+    assert data == snapshot
+    out = state.to_dict()
+    assert sorted(out["artifact_index"]) == ["a2", "a3"]
+    assert out["validation_records"]["a2"][0]["validator_id"] == "v2"
+    assert ProjectState.from_dict(json.loads(json.dumps(out))).to_dict()["artifact_index"].keys() == {"a2", "a3"}
+
+
+def test_lazy_mapping_length_tracks_rejected_and_revived_entries():
+    mapping = LazyMapping({"a": [1], "b": "skip"}, accept=lambda value: isinstance(value, list))
+    assert len(mapping) == 1 and "b" not in mapping
+
+    mapping["b"] = [2]
+    del mapping["a"]
+    assert list(mapping) == ["b"] and len(mapping) == 1
+    assert section_dict(mapping) == {"b": [2]}
+
+
+def test_get_returns_default_for_hidden_and_deleted_entries():
+    mapping = LazyMapping({"a": [1], "b": "skip", "c": [2]}, accept=lambda value: isinstance(value, list))
+    del mapping["c"]
+
+    assert mapping.get("a") == [1]
+    assert mapping.get("b") is None
+    assert mapping.get("c", "gone") == "gone"
+    assert mapping.get(1) is None
@@ -0,0 +1,93 @@
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from specula_agent.incremental import JsonPatchError, apply_json_patch, revalidate_artifact
+from specula_agent.schemas import validate_artifact
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples" / "basic-case"
+
+
+def _example(name):
+    with (EXAMPLES / name).open(encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+PATCHES = [
+    [{"op": "replace", "path": "/payload/prototypes/0/description", "value": ""}],
+    [{"op": "remove", "path": "/payload/prototypes/0/stakeholder_impact/winners"}],
+    [{"op": "add", "path": "/payload/prototypes/0/unexpected", "value": 1}],
+    [{"op": "add", "path": "/payload/prototypes/-", "value": {"prototype_id": 3}}],
+    [{"op": "add", "path": "/payload/prototypes/0", "value": {"prototype_id": ""}}],
+    [{"op": "replace", "path": "/payload/prototypes/0/ethical_gate/status", "value": "MAYBE"}],
+    [{"op": "replace", "path": "/meta/phase", "value": "4"}],
+    [{"op": "replace", "path": "/meta/generated_at", "value": "yesterday"}],
+    [
+        {"op": "copy", "from": "/payload/prototypes/0", "path": "/payload/prototypes/-"},
+        {"op": "replace", "path": "/payload/prototypes/1/scenario_id", "value": ""},
+        {"op": "move", "from": "/payload/prototypes/1/description", "path": "/payload/prototypes/1/notes"},
+    ],
+]
+
+
+@pytest.mark.parametrize("patch", PATCHES)
+def test_incremental_result_matches_full_validation(patch):
+    original = _example("phase-3-prototypes.json")
+    snapshot = copy.deepcopy(original)
+
+    # Start from an artifact that already has errors outside the patched area.
+    broken, broken_errors = revalidate_artifact(
+        original,
+        validate_artifact(original, current_phase="2"),
+        [{"op": "replace", "path": "/meta/evidence_refs", "value": []}],
+        current_phase="2",
+    )
+    assert broken_errors == validate_artifact(broken, current_phase="2")
+
+    patched, errors = revalidate_artifact(broken, broken_errors, patch, current_phase="2")
+
+    assert errors == validate_artifact(patched, current_phase="2")
+    assert original == snapshot
+
+
+def test_apply_json_patch_shares_untouched_subtrees():
+    original = _example("phase-3-prototypes.json")
+    patched, regions = apply_json_patch(
+        original, [{"op": "replace", "path": "/payload/prototypes/0/description", "value": "x"}]
+    )
+    assert patched["meta"] is original["meta"]
+    assert patched["payload"] is not original["payload"]
+    assert regions == [(("payload", "prototypes", 0, "description"), True)]
+
+
+def test_apply_json_patch_rejects_failed_test_operation():
+    with pytest.raises(JsonPatchError, match="test failed"):
+        apply_json_patch({"a": 1}, [{"op": "test", "path": "/a", "value": 2}])
+
+
+def test_payload_patch_does_not_run_full_validation(monkeypatch):
+    import specula_agent.incremental as incremental
+
+    original = _example("phase-3-prototypes.json")
+    previous_errors = validate_artifact(original, current_phase="3")
+    calls = []
+    monkeypatch.setattr(incremental, "validate_artifact", lambda *args, **kwargs: calls.append(args) or [])
+
+    patched, errors = revalidate_artifact(
+        original,
+        previous_errors,
+        [{"op": "replace", "path": "/payload/prototypes/0/description", "value": ""}],
+        current_phase="3",
+    )
+    assert calls == []
+    monkeypatch.undo()
+    assert errors == validate_artifact(patched, current_phase="3")
+
+    for path in ("", "/meta", "/meta/mode"):
+        value = copy.deepcopy(original if path == "" else original["meta"] if path == "/meta" else "shaping")
+        monkeypatch.setattr(incremental, "validate_artifact", lambda *args, **kwargs: calls.append(args) or [])
+        revalidate_artifact(original, previous_errors, [{"op": "replace", "path": path, "value": value}])
+        monkeypatch.undo()
+    assert len(calls) == 3
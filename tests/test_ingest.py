@@ -0,0 +1,87 @@
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from specula_agent.cli import main
+from specula_agent.ingest import IngestError, run_import
+from specula_agent.orchestrator import ProjectState, SpeculaOrchestrator
+from specula_agent.storage import build_storage
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples" / "basic-case"
+
+
+def _write_state(path, project_id):
+    state = ProjectState(project_id=project_id, current_phase="0")
+    result = SpeculaOrchestrator(state).generate_step(user_input="activate")
+    artifact_id = result["artifact"]["meta"]["artifact_id"]
+    state.add_validation_record(
+        artifact_id=artifact_id,
+        validator_id="validator-1",
+        validator_role="strategy_lead",
+        decision="approve",
+        validated_by_human=True,
+    )
+    path.write_text(json.dumps(state.to_dict()), encoding="utf-8")
+    return state
+
+
+def _count(database, table):
+    with sqlite3.connect(database) as conn:
+        return conn.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+
+
+def test_import_loads_states_and_ndjson_dumps(tmp_path):
+    sources = tmp_path / "sources"
+    sources.mkdir()
+    for index in range(3):
+        _write_state(sources / f"state-{index}.specula_state.json", f"project-{index}")
+    artifacts = [json.loads(path.read_text(encoding="utf-8")) for path in sorted(EXAMPLES.glob("*.json"))]
+    with (sources / "dump.ndjson").open("w", encoding="utf-8") as handle:
+        for artifact in artifacts:
+            handle.write(json.dumps({"project_id": "project-archive", "artifact": artifact}) + "\n")
+
+    database = tmp_path / "specula.db"
+    storage = build_storage(f"sqlite:///{database}")
+    storage.migrate()
+    reports = []
+    stats = run_import(storage, [str(sources)], workers=2, batch_size=2, progress=reports.append)
+
+    assert stats.files == 4
+    assert stats.records == 3 + len(artifacts)
+    assert reports
+    assert _count(database, "projects") == 4
+    assert _count(database, "artifacts") == 3 + len(artifacts)
+    assert _count(database, "validations") == 3
+    assert _count(database, "refusal_register") == sum(
+        len(artifact["payload"].get("refusals", [])) for artifact in artifacts
+    )
+
+    again = run_import(storage, [str(sources)], on_conflict="skip")
+    assert again.rows_written == 0
+    with pytest.raises(sqlite3.IntegrityError):
+        run_import(storage, [str(sources / "state-0.specula_state.json")], on_conflict="error")
+    storage.close()
+
+
+def test_import_update_policy_overwrites_existing_rows(tmp_path):
+    source = tmp_path / "state.json"
+    state = _write_state(source, "project-update")
+    database = tmp_path / "specula.db"
+    assert main(["import", str(source), "--database-url", f"sqlite:///{database}", "--quiet"]) == 0
+
+    state.current_phase = "1"
+    source.write_text(json.dumps(state.to_dict()), encoding="utf-8")
+    with build_storage(f"sqlite:///{database}") as storage:
+        run_import(storage, [str(source)], on_conflict="update")
+    with sqlite3.connect(database) as conn:
+        assert conn.execute("SELECT current_phase FROM projects").fetchone() == ("1",)
+
+
+def test_import_requires_project_for_bare_artifacts(tmp_path):
+    dump = tmp_path / "bare.ndjson"
+    dump.write_text(json.dumps(json.loads(next(EXAMPLES.glob("*.json")).read_text(encoding="utf-8"))) + "\n")
+    with pytest.raises(IngestError, match="--project-id"):
+        run_import(build_storage(None), [str(dump)])
+    assert run_import(build_storage(None), [str(dump)], project_id="project-x").records == 1
@@ -0,0 +1,46 @@
+import pytest
+
+from specula_agent.metrics import Histogram, InMemoryMetrics, measure, note_rows
+from specula_agent.orchestrator import ProjectState
+from specula_agent.storage import build_storage
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    histogram = Histogram(bounds=(0.01, 0.1, 1.0))
+    for value in (0.005, 0.006, 0.05, 2.0):
+        histogram.add(value)
+    assert histogram.quantile(0.5) == 0.01
+    assert histogram.quantile(0.75) == 0.1
+    assert histogram.quantile(1.0) == 2.0
+
+
+def test_measure_folds_nested_calls_and_records_errors():
+    metrics = InMemoryMetrics()
+    with measure(metrics, "outer"):
+        with measure(metrics, "inner"):
+            note_rows(3)
+    with pytest.raises(KeyError):
+        with measure(metrics, "outer"):
+            raise KeyError("boom")
+    snapshot = metrics.snapshot()
+    assert list(snapshot) == ["outer"]
+    assert snapshot["outer"]["calls"] == 2
+    assert snapshot["outer"]["rows"] == 3
+    assert snapshot["outer"]["error_types"] == {"KeyError": 1}
+
+
+def test_sqlite_storage_reports_each_call(tmp_path):
+    metrics = InMemoryMetrics()
+    with build_storage(f"sqlite:///{tmp_path / 'specula.db'}", metrics=metrics) as storage:
+        storage.migrate()
+        state = ProjectState(project_id="project-test", current_phase="0")
+        with storage.unit_of_work():
+            storage.upsert_project_state(state)
+            storage.append_audit(project_id=state.project_id, phase="0", mode=None, event="TEST_EVENT", content="ok")
+        storage.get_validations("missing")
+    snapshot = metrics.snapshot()
+    assert set(snapshot) == {"append_audit", "get_validations", "migrate", "unit_of_work", "upsert_project_state"}
+    assert snapshot["append_audit"]["rows"] == 1
+    assert snapshot["unit_of_work"]["connections"] == 1
+    assert snapshot["upsert_project_state"]["connections"] == 0
+    assert "unit_of_work" in metrics.format_summary(wall_seconds=1.0)
@@ -0,0 +1,43 @@
+from datetime import date
+
+from specula_agent.migrations import (
+    LATEST_VERSION,
+    MIGRATIONS,
+    audit_partition_name,
+    default_sql_path,
+    month_start,
+    pending_migrations,
+    render_sql,
+)
+from specula_agent.storage import SCHEMA_SQL, build_storage
+
+
+def test_exported_sql_matches_migrations():
+    # Regenerate with `specula-agent export-sql --output sql/specula_persistence.sql`.
+    assert default_sql_path().read_text(encoding="utf-8") == render_sql()
+
+
+def test_migrations_are_ordered_and_pending_ones_are_selected():
+    assert [migration.version for migration in MIGRATIONS] == list(range(1, LATEST_VERSION + 1))
+    assert [migration.version for migration in pending_migrations(0)] == list(range(1, LATEST_VERSION + 1))
+    assert pending_migrations(LATEST_VERSION) == []
+
+
+def test_schema_sql_is_the_idempotent_initial_schema():
+    assert SCHEMA_SQL == MIGRATIONS[0].sql
+    statements = [statement.strip() for statement in SCHEMA_SQL.split(";") if statement.strip()]
+    assert all(" IF NOT EXISTS " in statement for statement in statements)
+    assert build_storage(None).migrate() == []
+
+
+def test_exported_sql_skips_migrations_already_recorded():
+    rendered = render_sql()
+    for migration in MIGRATIONS:
+        assert f"WHERE version = {migration.version}" in rendered
+    assert "specula_ensure_audit_partition" in rendered
+
+
+def test_audit_partition_names_follow_calendar_months():
+    assert month_start(date(2026, 1, 31), -1) == date(2025, 12, 1)
+    assert month_start(date(2026, 12, 15), 1) == date(2027, 1, 1)
+    assert audit_partition_name(date(2026, 3, 1)) == "audit_logs_p202603"
@@ -1,8 +1,10 @@
 import pytest
 
+from specula_agent import orchestrator as orchestrator_module
 from specula_agent.constants import NEXT_PHASE, PHASE_SEQUENCE
 from specula_agent.llm import LLMProviderError
 from specula_agent.orchestrator import ProjectState, SpeculaOrchestrator
+from specula_agent.schemas import SchemaValidationError
 
 
 def _seed_prerequisites(state: ProjectState, phase: str) -> None:
@@ -205,3 +207,141 @@ def test_orchestrator_falls_back_when_llm_fails():
     orchestrator = SpeculaOrchestrator(state, llm_client=_FailingLLM())
     result = orchestrator.generate_step(user_input="generate scenarios")
     assert result["assistant_text"].startswith("MODE: exploration | PHASE: 1")
+
+
+def _count_full_validations(monkeypatch):
+    calls = []
+    original = orchestrator_module.assert_artifact_valid
+
+    def _spy(artifact, current_phase=None):
+        calls.append(artifact["meta"]["artifact_id"])
+        return original(artifact, current_phase=current_phase)
+
+    monkeypatch.setattr(orchestrator_module, "assert_artifact_valid", _spy)
+    monkeypatch.setattr(orchestrator_module, "_VERIFIED_TEMPLATES", set())
+    return calls
+
+
+def test_trusted_templates_run_full_validation_once_per_template(monkeypatch):
+    calls = _count_full_validations(monkeypatch)
+    state = ProjectState(project_id="project-test", current_phase="1")
+    _seed_prerequisites(state, "1")
+    orchestrator = SpeculaOrchestrator(state, trusted_templates=True)
+
+    for _ in range(3):
+        orchestrator.generate_step(user_input="generate scenarios")
+
+    assert len(calls) == 1
+
+
+def test_trusted_templates_sample_full_validation(monkeypatch):
+    calls = _count_full_validations(monkeypatch)
+    state = ProjectState(project_id="project-test", current_phase="1")
+    _seed_prerequisites(state, "1")
+    orchestrator = SpeculaOrchestrator(state, trusted_templates=True, full_validation_rate=1.0)
+
+    for _ in range(3):
+        orchestrator.generate_step(user_input="generate scenarios")
+
+    assert len(calls) == 3
+
+
+def test_trusted_templates_still_check_dynamic_fields(monkeypatch):
+    _count_full_validations(monkeypatch)
+    state = ProjectState(project_id="project-test", current_phase="1")
+    _seed_prerequisites(state, "1")
+    orchestrator = SpeculaOrchestrator(state, trusted_templates=True)
+    orchestrator.generate_step(user_input="generate scenarios")
+
+    monkeypatch.setattr(orchestrator_module, "_now_iso", lambda: 20260101)
+    with pytest.raises(SchemaValidationError, match="meta.generated_at"):
+        orchestrator.generate_step(user_input="generate scenarios")
+
+
+def test_trusted_templates_do_not_stat_the_schema_per_step(monkeypatch):
+    _count_full_validations(monkeypatch)
+    state = ProjectState(project_id="project-test", current_phase="1")
+    _seed_prerequisites(state, "1")
+    orchestrator = SpeculaOrchestrator(state, trusted_templates=True)
+    orchestrator.generate_step(user_input="generate scenarios")
+
+    def _stat(phase, mode):
+        raise AssertionError("schema file checked on a trusted step")
+
+    monkeypatch.setattr(orchestrator_module, "schema_fingerprint", _stat)
+    orchestrator.generate_step(user_input="generate scenarios")
+
+
+@pytest.mark.parametrize(
+    ("kind", "valid", "invalid"),
+    [
+        (orchestrator_module.SLOT_ID, "scenario-0b7f4f6e-3c1a-4d2e-9f10-2a3b4c5d6e7f", "scenario-1"),
+        (orchestrator_module.SLOT_TIMESTAMP, "2026-01-01T00:00:00Z", "2026-13-01T00:00:00Z"),
+        (orchestrator_module.SLOT_ID_LIST, ["artifact-1"], ["artifact-1", ""]),
+    ],
+)
+def test_trusted_slot_checks(kind, valid, invalid):
+    assert orchestrator_module._slot_error(kind, valid) is None
+    assert orchestrator_module._slot_error(kind, invalid) is not None
+    slots = ((("meta", "absent"), kind),)
+    assert orchestrator_module._slot_errors({"meta": {}}, slots) == ["meta.absent: is missing"]
+
+
+def test_full_validation_rate_must_be_a_fraction():
+    with pytest.raises(ValueError, match="full_validation_rate"):
+        SpeculaOrchestrator(ProjectState(project_id="project-test"), full_validation_rate=1.5)
+
+
+def test_payload_templates_fill_fresh_slots_and_return_private_copies():
+    first = orchestrator_module.build_payload_template("3", "refusal_register")
+    second = orchestrator_module.build_payload_template("3", "refusal_register")
+
+    assert first["refusals"][0]["refusal_id"].startswith("refusal-")
+    assert first["refusals"][0]["refusal_id"] != second["refusals"][0]["refusal_id"]
+
+    first["refusals"][0]["ethical_gate_assessment"]["reviewer_decision_refs"].clear()
+    third = orchestrator_module.build_payload_template("3", "refusal_register")
+    assert second["refusals"][0]["ethical_gate_assessment"]["reviewer_decision_refs"]
+    assert third["refusals"][0]["ethical_gate_assessment"]["reviewer_decision_refs"]
+
+
+def test_payload_template_slot_paths_cover_generated_ids():
+    paths = orchestrator_module.template_slot_paths("3", "refusal_register")
+    assert ("refusals", 0, "refusal_id") in paths
+    assert ("refusals", 0, "date") in paths
+    assert orchestrator_module.template_slot_paths("0", "exploration") == ()
+
+    with pytest.raises(ValueError, match="unsupported phase"):
+        orchestrator_module.build_payload_template("9", "exploration")
+
+
+def _differing_leaves(first, second, path=()):
+    if isinstance(first, dict):
+        return [leaf for key in first for leaf in _differing_leaves(first[key], second[key], path + (key,))]
+    if isinstance(first, list):
+        return [leaf for index, item in enumerate(first) for leaf in _differing_leaves(item, second[index], path + (index,))]
+    return [path] if first != second else []
+
+
+@pytest.mark.parametrize("phase", PHASE_SEQUENCE)
+@pytest.mark.parametrize("mode", ["prototyping", "refusal_register"])
+def test_payload_template_slot_paths_match_the_generated_values(monkeypatch, phase, mode):
+    first = orchestrator_module.build_payload_template(phase, mode)
+    # Distinct timestamps too, so `date` slots show up as differences.
+    monkeypatch.setattr(orchestrator_module, "_now_iso", lambda: "2030-01-01T00:00:00Z")
+    second = orchestrator_module.build_payload_template(phase, mode)
+    assert sorted(_differing_leaves(first, second), key=repr) == sorted(
+        orchestrator_module.template_slot_paths(phase, mode), key=repr
+    )
+
+
+def test_trusted_templates_check_payload_slots(monkeypatch):
+    _count_full_validations(monkeypatch)
+    state = ProjectState(project_id="project-test", current_phase="3")
+    _seed_prerequisites(state, "3")
+    orchestrator = SpeculaOrchestrator(state, trusted_templates=True)
+    orchestrator.generate_step(user_input="log a refusal", mode="refusal_register")
+
+    monkeypatch.setattr(orchestrator_module, "_now_iso", lambda: 20260101)
+    with pytest.raises(SchemaValidationError, match="payload.refusals.0.date"):
+        orchestrator.generate_step(user_input="log a refusal", mode="refusal_register")
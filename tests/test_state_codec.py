@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from specula_agent.cli import main
+from specula_agent.ingest import iter_source_records
+from specula_agent.orchestrator import ProjectState
+from specula_agent.state_codec import (
+    BINARY,
+    BINARY_ZLIB,
+    JSON,
+    MAGIC,
+    StateCodec,
+    StateCodecError,
+    codec_for_path,
+    decode_state,
+    detect_codec,
+)
+from specula_agent.state_store import JsonStateStore, StateStoreError
+
+
+def _state_dict():
+    rows = [
+        {"validator_id": f"v{n}", "validator_role": "lead", "decision": "approve", "validated_by_human": True}
+        for n in range(20)
+    ]
+    return {
+        "project_id": "project-test",
+        "current_phase": "1",
+        "artifact_index": {
+            "a1": {"meta": {"artifact_id": "a1", "phase": "0"}, "payload": {"score": -3, "ratio": 0.25, "gap": None}},
+            "a2": {"meta": {"artifact_id": "a2", "phase": "1"}, "payload": {"note": "é" * 40, "big": 2**70}},
+        },
+        "validation_records": {"a1": rows},
+        "journal_seq": 7,
+    }
+
+
+@pytest.mark.parametrize("codec", [JSON, BINARY, BINARY_ZLIB])
+def test_codecs_round_trip_and_are_detected(codec):
+    encoded = codec.encode(_state_dict())
+    assert detect_codec(encoded) is codec
+    assert decode_state(encoded) == _state_dict()
+
+
+def test_binary_codec_interns_repeated_keys():
+    compact_json = json.dumps(_state_dict(), separators=(",", ":")).encode("utf-8")
+    assert len(BINARY.encode(_state_dict())) < len(compact_json) / 2
+    assert codec_for_path("state.spst") is BINARY and codec_for_path("state.spstz") is BINARY_ZLIB
+    assert codec_for_path("state.json") is JSON
+
+
+def test_binary_codec_rejects_truncated_data():
+    encoded = BINARY.encode(_state_dict())
+    with pytest.raises(StateCodecError):
+        BINARY.decode(encoded[:-5])
+    with pytest.raises(StateCodecError):
+        BINARY.decode(MAGIC + b"\x09\x00")
+
+
+def test_state_codec_requires_encode_and_decode():
+    class EncodeOnly(StateCodec):
+        def encode(self, data):
+            return b""
+
+    with pytest.raises(TypeError):
+        EncodeOnly()
+
+
+def test_json_state_is_migrated_on_next_save(tmp_path):
+    path = tmp_path / "state.json"
+    state = ProjectState(project_id="project-test")
+    state.record_artifact("0", {"meta": {"artifact_id": "a1", "phase": "0"}, "payload": {}})
+    JsonStateStore(path).save(state)
+    assert path.read_bytes().startswith(b"{")
+
+    store = JsonStateStore(path, codec=BINARY_ZLIB)
+    loaded = store.load()
+    store.save(loaded)
+    assert detect_codec(path.read_bytes()) is BINARY_ZLIB
+    assert list(JsonStateStore(path).load().artifact_index) == ["a1"]
+
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(StateStoreError):
+        JsonStateStore(path).load()
+
+
+def test_cli_writes_binary_state_and_import_reads_it(tmp_path):
+    state_file = tmp_path / "state.spst"
+    assert main(["step", "--state-file", str(state_file), "--user-input", "activate"]) == 0
+    assert state_file.read_bytes().startswith(MAGIC)
+    (record,) = iter_source_records(state_file)
+    assert len(record["artifact_index"]) == 1
+
+    json_file = tmp_path / "state.json"
+    assert main(["convert-state", str(state_file), str(json_file)]) == 0
+    assert json.loads(json_file.read_text(encoding="utf-8"))["artifact_index"] == record["artifact_index"]
+    assert main(["step", "--state-file", str(json_file), "--state-format", "binary", "--user-input", "again"]) == 0
+    assert detect_codec(json_file.read_bytes()) is BINARY
@@ -0,0 +1,164 @@
+import json
+
+import pytest
+
+from specula_agent.cli import main
+from specula_agent.orchestrator import ProjectState
+from specula_agent.state_store import (
+    JsonStateStore,
+    LazyArtifactIndex,
+    SegmentedStateStore,
+    StateStore,
+    open_state_store,
+)
+
+
+def _artifact(artifact_id, phase="0"):
+    return {
+        "meta": {"artifact_id": artifact_id, "phase": phase, "mode": "sensemaking"},
+        "payload": {"note": artifact_id},
+    }
+
+
+def test_segmented_store_appends_only_changed_artifacts(tmp_path):
+    store = SegmentedStateStore(tmp_path / "state")
+    state = ProjectState(project_id="project-test", current_phase="0")
+    state.artifact_index["a1"] = _artifact("a1")
+    state.latest_artifacts["0"] = "a1"
+    store.save(state)
+
+    loaded = store.load()
+    assert isinstance(loaded.artifact_index, LazyArtifactIndex)
+    assert loaded.latest_artifacts == {"0": "a1"}
+    assert "a1" in loaded.artifact_index and len(loaded.artifact_index) == 1
+    log_size = store.log_path.stat().st_size
+
+    loaded.artifact_index["a2"] = _artifact("a2")
+    store.save(loaded)
+    assert store.log_path.stat().st_size == log_size + len(json.dumps(_artifact("a2"), separators=(",", ":"))) + 1
+    store.save(loaded)
+    assert store.log_path.stat().st_size > log_size
+
+    reloaded = store.load()
+    reloaded.artifact_index["a1"]["payload"]["note"] = "edited"
+    del reloaded.artifact_index["a2"]
+    store.save(reloaded)
+    final = store.load()
+    assert list(final.artifact_index) == ["a1"]
+    assert final.artifact_index["a1"]["payload"]["note"] == "edited"
+    assert final.to_dict()["artifact_index"] == {"a1": final.artifact_index["a1"]}
+
+
+def test_segmented_store_ignores_bytes_from_an_interrupted_save(tmp_path):
+    store = SegmentedStateStore(tmp_path / "state")
+    state = ProjectState(project_id="project-test")
+    state.artifact_index["a1"] = _artifact("a1")
+    store.save(state)
+    with store.log_path.open("ab") as log:
+        log.write(b'{"torn":')
+    with store.index_path.open("ab") as index:
+        index.write(b"a9\t999\t5\n")
+
+    loaded = store.load()
+    assert list(loaded.artifact_index) == ["a1"]
+    loaded.artifact_index["a2"] = _artifact("a2")
+    store.save(loaded)
+    assert store.load().artifact_index["a2"] == _artifact("a2")
+
+
+def test_segmented_store_rewrites_edited_artifacts_of_a_foreign_state(tmp_path):
+    store = SegmentedStateStore(tmp_path / "state")
+    state = ProjectState(project_id="project-test")
+    state.artifact_index["a1"] = _artifact("a1")
+    state.artifact_index["a2"] = _artifact("a2")
+    store.save(state)
+    log_size = store.log_path.stat().st_size
+
+    # A state loaded from JSON is not backed by the log: unchanged artifacts are skipped, edits are kept.
+    foreign = ProjectState.from_dict(json.loads(json.dumps(state.to_dict())))
+    foreign.artifact_index["a1"]["payload"]["note"] = "edited"
+    store.save(foreign)
+
+    edited = json.dumps(foreign.artifact_index["a1"], separators=(",", ":"))
+    assert store.log_path.stat().st_size == log_size + len(edited) + 1
+    assert store.load().artifact_index["a1"]["payload"]["note"] == "edited"
+
+
+def test_state_store_requires_the_storage_methods():
+    class Partial(StateStore):
+        def exists(self):
+            return False
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_cli_step_and_convert_use_segmented_layout(tmp_path):
+    state_dir = tmp_path / "state"
+    assert isinstance(open_state_store(state_dir), SegmentedStateStore)
+    assert isinstance(open_state_store(tmp_path / "state.json"), JsonStateStore)
+    assert main(["step", "--state-file", str(state_dir), "--user-input", "activate"]) == 0
+    assert main(["step", "--state-file", str(state_dir), "--user-input", "again"]) == 0
+    state = SegmentedStateStore(state_dir).load()
+    assert len(state.artifact_index) == 2
+
+    json_file = tmp_path / "converted.json"
+    assert main(["convert-state", str(state_dir), str(json_file)]) == 0
+    converted = json.loads(json_file.read_text(encoding="utf-8"))
+    assert sorted(converted["artifact_index"]) == sorted(state.artifact_index)
+
+
+def test_json_store_journals_changes_and_replays_them(tmp_path):
+    path = tmp_path / "state.json"
+    store = JsonStateStore(path)
+    state = store.load_or_create()
+    state.record_artifact("0", _artifact("a1"))
+    store.save(state)
+    snapshot = path.read_text(encoding="utf-8")
+
+    store = JsonStateStore(path)
+    state = store.load()
+    state.add_validation_record(
+        artifact_id="a1", validator_id="v1", validator_role="lead", decision="approve", validated_by_human=True
+    )
+    state.mark_phase_validated("0", "a1", "1")
+    store.save(state)
+    assert path.read_text(encoding="utf-8") == snapshot
+    assert len(store.journal_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    # A torn record from a crash mid-append is dropped, earlier ones survive.
+    with store.journal_path.open("ab") as journal:
+        journal.write(b'{"seq":3,"change":{"op"')
+    replayed = JsonStateStore(path).load()
+    assert replayed.current_phase == "1"
+    assert [row["validator_id"] for row in replayed.validation_records["a1"]] == ["v1"]
+    assert store.journal_path.read_bytes().endswith(b"\n")
+
+
+def test_json_store_compaction_skips_journal_records_in_the_snapshot(tmp_path):
+    path = tmp_path / "state.json"
+    store = JsonStateStore(path)
+    state = store.load_or_create()
+    store.save(state)
+    state = store.load()
+    state.record_artifact("0", _artifact("a1"))
+    state.mark_phase_validated("0", "a1", "1")
+    store.save(state)
+    journal = store.journal_path.read_bytes()
+    assert len(journal.splitlines()) == 2
+
+    store.compact(state)
+    assert store.journal_path.read_bytes() == b""
+    assert json.loads(path.read_text(encoding="utf-8"))["journal_seq"] == 2
+
+    # A crash between the snapshot rename and the journal truncation leaves stale records behind.
+    store.journal_path.write_bytes(journal)
+    reloaded_store = JsonStateStore(path)
+    reloaded = reloaded_store.load()
+    assert reloaded.current_phase == "1"
+    reloaded.add_validation_record(
+        artifact_id="a1", validator_id="v1", validator_role="lead", decision="approve", validated_by_human=True
+    )
+    reloaded_store.save(reloaded)
+    assert json.loads(store.journal_path.read_text(encoding="utf-8").splitlines()[-1])["seq"] == 3
+    assert JsonStateStore(path).load().validation_records["a1"][0]["validator_id"] == "v1"
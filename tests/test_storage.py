@@ -1,5 +1,12 @@
+import gzip
+import json
+from datetime import date
+
+import pytest
+
 from specula_agent.orchestrator import ProjectState
-from specula_agent.storage import build_storage
+from specula_agent.migrations import SQLITE_LATEST_VERSION
+from specula_agent.storage import PoolSettings, SQLiteStorage, StorageError, build_storage
 
 
 def test_noop_storage_adapter_methods_are_safe():
@@ -49,3 +56,194 @@ def test_noop_storage_adapter_methods_are_safe():
         event="TEST_EVENT",
         content="ok",
     )
+    storage.append_audit_many(
+        [
+            {
+                "project_id": state.project_id,
+                "phase": "0",
+                "mode": "sensemaking",
+                "event": "TEST_EVENT",
+                "content": "ok",
+            }
+        ]
+    )
+
+
+def test_pool_settings_reject_inconsistent_sizes():
+    with pytest.raises(StorageError, match="pool sizes"):
+        PoolSettings(min_size=5, max_size=2)
+    with pytest.raises(StorageError, match="pool sizes"):
+        PoolSettings(max_size=0)
+
+
+def test_noop_storage_adapter_closes_as_context_manager():
+    with build_storage(None, pool=PoolSettings()) as storage:
+        storage.init_schema()
+    storage.close()
+
+
+def test_noop_storage_unit_of_work_yields_adapter():
+    storage = build_storage(None)
+    with storage.unit_of_work() as unit:
+        with unit.unit_of_work() as nested:
+            assert nested is storage
+
+
+def _sample_artifact(artifact_id="artifact-1"):
+    return {
+        "meta": {
+            "artifact_id": artifact_id,
+            "phase": "0",
+            "mode": "sensemaking",
+            "generated_at": "2026-02-18T00:00:00Z",
+            "validated_by_human": False,
+            "related_artifacts": [],
+        },
+        "payload": {"activation_status": "active", "current_phase": 0},
+    }
+
+
+def test_sqlite_storage_round_trips_writes(tmp_path):
+    database = tmp_path / "specula.db"
+    storage = build_storage(f"sqlite:///{database}")
+    assert isinstance(storage, SQLiteStorage)
+    assert storage.migrate() == list(range(1, SQLITE_LATEST_VERSION + 1))
+    assert storage.migrate() == []
+
+    state = ProjectState(project_id="project-test", current_phase="0")
+    with storage.unit_of_work():
+        storage.upsert_project_state(state)
+        storage.insert_artifact(state.project_id, _sample_artifact())
+        storage.append_audit(project_id=state.project_id, phase="0", mode=None, event="TEST_EVENT", content="ok")
+    storage.insert_validation(
+        "artifact-1",
+        validated_by_human=True,
+        validator_id="validator",
+        validator_role="strategy_lead",
+        decision="approve",
+    )
+    with pytest.raises(StorageError, match="duplicate validator signature"):
+        storage.insert_validation(
+            "artifact-1",
+            validated_by_human=True,
+            validator_id="validator",
+            validator_role="strategy_lead",
+            decision="approve",
+        )
+    storage.close()
+
+    reopened = build_storage(f"sqlite:///{database}")
+    assert reopened.current_schema_version() == SQLITE_LATEST_VERSION
+    assert reopened._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert [row["validator_id"] for row in reopened.get_validations("artifact-1")] == ["validator"]
+    payload = reopened._conn.execute("SELECT json_extract(payload, '$.activation_status') FROM artifacts").fetchone()
+    assert payload == ("active",)
+    reopened.close()
+
+
+def test_sqlite_unit_of_work_rolls_back_on_error(tmp_path):
+    with build_storage(f"sqlite:///{tmp_path / 'specula.db'}") as storage:
+        storage.init_schema()
+        state = ProjectState(project_id="project-test", current_phase="0")
+        with pytest.raises(RuntimeError):
+            with storage.unit_of_work():
+                storage.upsert_project_state(state)
+                raise RuntimeError("boom")
+        assert storage._conn.execute("SELECT count(*) FROM projects").fetchone() == (0,)
+
+
+def test_sqlite_prune_audit_archives_old_months(tmp_path):
+    with build_storage(f"sqlite:///{tmp_path / 'specula.db'}") as storage:
+        storage.init_schema()
+        storage.upsert_project_state(ProjectState(project_id="project-test", current_phase="0"))
+        events = [
+            {"event_id": f"event-{month}", "project_id": "project-test", "event": "E", "content": month,
+             "created_at": f"2026-{month}-15T10:00:00+00:00"}
+            for month in ("01", "02", "03")
+        ]
+        storage.append_audit_many(events)
+        archives = storage.prune_audit(date(2026, 3, 1), tmp_path / "archive")
+        assert [path.name for path in archives] == [
+            "audit_logs_p202601.ndjson.gz",
+            "audit_logs_p202602.ndjson.gz",
+        ]
+        with gzip.open(archives[0], "rt", encoding="utf-8") as handle:
+            assert [json.loads(line)["event_id"] for line in handle] == ["event-01"]
+        remaining = storage._conn.execute("SELECT event_id FROM audit_logs").fetchall()
+        assert remaining == [("event-03",)]
+
+
+def test_sqlite_query_artifacts_filters_payload_and_pages(tmp_path):
+    with build_storage(f"sqlite:///{tmp_path / 'specula.db'}") as storage:
+        storage.init_schema()
+        storage.upsert_project_state(ProjectState(project_id="project-test", current_phase="6"))
+        for index, level in enumerate(["critical", "drift", "critical", "critical"]):
+            artifact = _sample_artifact(f"guardian-{index}")
+            artifact["meta"]["generated_at"] = f"2026-0{index + 1}-01T00:00:00Z"
+            artifact["payload"] = {"guardian_report": {"divergence_level": level, "recommended_action": "correct"}}
+            storage.insert_artifact("project-test", artifact)
+        refusal = _sample_artifact("refusals-1")
+        refusal["payload"] = {"refusals": [{"violated_value": "Intellectual freedom"}]}
+        storage.insert_artifact("project-test", refusal)
+
+        first = storage.query_artifacts(payload={"divergence_level": "critical"}, limit=2)
+        assert [item["artifact_id"] for item in first.artifacts] == ["guardian-0", "guardian-2"]
+        second = storage.query_artifacts(payload={"divergence_level": "critical"}, limit=2, after=first.next_cursor)
+        assert [item["artifact_id"] for item in second.artifacts] == ["guardian-3"]
+        assert second.next_cursor is None
+
+        refusals = storage.query_artifacts(payload={"violated_value": "Intellectual freedom"})
+        assert [item["artifact_id"] for item in refusals.artifacts] == ["refusals-1"]
+        with pytest.raises(StorageError, match="unknown payload filter"):
+            storage.query_artifacts(payload={"quarter": "2026-Q2"})
+
+
+class _FakeCursor:
+    def __init__(self, log):
+        self.log = log
+        self.rowcount = 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql, params=None):
+        self.log.append(("execute", sql))
+
+
+class _FakeConnection:
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        self.log.append(("rollback" if exc_type else "commit", None))
+        return False
+
+    def cursor(self):
+        return _FakeCursor(self.log)
+
+
+def test_postgres_storage_without_pool_opens_a_connection_per_call(monkeypatch):
+    import sys
+    import types
+
+    from specula_agent.storage import UPSERT_PROJECT_SQL, PostgresStorage
+
+    log = []
+    fake_psycopg = types.SimpleNamespace(connect=lambda url: log.append(("connect", url)) or _FakeConnection(log))
+    monkeypatch.setitem(sys.modules, "psycopg", fake_psycopg)
+
+    storage = PostgresStorage("postgresql://example/db")
+    storage.upsert_project_state(ProjectState(project_id="project-test"))
+    storage.upsert_project_state(ProjectState(project_id="project-test"))
+
+    assert log == [
+        ("connect", "postgresql://example/db"),
+        ("execute", UPSERT_PROJECT_SQL),
+        ("commit", None),
+    ] * 2
@@ -1,8 +1,24 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from specula_agent.cli import main
 from specula_agent.orchestrator import ProjectState, SpeculaOrchestrator
-from specula_agent.policy import validate_assistant_text
-from specula_agent.schemas import validate_artifact
+from specula_agent.policy import PhraseMatcher, validate_assistant_text
+from specula_agent.schemas import (
+    ValidatorRegistry,
+    iter_artifact_paths,
+    validate_artifact,
+    validate_many,
+    validate_ndjson,
+)
 from specula_agent.constants import PHASE_SEQUENCE
 
+SCHEMAS = Path(__file__).resolve().parent.parent / "schemas"
+
 
 def _seed_prerequisites(state: ProjectState, phase: str) -> None:
     index = PHASE_SEQUENCE.index(phase)
@@ -94,3 +110,130 @@ def test_six_line_limit_before_question_is_enforced():
     )
     errors = validate_assistant_text(invalid)
     assert any("more than 6 lines" in error for error in errors)
+
+
+def test_validator_registry_counts_hits_and_misses(tmp_path):
+    shutil.copy(SCHEMAS / "phase0_activation.schema.json", tmp_path)
+    registry = ValidatorRegistry(schema_dir=tmp_path)
+
+    first = registry.get("0", "sensemaking")
+    second = registry.get("0", "sensemaking")
+
+    assert first is second
+    assert registry.stats() == {"hits": 1, "misses": 1, "reloads": 0, "size": 1}
+
+
+def test_validator_registry_reloads_when_schema_mtime_changes(tmp_path):
+    schema_path = tmp_path / "phase0_activation.schema.json"
+    shutil.copy(SCHEMAS / schema_path.name, schema_path)
+    registry = ValidatorRegistry(schema_dir=tmp_path)
+    first = registry.get("0", "sensemaking")
+
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    schema["properties"]["payload"]["required"].append("extra_field")
+    schema_path.write_text(json.dumps(schema), encoding="utf-8")
+    stat = schema_path.stat()
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = registry.get("0", "sensemaking")
+    assert second is not first
+    assert "extra_field" in second.schema["properties"]["payload"]["required"]
+    assert registry.stats()["reloads"] == 1
+
+
+def test_validate_many_reports_each_file_in_order(tmp_path):
+    artifact, assistant_text = _make_artifact("1")
+    (tmp_path / "a-valid.json").write_text(json.dumps(artifact), encoding="utf-8")
+    (tmp_path / "a-valid.txt").write_text(assistant_text, encoding="utf-8")
+    artifact["meta"]["mode"] = "unknown_mode"
+    (tmp_path / "b-invalid.json").write_text(json.dumps(artifact), encoding="utf-8")
+    (tmp_path / "c-broken.json").write_text("{", encoding="utf-8")
+
+    for workers in (1, 2):
+        results = list(validate_many(iter_artifact_paths([tmp_path]), workers=workers))
+        assert [Path(result.path).name for result in results] == ["a-valid.json", "b-invalid.json", "c-broken.json"]
+        assert [result.ok for result in results] == [True, False, False]
+        assert results[0].phase == "1"
+        assert any("canonical mode enum" in error for error in results[1].errors)
+
+
+def test_validate_batch_rejects_non_positive_workers(tmp_path, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["validate-batch", str(tmp_path), "--workers", "0"])
+    assert excinfo.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
+    with pytest.raises(ValueError):
+        list(validate_many([], workers=-1))
+
+
+def test_validate_ndjson_yields_one_result_per_record():
+    artifact, assistant_text = _make_artifact("2")
+    lines = [
+        json.dumps({"artifact": artifact, "assistant_text": assistant_text}),
+        "",
+        json.dumps({"artifact": artifact, "assistant_text": "no header?"}),
+        "not json",
+        json.dumps(artifact),
+    ]
+
+    results = list(validate_ndjson(iter(lines), current_phase="2", require_text=True))
+
+    assert [result["line"] for result in results] == [1, 3, 4, 5]
+    assert [result["valid"] for result in results] == [True, False, False, False]
+    assert results[0]["artifact_id"] == artifact["meta"]["artifact_id"]
+    assert any("first line must match" in error for error in results[1]["errors"])
+    assert results[3]["errors"] == ["assistant_text: missing from record"]
+
+
+def test_validate_stream_closes_input_when_output_cannot_be_opened(tmp_path, monkeypatch):
+    artifact, assistant_text = _make_artifact("2")
+    source = tmp_path / "records.ndjson"
+    source.write_text(json.dumps({"artifact": artifact, "assistant_text": assistant_text}) + "\n", encoding="utf-8")
+    opened = []
+    real_open = Path.open
+
+    def tracking_open(self, *args, **kwargs):
+        handle = real_open(self, *args, **kwargs)
+        opened.append(handle)
+        return handle
+
+    monkeypatch.setattr(Path, "open", tracking_open)
+    assert main(["validate-stream", "--input", str(source), "--output", str(tmp_path / "missing" / "out.ndjson")]) == 1
+    assert len(opened) == 1 and opened[0].closed
+
+    assert main(["validate-stream", "--input", str(source), "--output", str(tmp_path / "out.ndjson")]) == 0
+    assert json.loads((tmp_path / "out.ndjson").read_text(encoding="utf-8"))["valid"] is True
+    assert all(handle.closed for handle in opened)
+
+
+def test_forbidden_phrases_are_case_folded_and_word_bounded():
+    flagged = validate_assistant_text("MODE: sensemaking | PHASE: 0\nWE RECOMMEND to Choose X.\nWhich path?")
+    assert "forbidden prescriptive phrase detected: `we recommend`" in flagged
+    assert "forbidden prescriptive phrase detected: `choose x`" in flagged
+
+    clean = validate_assistant_text("MODE: sensemaking | PHASE: 0\nWhy choose xylophones here?")
+    assert clean == []
+
+
+def test_decision_marker_is_detected_once():
+    errors = validate_assistant_text("MODE: sensemaking | PHASE: 0\nDecision: TRUE and decision=true\nWhy?")
+    assert errors.count("forbidden decision field detected in assistant text") == 1
+
+
+def test_phrase_matcher_finds_overlapping_and_unicode_matches():
+    matcher = PhraseMatcher(["he", "she", "hers", "strasse"])
+    assert matcher.find("ushers") == set()
+    assert matcher.find("she, he") == {0, 1}
+    assert matcher.find("Die STRAßE") == {3}
+
+
+def test_phrase_matcher_first_word_index_matches_direct_scan():
+    phrases = ["he", "she", "hers", "strasse", "decision: true", "decision", "«pick", "pick now"]
+    phrases += [f"filler phrase {index}" for index in range(PhraseMatcher.INDEX_MIN_PHRASES)]
+    matcher = PhraseMatcher(phrases)
+    assert matcher._by_first_word is not None
+    for text in ["ushers", "she, he", "Die STRAßE", "Decision: TRUEish", "a «pick now", "filler phrase 30!", "phrase 3"]:
+        expected = {index for index, phrase in enumerate(phrases) if PhraseMatcher([phrase]).find(text)}
+        assert matcher.find(text) == expected
+    assert matcher.find("Decision: TRUEish") == {5}
+    assert matcher.find("a «pick now") == {6, 7}